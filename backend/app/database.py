@@ -1,25 +1,90 @@
+import uuid
+from datetime import datetime
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.config import settings
+from app.db_pool import engine_options, instrument
+from app.db_types import GUID, TZDateTime
+
+# Name of the shared in-memory database behind sqlite:// URLs
+SQLITE_MEMORY_DB = "football_betting"
+
+
+def database_url(url: str) -> str:
+    """
+    `url` as the engines use it. In-memory SQLite (sqlite://, sqlite:///:memory:)
+    becomes one named shared-cache database, so the sync and async engines
+    see the same tables instead of a private empty database each.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or parsed.database not in (None, "", ":memory:"):
+        return url
+    return parsed.set(
+        database=f"file:{SQLITE_MEMORY_DB}",
+        query={"mode": "memory", "cache": "shared", "uri": "true"},
+    ).render_as_string(hide_password=False)
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+_url = database_url(settings.DATABASE_URL)
+engine = create_engine(_url, **engine_options(_url, "sync"))
+instrument(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read replica for read-only endpoints (app.dependencies.get_read_db); without
+# READ_DATABASE_URL reads share the primary engine and its pool.
+if settings.READ_DATABASE_URL:
+    read_engine = create_engine(
+        settings.READ_DATABASE_URL, **engine_options(settings.READ_DATABASE_URL, "read")
+    )
+    instrument(read_engine)
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+def direct_dsn() -> str:
+    """
+    postgresql:// DSN for asyncpg.connect() on connections that keep session
+    state (LISTEN, advisory locks), which PgBouncer in transaction pooling
+    mode does not: CACHE_BUS_DATABASE_URL when set, else DATABASE_URL.
+    """
+    url = make_url(settings.CACHE_BUS_DATABASE_URL or settings.DATABASE_URL)
+    return url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+# Async drivers for each sync dialect we run on
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """DATABASE_URL rewritten for its async driver (postgresql:// -> postgresql+asyncpg://)."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for '{parsed.get_backend_name()}'")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+# Async engine for the async routes and background workflows. Shares the
+# schema with the sync engine but keeps its own connection pool.
+_async_url = settings.ASYNC_DATABASE_URL or async_database_url(_url)
+async_engine = create_async_engine(_async_url, **engine_options(_async_url, "async", is_async=True))
+instrument(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 class Base(DeclarativeBase):
-    pass
+    # Dialect-portable types for un-typed uuid / datetime columns (app/db_types.py)
+    type_annotation_map = {uuid.UUID: GUID, datetime: TZDateTime}
 
 
 def init_db():
-    """Create all tables. Called on app startup instead of Alembic migrations."""
-    # Import all models so Base.metadata knows about them
-    import app.models.user  # noqa: F401
-    import app.models.football_data  # noqa: F401
-    import app.models.tournament  # noqa: F401
-    import app.models.event  # noqa: F401
-    import app.models.market  # noqa: F401
-    import app.models.bet  # noqa: F401
-    import app.models.activity  # noqa: F401
-
-    Base.metadata.create_all(bind=engine)
+    """Apply pending schema migrations (app/migrations). Called on app startup."""
+    from app.migrations import migrate
+
+    migrate(engine)
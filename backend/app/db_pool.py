@@ -0,0 +1,268 @@
+"""
+Connection-pool configuration and metrics for the sync and async engines.
+
+Both engines get their pool settings from DB_POOL_* / DB_* settings and an
+instrumented QueuePool that times every checkout (queue wait, plus connect
+or ping when one happens) and counts checkout timeouts. Pool events add
+connects, invalidations and failed idle pings. GET /admin/diagnostics/db-pool
+reports these together with the live in-use / idle / overflow counts.
+
+Pre-ping policy (DB_POOL_PRE_PING):
+- always: SQLAlchemy's pool_pre_ping, one round trip on every checkout
+- idle:   ping only connections idle longer than DB_POOL_PRE_PING_IDLE seconds
+- never:  rely on DB_POOL_RECYCLE and the retry of the failing request
+
+PgBouncer mode (DB_PGBOUNCER_MODE) keeps every connection free of session
+state so it can run behind PgBouncer in transaction pooling: asyncpg's
+prepared-statement caches are disabled (and statement names made unique),
+and the statement timeout is applied per transaction with SET LOCAL instead
+of as a connection startup option, which PgBouncer would reject.
+
+SQLite (tests, benchmarks, local runs): file databases keep the QueuePool
+and run in WAL mode so readers do not block the writer; the shared
+in-memory database (app.database.database_url) gets one static connection
+per engine, which keeps it alive. Foreign keys are enforced as on PostgreSQL.
+"""
+
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
+
+from app.config import settings
+
+PRE_PING_POLICIES = ("always", "idle", "never")
+WAIT_WINDOW = 1000  # recent checkout waits kept for percentiles
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+@dataclass
+class PoolMetrics:
+    """Counters for one engine's pool; survives engine.dispose() / pool recreation."""
+    checkouts: int = 0
+    timeouts: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    failed_pings: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    waits: deque = field(default_factory=lambda: deque(maxlen=WAIT_WINDOW))
+
+    def observe_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+        self.waits.append(seconds)
+
+    def reset(self) -> None:
+        self.checkouts = self.timeouts = self.connects = 0
+        self.invalidations = self.failed_pings = 0
+        self.wait_total = self.wait_max = 0.0
+        self.waits.clear()
+
+
+# Keyed by pool logging name ("sync" / "async"), which recreated pools keep
+_metrics: dict[str, PoolMetrics] = {}
+
+
+def metrics_for(name: str) -> PoolMetrics:
+    return _metrics.setdefault(name, PoolMetrics())
+
+
+class _InstrumentedPool:
+    """Mixin timing Pool.connect(): queue wait plus connect/ping when they happen."""
+
+    def connect(self):
+        metrics = metrics_for(self._orig_logging_name)
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            metrics.timeouts += 1
+            raise
+        metrics.observe_wait(time.perf_counter() - start)
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedStaticPool(_InstrumentedPool, StaticPool):
+    pass
+
+
+def _sqlite_memory(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.query.get("mode") == "memory"
+
+
+# ─────────────── Engine options ───────────────
+
+
+def engine_options(url: str, name: str, is_async: bool = False) -> dict:
+    """create_engine() keyword arguments for `url` from the DB_* settings."""
+    if settings.DB_POOL_PRE_PING not in PRE_PING_POLICIES:
+        raise ValueError(
+            f"DB_POOL_PRE_PING must be one of {PRE_PING_POLICIES}, got {settings.DB_POOL_PRE_PING!r}"
+        )
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        # Sessions move between threadpool threads (and aiosqlite's worker thread)
+        options["connect_args"] = {"check_same_thread": False}
+        if _sqlite_memory(parsed) and is_async:
+            # One connection, checked out by one session at a time: concurrent
+            # tasks sharing it would interleave (and commit) each other's work
+            options.update(pool_size=1, max_overflow=0, pool_pre_ping=False)
+        elif _sqlite_memory(parsed):
+            options = {
+                "poolclass": InstrumentedStaticPool,
+                "pool_logging_name": name,
+                "connect_args": options["connect_args"],
+            }
+        return options
+    if parsed.get_backend_name() != "postgresql":
+        return options
+
+    connect_args: dict = {}
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if is_async:
+        if settings.DB_PGBOUNCER_MODE:
+            # PgBouncer may hand each transaction a different server connection,
+            # where a statement prepared on another one does not exist
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+        elif timeout:
+            connect_args["server_settings"] = {"statement_timeout": str(timeout)}
+    elif timeout and not settings.DB_PGBOUNCER_MODE:
+        connect_args["options"] = f"-c statement_timeout={timeout}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def instrument(engine: Engine) -> None:
+    """
+    Attach metrics, the idle pre-ping policy, PgBouncer-mode timeouts and
+    SQLite pragmas to a (sync) engine.
+    """
+    name = engine.pool._orig_logging_name
+    metrics = metrics_for(name)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, record):
+        metrics.connects += 1
+
+    if engine.dialect.name == "sqlite":
+        pragmas = ["PRAGMA foreign_keys = ON"]
+        if _sqlite_memory(engine.url):
+            # Shared-cache readers would otherwise fail on a table another connection is writing
+            pragmas.append("PRAGMA read_uncommitted = 1")
+        else:
+            pragmas.append("PRAGMA journal_mode = WAL")
+
+        @event.listens_for(engine, "connect")
+        def _on_sqlite_connect(dbapi_connection, record):
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, record, exception):
+        metrics.invalidations += 1
+
+    if settings.DB_POOL_PRE_PING == "idle":
+        @event.listens_for(engine, "checkin")
+        def _on_checkin(dbapi_connection, record):
+            record.info["checked_in_at"] = time.monotonic()
+
+        @event.listens_for(engine, "checkout")
+        def _on_checkout(dbapi_connection, record, proxy):
+            checked_in_at = record.info.get("checked_in_at")
+            if checked_in_at is None or time.monotonic() - checked_in_at < settings.DB_POOL_PRE_PING_IDLE:
+                return
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            except Exception as e:
+                metrics.failed_pings += 1
+                # The pool discards this connection and retries with a fresh one
+                raise exc.DisconnectionError() from e
+            finally:
+                cursor.close()
+
+    if (
+        settings.DB_PGBOUNCER_MODE
+        and settings.DB_STATEMENT_TIMEOUT_MS
+        and engine.dialect.name == "postgresql"
+    ):
+        statement = f"SET LOCAL statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}"
+
+        @event.listens_for(engine, "begin")
+        def _on_begin(conn):
+            conn.exec_driver_sql(statement)
+
+
+# ─────────────── Reporting ───────────────
+
+
+def pool_status(pool: QueuePool | StaticPool) -> dict:
+    metrics = metrics_for(pool._orig_logging_name)
+    waits = sorted(metrics.waits)
+    if isinstance(pool, QueuePool):
+        counts = {
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "timeout_s": pool.timeout(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # QueuePool counts overflow from -pool_size; above zero means burst connections are open
+            "overflow": max(pool.overflow(), 0),
+        }
+    else:
+        # In-memory SQLite: one connection, shared by every checkout
+        counts = {"size": 1}
+    return {
+        **counts,
+        "checkouts": metrics.checkouts,
+        "timeouts": metrics.timeouts,
+        "connects": metrics.connects,
+        "invalidations": metrics.invalidations,
+        "failed_pings": metrics.failed_pings,
+        "wait_ms": {
+            "mean": round(metrics.wait_total / metrics.checkouts * 1000, 3) if metrics.checkouts else 0.0,
+            "p50": round(_percentile(waits, 50) * 1000, 3),
+            "p95": round(_percentile(waits, 95) * 1000, 3),
+            "p99": round(_percentile(waits, 99) * 1000, 3),
+            "max": round(metrics.wait_max * 1000, 3),
+        },
+    }
+
+
+def reset() -> None:
+    for metrics in _metrics.values():
+        metrics.reset()
@@ -0,0 +1,46 @@
+"""
+Column types that behave the same on PostgreSQL and SQLite.
+
+GUID:       native UUID on PostgreSQL, CHAR(32) elsewhere. Also accepts the
+            string ids routes receive from path parameters, which psycopg2
+            casts itself but SQLite cannot.
+TZDateTime: TIMESTAMP WITH TIME ZONE on PostgreSQL. SQLite has no time
+            zones, so values are stored as naive UTC and come back aware,
+            and comparisons with datetime.now(timezone.utc) work on both.
+
+Base (app.database) maps uuid.UUID and datetime annotations to these, so
+models only name a type when it needs arguments.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Uuid
+from sqlalchemy.types import TypeDecorator
+
+
+class GUID(TypeDecorator):
+    impl = Uuid
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str):
+            return uuid.UUID(value)
+        return value
+
+
+class TZDateTime(TypeDecorator):
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect):
+        if value is None or dialect.name == "postgresql":
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: datetime | None, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
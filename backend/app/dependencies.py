@@ -1,12 +1,15 @@
-from typing import Generator
+import time
+from typing import AsyncGenerator, Generator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import jwt
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal, ReadSessionLocal
+from app.middleware import PRIMARY_PIN_COOKIE, PRIMARY_PIN_HEADER
 from app.models.user import User
 
 security = HTTPBearer()
@@ -21,11 +24,38 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    """Decode JWT token and return the authenticated user."""
+def _pinned_to_primary(request: Request) -> bool:
+    """True while the caller is inside the read-your-writes window of its last write."""
+    value = request.headers.get(PRIMARY_PIN_HEADER) or request.cookies.get(PRIMARY_PIN_COOKIE)
+    try:
+        until = float(value)
+    except (TypeError, ValueError):
+        return False
+    now = time.time()
+    # A client cannot pin itself for longer than one write's window
+    return now < until <= now + settings.READ_YOUR_WRITES_SECONDS
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Yields a session for read-only endpoints: the read replica when
+    READ_DATABASE_URL is set, the primary while the caller is pinned after a write.
+    """
+    db = SessionLocal() if _pinned_to_primary(request) else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yields an async database session for `async def` routes, auto-closes after request."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _authenticate(credentials: HTTPAuthorizationCredentials, db: Session) -> User:
+    """Decode the JWT and load its active user from `db`."""
     token = credentials.credentials
     try:
         payload = jwt.decode(
@@ -62,6 +92,22 @@ def get_current_user(
     return user
 
 
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> User:
+    """Decode JWT token and return the authenticated user."""
+    return _authenticate(credentials, db)
+
+
+def get_current_user_read(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_read_db),
+) -> User:
+    """get_current_user for read-only endpoints; shares the route's get_read_db session."""
+    return _authenticate(credentials, db)
+
+
 def require_admin(
     current_user: User = Depends(get_current_user),
 ) -> User:
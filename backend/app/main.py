@@ -1,18 +1,57 @@
+from app import startup  # first, so the startup timeline covers every import below
+
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import settings
-from app.database import init_db
+from app.database import init_db, async_engine
+from app.middleware import QueryStatsMiddleware, ReadYourWritesMiddleware, StaleDataMiddleware
 from app.routers import auth, users, admin, tournaments, events, markets, bets, leaderboard, feed
+from app.services.passwords import shutdown_pool
+from app.services import bet_archive, cache_bus, loop_monitor
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Run on startup: create all tables if they don't exist."""
-    init_db()
+    """
+    Run on startup: apply pending migrations (full mode only), warm up pools,
+    mappers and shared clients in parallel, then start background services.
+    """
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    fast = settings.STARTUP_MODE == "fast"
+    if fast:
+        startup.timeline.skip("migrations")
+    else:
+        with startup.timeline.phase("migrations"):
+            init_db()
+    with startup.timeline.phase("warm_up"):
+        await startup.warm_up(fast)
+    poller = None
+    if settings.MATCH_POLLER_ENABLED and settings.FOOTBALL_API_KEY:
+        # football_api (and httpx) load here or on the first admin sync, not at import
+        from app.services import football_api, match_poller as poller
+
+        poller.start(football_api.get_client())
+    if settings.BETS_ARCHIVE_ENABLED:
+        bet_archive.start()
+    if settings.CACHE_ENABLED:
+        cache_bus.start()
+    startup.timeline.ready()
     yield
+    if poller is not None:
+        await poller.stop()
+    await bet_archive.stop()
+    await cache_bus.stop()
+    if "app.services.football_api" in sys.modules:
+        await sys.modules["app.services.football_api"].close_client()
+    await async_engine.dispose()
+    shutdown_pool()
+    await loop_monitor.stop()
 
 
 app = FastAPI(
@@ -20,6 +59,8 @@ app = FastAPI(
     description="Private virtual betting platform for football predictions",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson for every JSON body; list endpoints dump bytes directly (app.responses)
+    default_response_class=ORJSONResponse,
 )
 
 # -- CORS --
@@ -32,7 +73,13 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Data-Stale", "Server-Timing", "X-Read-Primary-Until"],
 )
+app.add_middleware(StaleDataMiddleware)
+if settings.READ_DATABASE_URL:
+    app.add_middleware(ReadYourWritesMiddleware)
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
 
 # -- Routers --
 app.include_router(auth.router)
@@ -46,6 +93,9 @@ app.include_router(leaderboard.router)
 app.include_router(feed.router)
 
 
+startup.timeline.mark("imports")
+
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
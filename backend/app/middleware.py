@@ -0,0 +1,110 @@
+"""
+ASGI middleware shared across routers.
+"""
+
+import math
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.services import query_stats
+from app.services.staleness import track_staleness
+
+
+class StaleDataMiddleware:
+    """
+    Flag responses that include football-data.org payloads served from stale
+    cache (upstream down or slow) with `X-Data-Stale: true` and a
+    `Warning: 110` header, so the admin UI can show that data may be old.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_staleness() as stale_paths:
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start" and stale_paths:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-data-stale", b"true"))
+                    headers.append((b"warning", b'110 - "Response is Stale"'))
+                    message["headers"] = headers
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+
+class QueryStatsMiddleware:
+    """
+    Count and time the SQL each request runs. Adds a `Server-Timing: db;...`
+    header and feeds the per-route aggregate behind
+    GET /admin/diagnostics/queries.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with query_stats.track_request() as stats:
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", query_stats.server_timing(stats).encode()))
+                    message["headers"] = headers
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    query_stats.record_request(f"{scope['method']} {route.path}", stats)
+
+
+# Read-your-writes pin, echoed back by clients and read by get_read_db
+PRIMARY_PIN_HEADER = "x-read-primary-until"
+PRIMARY_PIN_COOKIE = "read_primary_until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """
+    After a successful write, pin the caller's next reads to the primary for
+    READ_YOUR_WRITES_SECONDS so replica lag never hides what they just did
+    (a placed bet missing from /bets/me). The pin is the expiry timestamp,
+    sent as an `X-Read-Primary-Until` header for API clients to echo back
+    and as a cookie for same-origin browsers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                window = settings.READ_YOUR_WRITES_SECONDS
+                until = f"{time.time() + window:.3f}"
+                headers = list(message.get("headers", []))
+                headers.append((PRIMARY_PIN_HEADER.encode(), until.encode()))
+                headers.append((
+                    b"set-cookie",
+                    f"{PRIMARY_PIN_COOKIE}={until}; Max-Age={math.ceil(window)}; "
+                    f"Path=/; HttpOnly; SameSite=Lax".encode(),
+                ))
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
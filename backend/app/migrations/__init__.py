@@ -0,0 +1,187 @@
+"""
+Versioned schema migrations.
+
+Each module in app/migrations/versions is one migration, applied in
+filename order and recorded in the `schema_migrations` table:
+
+    VERSION = "0002"
+    DESCRIPTION = "Hot-path indexes"
+    TRANSACTIONAL = False  # optional, default True
+
+    def upgrade(conn): ...
+
+Transactional migrations run inside one transaction together with their
+bookkeeping row. Non-transactional ones (CREATE INDEX CONCURRENTLY cannot
+run in a transaction block) get an autocommit connection and must be
+idempotent, since a crash can leave them half-applied.
+
+Migrations run on startup via init_db(); against a large live database,
+apply them ahead of a deploy instead:
+
+    python -m app.migrations upgrade
+    python -m app.migrations status
+"""
+
+import importlib.util
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import ModuleType
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "versions")
+# Serializes migrations across workers starting at once (pg_advisory_lock key)
+ADVISORY_LOCK_KEY = 0x6D6967726174
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass
+class Migration:
+    version: str
+    description: str
+    transactional: bool
+    module: ModuleType
+
+    def upgrade(self, conn: Connection) -> None:
+        self.module.upgrade(conn)
+
+
+def load_migrations() -> list[Migration]:
+    """All migrations under versions/, ordered by filename."""
+    migrations = []
+    for filename in sorted(os.listdir(VERSIONS_DIR)):
+        if not filename.endswith(".py") or filename.startswith("_"):
+            continue
+        name = filename[:-3]
+        spec = importlib.util.spec_from_file_location(
+            f"app.migrations.versions.{name}", os.path.join(VERSIONS_DIR, filename)
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        migrations.append(Migration(
+            version=module.VERSION,
+            description=module.DESCRIPTION,
+            transactional=getattr(module, "TRANSACTIONAL", True),
+            module=module,
+        ))
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f"Duplicate migration versions in {VERSIONS_DIR}: {versions}")
+    return migrations
+
+
+def applied_versions(engine: Engine) -> dict[str, datetime]:
+    """Applied versions and when. Read-only: a database never migrated has none."""
+    with engine.connect() as conn:
+        if not inspect(conn).has_table(schema_migrations.name):
+            return {}
+        rows = conn.execute(select(schema_migrations.c.version, schema_migrations.c.applied_at))
+        return {version: applied_at for version, applied_at in rows}
+
+
+def _record(conn: Connection, migration: Migration) -> None:
+    conn.execute(schema_migrations.insert().values(
+        version=migration.version,
+        description=migration.description,
+        applied_at=datetime.now(timezone.utc),
+    ))
+
+
+def _apply(engine: Engine, migration: Migration) -> None:
+    logger.info("Applying migration %s: %s", migration.version, migration.description)
+    if migration.transactional:
+        with engine.begin() as conn:
+            migration.upgrade(conn)
+            _record(conn, migration)
+        return
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        migration.upgrade(conn)
+        _record(conn, migration)
+
+
+def migrate(engine: Engine, target: str | None = None) -> list[str]:
+    """Apply pending migrations up to `target` (default: all). Returns the versions applied."""
+    applied = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        if engine.dialect.name == "postgresql":
+            lock_conn.exec_driver_sql(f"SELECT pg_advisory_lock({ADVISORY_LOCK_KEY})")
+        try:
+            _metadata.create_all(engine)
+            done = applied_versions(engine)
+            for migration in load_migrations():
+                if target is not None and migration.version > target:
+                    break
+                if migration.version in done:
+                    continue
+                _apply(engine, migration)
+                applied.append(migration.version)
+        finally:
+            if engine.dialect.name == "postgresql":
+                lock_conn.exec_driver_sql(f"SELECT pg_advisory_unlock({ADVISORY_LOCK_KEY})")
+    return applied
+
+
+def pending(engine: Engine) -> list[str]:
+    """Versions not yet applied to the database behind `engine`."""
+    done = applied_versions(engine)
+    return [m.version for m in load_migrations() if m.version not in done]
+
+
+def status(engine: Engine) -> list[dict]:
+    done = applied_versions(engine)
+    return [
+        {
+            "version": m.version,
+            "description": m.description,
+            "applied_at": done[m.version].isoformat() if m.version in done else None,
+        }
+        for m in load_migrations()
+    ]
+
+
+# ─────────────── Helpers for migration modules ───────────────
+
+
+def create_index(
+    conn: Connection,
+    name: str,
+    table: str,
+    columns: str,
+    where: str | None = None,
+    using: str | None = None,
+) -> None:
+    """
+    CREATE INDEX IF NOT EXISTS, CONCURRENTLY on PostgreSQL so writes to
+    `table` keep flowing during the build. An INVALID leftover from an
+    interrupted concurrent build is dropped and rebuilt. `using` names the
+    index method (e.g. gin), with any operator class given in `columns`.
+    """
+    postgres = conn.dialect.name == "postgresql"
+    if postgres:
+        invalid = conn.exec_driver_sql(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = %(name)s AND NOT i.indisvalid",
+            {"name": name},
+        ).first()
+        if invalid:
+            logger.warning("Rebuilding invalid index %s", name)
+            conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    concurrently = "CONCURRENTLY " if postgres else ""
+    method = f"USING {using} " if using else ""
+    sql = f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} {method}({columns})"
+    if where:
+        sql += f" WHERE {where}"
+    conn.exec_driver_sql(sql)
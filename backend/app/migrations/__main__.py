@@ -0,0 +1,34 @@
+"""
+Apply or inspect schema migrations.
+
+Usage:
+    python -m app.migrations upgrade [--target VERSION]
+    python -m app.migrations status
+"""
+
+import argparse
+import logging
+
+from app.database import engine
+from app.migrations import migrate, status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.migrations")
+    sub = parser.add_subparsers(dest="command", required=True)
+    upgrade = sub.add_parser("upgrade", help="apply pending migrations")
+    upgrade.add_argument("--target", help="stop after this version")
+    sub.add_parser("status", help="list migrations and when they were applied")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "upgrade":
+        applied = migrate(engine, target=args.target)
+        print(f"Applied {len(applied)} migration(s): {', '.join(applied) or '-'}")
+    else:
+        for row in status(engine):
+            print(f"{row['version']}  {row['applied_at'] or 'pending':32}  {row['description']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Baseline: the tables init_db() used to create with Base.metadata.create_all.
+
+Only the tables that existed before migrations are created here; tables and
+indexes added since belong to later migrations, so this baseline does not
+grow with the models. Safe on existing databases — create_all skips tables
+that exist and the content_hash columns are added only where missing — so
+databases created before migrations existed adopt the baseline on their
+first run.
+"""
+
+from sqlalchemy import text
+
+VERSION = "0001"
+DESCRIPTION = "Baseline schema"
+
+BASELINE_TABLES = (
+    "users",
+    "competitions",
+    "teams",
+    "players",
+    "matches",
+    "competition_teams",
+    "tournaments",
+    "events",
+    "markets",
+    "selections",
+    "bets",
+    "activity_feed",
+    "notifications",
+)
+
+
+def upgrade(conn):
+    from app.database import Base
+    # Import all models so Base.metadata knows about them
+    import app.models.user  # noqa: F401
+    import app.models.football_data  # noqa: F401
+    import app.models.tournament  # noqa: F401
+    import app.models.event  # noqa: F401
+    import app.models.market  # noqa: F401
+    import app.models.bet  # noqa: F401
+    import app.models.activity  # noqa: F401
+
+    # A fresh users table gets its trigram indexes, which need this extension
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    Base.metadata.create_all(
+        bind=conn, tables=[Base.metadata.tables[name] for name in BASELINE_TABLES]
+    )
+
+    # create_all never alters existing tables; add columns introduced later
+    if conn.dialect.name == "postgresql":
+        for table in ("competitions", "teams", "players", "matches"):
+            conn.execute(text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)"
+            ))
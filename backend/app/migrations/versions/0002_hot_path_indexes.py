@@ -0,0 +1,46 @@
+"""
+Indexes for the per-request queries of the betting, feed and listing routes.
+
+Built CONCURRENTLY so the migration can run against a live database without
+blocking bets. Each index serves the queries listed next to it; a btree on
+(x, created_at) also serves ORDER BY created_at DESC by scanning backwards.
+benchmarks/index_plans.py shows the plan and timing of every query with
+and without these indexes.
+"""
+
+from app.migrations import create_index
+
+VERSION = "0002"
+DESCRIPTION = "Hot-path indexes for bets, markets, events, feed and notifications"
+TRANSACTIONAL = False
+
+# (name, table, columns, partial-index predicate)
+INDEXES = [
+    # GET /bets/me, /users/me/stats (30-day window), /auth/me and leaderboard
+    # bet counts: one user's bets, newest first
+    ("ix_bets_user_id_placed_at", "bets", "user_id, placed_at", None),
+    # settle/void (open bets of a market's selections), GET /markets/{id}/trends,
+    # GET /admin/markets/{id}/bets; status as a second column because
+    # settlement only touches open bets
+    ("ix_bets_selection_id_status", "bets", "selection_id, status", None),
+    # Selections of a market: MarketOut loading, settlement, place_bet
+    ("ix_selections_market_id", "selections", "market_id", None),
+    # GET /events/{id}/markets, newest first
+    ("ix_markets_event_id_created_at", "markets", "event_id, created_at", None),
+    # GET /tournaments/{id}/markets, admin all-markets, tournament leaderboard
+    ("ix_markets_tournament_id_created_at", "markets", "tournament_id, created_at", None),
+    # GET /tournaments/{id}/events, newest first; tournament leaderboard
+    ("ix_events_tournament_id_created_at", "events", "tournament_id, created_at", None),
+    # GET /feed: latest N activities
+    ("ix_activity_feed_created_at", "activity_feed", "created_at", None),
+    # GET /notifications, newest first
+    ("ix_notifications_user_id_created_at", "notifications", "user_id, created_at", None),
+    # GET /notifications/unread-count and read-all: only unread rows are indexed,
+    # so the index stays small however many notifications have been read
+    ("ix_notifications_user_id_unread", "notifications", "user_id", "NOT is_read"),
+]
+
+
+def upgrade(conn):
+    for name, table, columns, where in INDEXES:
+        create_index(conn, name, table, columns, where=where)
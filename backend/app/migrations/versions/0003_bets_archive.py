@@ -0,0 +1,15 @@
+"""
+Cold table for settled bet history (see services/bet_archive.py).
+
+checkfirst skips the table where it already exists, e.g. a database whose
+schema predates this migration's bookkeeping.
+"""
+
+VERSION = "0003"
+DESCRIPTION = "bets_archive table for settled bet history"
+
+
+def upgrade(conn):
+    from app.models.bet import BetArchive
+
+    BetArchive.__table__.create(bind=conn, checkfirst=True)
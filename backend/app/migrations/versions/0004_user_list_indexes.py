@@ -0,0 +1,41 @@
+"""
+User indexes declared on the model after the baseline: keyset pagination
+of the admin user list, balance filters and ranking, and trigram indexes
+behind the admin user search.
+
+Built CONCURRENTLY like 0002. The trigram indexes are PostgreSQL-only and
+need the pg_trgm extension, created first.
+"""
+
+from sqlalchemy import text
+
+from app.migrations import create_index
+
+VERSION = "0004"
+DESCRIPTION = "User list, balance and trigram search indexes"
+TRANSACTIONAL = False
+
+# (name, table, columns, partial-index predicate)
+INDEXES = [
+    # GET /admin/users: keyset pagination, newest first (created_at DESC, id DESC)
+    ("ix_users_created_at_id", "users", "created_at, id", None),
+    # min_balance/max_balance filters of GET /admin/users; global leaderboard order
+    ("ix_users_balance", "users", "balance", None),
+]
+
+# GET /admin/users?q=: ILIKE '%q%' on username/email cannot use a btree
+# (name, table, columns with operator class), built USING gin
+TRIGRAM_INDEXES = [
+    ("ix_users_username_trgm", "users", "username gin_trgm_ops"),
+    ("ix_users_email_trgm", "users", "email gin_trgm_ops"),
+]
+
+
+def upgrade(conn):
+    for name, table, columns, where in INDEXES:
+        create_index(conn, name, table, columns, where=where)
+    if conn.dialect.name != "postgresql":
+        return
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for name, table, columns in TRIGRAM_INDEXES:
+        create_index(conn, name, table, columns, using="gin")
@@ -1,21 +1,25 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Boolean, Text, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy import String, Boolean, Text, ForeignKey, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 
 class ActivityFeed(Base):
     __tablename__ = "activity_feed"
+    __table_args__ = (
+        # Hot-path index, see migrations/versions/0002_hot_path_indexes.py
+        Index("ix_activity_feed_created_at", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("users.id"), nullable=True
+        ForeignKey("users.id"), nullable=True
     )
     # action_type: bet_placed | market_settled | market_opened | market_voided
     #              | user_joined | balance_adjusted
@@ -23,7 +27,7 @@ class ActivityFeed(Base):
     description: Mapped[str] = mapped_column(Text, nullable=False)
     metadata_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
@@ -33,12 +37,23 @@ class ActivityFeed(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Hot-path indexes, see migrations/versions/0002_hot_path_indexes.py
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        # Partial: only unread rows, for the unread count and read-all
+        Index(
+            "ix_notifications_user_id_unread",
+            "user_id",
+            postgresql_where=text("NOT is_read"),
+            sqlite_where=text("NOT is_read"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+        ForeignKey("users.id"), nullable=False
     )
     type: Mapped[str] = mapped_column(String(50), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -46,7 +61,7 @@ class Notification(Base):
     link: Mapped[str | None] = mapped_column(String(500), nullable=True)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
@@ -1,35 +1,40 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy import String, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 
 class Bet(Base):
     __tablename__ = "bets"
+    __table_args__ = (
+        # Hot-path indexes, see migrations/versions/0002_hot_path_indexes.py
+        Index("ix_bets_user_id_placed_at", "user_id", "placed_at"),
+        Index("ix_bets_selection_id_status", "selection_id", "status"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+        ForeignKey("users.id"), nullable=False
     )
     selection_id: Mapped[uuid.UUID] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("selections.id"), nullable=False
+        ForeignKey("selections.id"), nullable=False
     )
     stake: Mapped[int] = mapped_column(Integer, nullable=False)
     potential_payout: Mapped[int] = mapped_column(Integer, nullable=False)
-    # status: open | won | lost | voided
+    # status: open | won | lost | replaced | voided
     status: Mapped[str] = mapped_column(String(20), default="open")
     placed_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
     settled_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True
+        TZDateTime(), nullable=True
     )
 
     # Relationships
@@ -37,3 +42,37 @@ class Bet(Base):
     selection: Mapped["Selection"] = relationship(  # noqa: F821
         back_populates="bets"
     )
+
+
+class BetArchive(Base):
+    """
+    Cold storage for settled history: bets that were settled, replaced or
+    voided more than BETS_ARCHIVE_AFTER_DAYS ago, moved out of `bets` by
+    services/bet_archive.py. Same columns as Bet plus archived_at; read
+    through bet_archive.all_bets() together with the hot table.
+    """
+
+    __tablename__ = "bets_archive"
+    __table_args__ = (
+        Index("ix_bets_archive_user_id_placed_at", "user_id", "placed_at"),
+        Index("ix_bets_archive_selection_id", "selection_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id"), nullable=False
+    )
+    selection_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("selections.id"), nullable=False
+    )
+    stake: Mapped[int] = mapped_column(Integer, nullable=False)
+    potential_payout: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    placed_at: Mapped[datetime] = mapped_column(TZDateTime())
+    settled_at: Mapped[datetime | None] = mapped_column(
+        TZDateTime(), nullable=True
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        TZDateTime(),
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -1,21 +1,25 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Integer, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID as PgUUID
+from sqlalchemy import String, Integer, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Hot-path index, see migrations/versions/0002_hot_path_indexes.py
+        Index("ix_events_tournament_id_created_at", "tournament_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
     tournament_id: Mapped[uuid.UUID] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("tournaments.id"), nullable=False
+        ForeignKey("tournaments.id"), nullable=False
     )
     # Nullable FK — events can be created without a linked API match
     match_id: Mapped[int | None] = mapped_column(
@@ -26,10 +30,10 @@ class Event(Base):
     # status: upcoming | live | completed | cancelled
     status: Mapped[str] = mapped_column(String(20), default="upcoming")
     starts_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True
+        TZDateTime(), nullable=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
@@ -37,7 +41,7 @@ class Event(Base):
     tournament: Mapped["Tournament"] = relationship(  # noqa: F821
         back_populates="events"
     )
-    match: Mapped["Match"] = relationship(lazy="selectin")  # noqa: F821
+    match: Mapped["Match"] = relationship()  # noqa: F821
     markets: Mapped[list["Market"]] = relationship(  # noqa: F821
-        back_populates="event", lazy="selectin"
+        back_populates="event"
     )
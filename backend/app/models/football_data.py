@@ -1,11 +1,12 @@
 from datetime import date, datetime, timezone
 
 from sqlalchemy import (
-    String, Integer, Date, DateTime, ForeignKey, Table, Column,
+    String, Integer, Date, ForeignKey, Table, Column,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 # ---------- Many-to-Many junction: Competition <-> Team ----------
 competition_teams = Table(
@@ -34,20 +35,22 @@ class Competition(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     code: Mapped[str | None] = mapped_column(String(20), nullable=True)
     emblem_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # sha256 of the mapped API payload; lets syncs skip unchanged rows
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     synced_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
     # Relationships
     teams: Mapped[list["Team"]] = relationship(
-        secondary=competition_teams, back_populates="competitions", lazy="selectin"
+        secondary=competition_teams, back_populates="competitions"
     )
     matches: Mapped[list["Match"]] = relationship(
-        back_populates="competition", lazy="selectin"
+        back_populates="competition"
     )
     tournaments: Mapped[list["Tournament"]] = relationship(  # noqa: F821
-        back_populates="competition", lazy="selectin"
+        back_populates="competition"
     )
 
 
@@ -59,27 +62,27 @@ class Team(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     short_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
     crest_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # sha256 of the mapped API payload; lets syncs skip unchanged rows
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     synced_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
     # Relationships
     competitions: Mapped[list[Competition]] = relationship(
-        secondary=competition_teams, back_populates="teams", lazy="selectin"
+        secondary=competition_teams, back_populates="teams"
     )
     players: Mapped[list["Player"]] = relationship(
-        back_populates="team", lazy="selectin"
+        back_populates="team"
     )
     home_matches: Mapped[list["Match"]] = relationship(
         back_populates="home_team",
         foreign_keys="Match.home_team_id",
-        lazy="selectin",
     )
     away_matches: Mapped[list["Match"]] = relationship(
         back_populates="away_team",
         foreign_keys="Match.away_team_id",
-        lazy="selectin",
     )
 
 
@@ -95,8 +98,10 @@ class Player(Base):
     position: Mapped[str | None] = mapped_column(String(50), nullable=True)
     nationality: Mapped[str | None] = mapped_column(String(100), nullable=True)
     date_of_birth: Mapped[date | None] = mapped_column(Date, nullable=True)
+    # sha256 of the mapped API payload; lets syncs skip unchanged rows
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     synced_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
@@ -119,13 +124,15 @@ class Match(Base):
         Integer, ForeignKey("teams.id"), nullable=False
     )
     kickoff_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), nullable=True
+        TZDateTime(), nullable=True
     )
     matchday: Mapped[int | None] = mapped_column(Integer, nullable=True)
     stage: Mapped[str | None] = mapped_column(String(100), nullable=True)
     status: Mapped[str | None] = mapped_column(String(30), nullable=True)
+    # sha256 of the mapped API payload; lets syncs skip unchanged rows
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
     synced_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
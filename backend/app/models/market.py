@@ -3,16 +3,21 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 from sqlalchemy import (
-    String, Integer, Boolean, DateTime, ForeignKey, Numeric,
+    String, Integer, Boolean, ForeignKey, Numeric, Index,
 )
-from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 
 class Market(Base):
     __tablename__ = "markets"
+    __table_args__ = (
+        # Hot-path indexes, see migrations/versions/0002_hot_path_indexes.py
+        Index("ix_markets_event_id_created_at", "event_id", "created_at"),
+        Index("ix_markets_tournament_id_created_at", "tournament_id", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
@@ -20,10 +25,10 @@ class Market(Base):
     # A market belongs to an event, a tournament, or both.
     # At least one must be set.
     event_id: Mapped[uuid.UUID | None] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("events.id"), nullable=True
+        ForeignKey("events.id"), nullable=True
     )
     tournament_id: Mapped[uuid.UUID | None] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("tournaments.id"), nullable=True
+        ForeignKey("tournaments.id"), nullable=True
     )
     question: Mapped[str] = mapped_column(String(500), nullable=False)
     # market_type: match_result | player_prop | tournament | special
@@ -31,7 +36,7 @@ class Market(Base):
     # status: coming_soon | open | locked | settled | voided
     status: Mapped[str] = mapped_column(String(20), default="coming_soon")
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
@@ -41,18 +46,21 @@ class Market(Base):
         back_populates="markets"
     )
     selections: Mapped[list["Selection"]] = relationship(
-        back_populates="market", lazy="selectin", cascade="all, delete-orphan"
+        back_populates="market", cascade="all, delete-orphan"
     )
 
 
 class Selection(Base):
     __tablename__ = "selections"
+    __table_args__ = (
+        Index("ix_selections_market_id", "market_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
     )
     market_id: Mapped[uuid.UUID] = mapped_column(
-        PgUUID(as_uuid=True), ForeignKey("markets.id"), nullable=False
+        ForeignKey("markets.id"), nullable=False
     )
     label: Mapped[str] = mapped_column(String(255), nullable=False)
     odds: Mapped[Decimal] = mapped_column(
@@ -66,7 +74,7 @@ class Selection(Base):
 
     # Relationships
     market: Mapped[Market] = relationship(back_populates="selections")
-    player: Mapped["Player"] = relationship(lazy="selectin")  # noqa: F821
+    player: Mapped["Player"] = relationship()  # noqa: F821
     bets: Mapped[list["Bet"]] = relationship(  # noqa: F821
-        back_populates="selection", lazy="selectin"
+        back_populates="selection"
     )
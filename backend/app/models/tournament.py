@@ -1,10 +1,11 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 
 class Tournament(Base):
@@ -20,7 +21,7 @@ class Tournament(Base):
     # status: upcoming | active | completed
     status: Mapped[str] = mapped_column(String(20), default="upcoming")
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
@@ -29,8 +30,8 @@ class Tournament(Base):
         back_populates="tournaments"
     )
     events: Mapped[list["Event"]] = relationship(  # noqa: F821
-        back_populates="tournament", lazy="selectin"
+        back_populates="tournament"
     )
     markets: Mapped[list["Market"]] = relationship(  # noqa: F821
-        back_populates="tournament", lazy="selectin"
+        back_populates="tournament"
     )
@@ -1,14 +1,33 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Boolean, Integer, DateTime
+from sqlalchemy import String, Boolean, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.db_types import TZDateTime
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination for the admin user list (created_at DESC, id DESC)
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_balance", "balance"),
+        # Trigram indexes back the ILIKE search on username/email (needs pg_trgm)
+        Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True, default=uuid.uuid4
@@ -24,17 +43,17 @@ class User(Base):
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TZDateTime(),
         default=lambda: datetime.now(timezone.utc),
     )
 
     # Relationships
     bets: Mapped[list["Bet"]] = relationship(  # noqa: F821
-        back_populates="user", lazy="selectin"
+        back_populates="user"
     )
     activities: Mapped[list["ActivityFeed"]] = relationship(  # noqa: F821
-        back_populates="user", lazy="selectin"
+        back_populates="user"
     )
     notifications: Mapped[list["Notification"]] = relationship(  # noqa: F821
-        back_populates="user", lazy="selectin"
+        back_populates="user"
     )
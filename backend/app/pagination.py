@@ -0,0 +1,75 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque, URL-safe strings encoding the sort key of the last row
+on a page. The next page is fetched with a `WHERE (sort_key, id) < cursor`
+predicate instead of OFFSET, so deep pages stay as cheap as the first one.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+
+def encode_cursor(*values) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor."""
+    raw = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, uuid.UUID) else v
+        for v in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(raw).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor back into typed values.
+    `types` lists the expected type of each position (datetime, uuid.UUID, int, str).
+    Raises HTTP 400 on a malformed cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or len(raw) != len(types):
+            raise ValueError("cursor arity mismatch")
+        values = []
+        for value, typ in zip(raw, types):
+            if typ is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif typ is uuid.UUID:
+                values.append(uuid.UUID(value))
+            else:
+                values.append(typ(value))
+        return tuple(values)
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_page(query: Query, sort_key, id_key, limit: int, cursor: str | None) -> tuple[list, str | None]:
+    """
+    Fetch one page of `query`, newest first by (sort_key, id_key), starting
+    after `cursor`. Returns the rows and the cursor for the next page (None
+    on the last page). Both keys must be on the rows under their column
+    names: entities, or projections that select them unlabelled.
+    """
+    if cursor:
+        last_sort, last_id = decode_cursor(cursor, datetime, uuid.UUID)
+        query = query.filter(tuple_(sort_key, id_key) < tuple_(last_sort, last_id))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(sort_key.desc(), id_key.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(getattr(rows[-1], sort_key.key), getattr(rows[-1], id_key.key))
+    return rows, next_cursor
+
+
+def escape_like(term: str) -> str:
+    """Escape LIKE/ILIKE wildcards so user input is matched literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,141 @@
+"""
+Loader options for read endpoints.
+
+Model relationships are lazy by default; each read endpoint states exactly
+what its response schema needs via these options. Column lists come from
+the Pydantic schemas, so a projection loads only what the response
+serializes (no content_hash, no unrelated relationships) and stays in step
+with the schema as fields are added.
+
+The option tuples are built on first use rather than at import: building
+them configures every mapper, which app.startup does in parallel with
+other warm-up work instead of on the import path.
+
+Query counts per call, independent of catalog size:
+- TOURNAMENT_OUT: 1 (tournament JOIN competition)
+- EVENT_OUT:      1 (event JOIN match JOIN home/away team)
+- MARKET_OUT:     2 (markets, then selections JOIN player)
+- TEAM_OUT / COMPETITION_OUT / PLAYER_OUT: 1
+- bet_out_query:  1 (bets JOIN selection JOIN market, flattened to BetOut)
+"""
+
+from collections.abc import Sequence
+from typing import Callable
+
+from pydantic import BaseModel
+from sqlalchemy import Float, cast
+from sqlalchemy.orm import Query, Session, joinedload, load_only, selectinload
+
+from app.models.bet import Bet
+from app.models.event import Event
+from app.models.football_data import Competition, Match, Player, Team
+from app.models.market import Market, Selection
+from app.models.tournament import Tournament
+from app.schemas.core import (
+    BetOut,
+    CompetitionOut,
+    EventOut,
+    MarketOut,
+    MatchOut,
+    PlayerOut,
+    SelectionOut,
+    TeamOut,
+    TournamentOut,
+)
+
+
+def columns_for(model, schema: type[BaseModel]) -> list:
+    """Mapped columns of `model` that `schema` serializes (relationships excluded)."""
+    table_columns = model.__table__.c
+    return [getattr(model, name) for name in schema.model_fields if name in table_columns]
+
+
+def project(model, schema: type[BaseModel]):
+    """load_only() for the columns `schema` reads from `model`."""
+    return load_only(*columns_for(model, schema))
+
+
+class LoaderOptions(Sequence):
+    """A tuple of loader options, built the first time it is unpacked."""
+
+    def __init__(self, build: Callable[[], tuple]):
+        self._build = build
+        self._options: tuple | None = None
+
+    def _resolve(self) -> tuple:
+        if self._options is None:
+            self._options = tuple(self._build())
+        return self._options
+
+    def __getitem__(self, index):
+        return self._resolve()[index]
+
+    def __len__(self) -> int:
+        return len(self._resolve())
+
+
+COMPETITION_OUT = LoaderOptions(lambda: (project(Competition, CompetitionOut),))
+TEAM_OUT = LoaderOptions(lambda: (project(Team, TeamOut),))
+PLAYER_OUT = LoaderOptions(lambda: (project(Player, PlayerOut),))
+
+TOURNAMENT_OUT = LoaderOptions(lambda: (
+    project(Tournament, TournamentOut),
+    joinedload(Tournament.competition).options(project(Competition, CompetitionOut)),
+))
+
+
+def _event_out() -> tuple:
+    match = joinedload(Event.match)
+    return (
+        project(Event, EventOut),
+        match.options(project(Match, MatchOut)),
+        match.joinedload(Match.home_team).options(project(Team, TeamOut)),
+        match.joinedload(Match.away_team).options(project(Team, TeamOut)),
+    )
+
+
+def _market_out() -> tuple:
+    selections = selectinload(Market.selections)
+    return (
+        project(Market, MarketOut),
+        selections.options(project(Selection, SelectionOut)),
+        selections.joinedload(Selection.player).options(project(Player, PlayerOut)),
+    )
+
+
+EVENT_OUT = LoaderOptions(_event_out)
+MARKET_OUT = LoaderOptions(_market_out)
+
+
+
+def bet_out_query(db: Session, bets=Bet) -> Query:
+    """
+    BetOut rows in one SELECT: the bet columns the schema serializes plus the
+    selection label / odds and market question, flattened in SQL rather than
+    loaded as relationships. `bets` is Bet or bet_archive.all_bets().
+    """
+    flattened = {
+        "selection_label": Selection.label,
+        # BetOut.odds is a float; casting in SQL skips a Decimal per row
+        "odds": cast(Selection.odds, Float),
+        "market_question": Market.question,
+    }
+    table_columns = Bet.__table__.c
+    columns = [
+        getattr(bets, name) if name in table_columns else flattened[name].label(name)
+        for name in BetOut.model_fields
+    ]
+    return (
+        db.query(*columns)
+        .join(Selection, Selection.id == bets.selection_id)
+        .join(Market, Market.id == Selection.market_id)
+    )
+
+
+ALL = (COMPETITION_OUT, TEAM_OUT, PLAYER_OUT, TOURNAMENT_OUT, EVENT_OUT, MARKET_OUT)
+
+
+def build_all() -> None:
+    """Build every projection now (startup warm-up)."""
+    for options in ALL:
+        options._resolve()
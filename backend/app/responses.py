@@ -0,0 +1,59 @@
+"""
+Response rendering for the API.
+
+The app's default response class is orjson's (set in app.main), so every
+endpoint that returns dicts or models is encoded by orjson instead of the
+stdlib json module.
+
+List endpoints go one step further with respond(): the rows are validated
+by a prebuilt TypeAdapter (app.schemas.core) and dumped to JSON bytes by
+pydantic-core in one pass. FastAPI's own path validates, converts every
+row to a dict of JSON-safe values and then encodes those. The endpoint keeps
+its response_model for the OpenAPI schema.
+
+Clients sending `Accept: application/x-msgpack` get MessagePack instead,
+when the optional msgpack package is installed (`pip install msgpack`).
+"""
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Row
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+JSON_MEDIA_TYPE = "application/json"
+
+
+def wants_msgpack(request: Request) -> bool:
+    return MSGPACK_AVAILABLE and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _plain(rows):
+    if rows and isinstance(rows[0], Row):
+        # Validating dicts is several times faster than attribute access on rows
+        return [row._asdict() for row in rows]
+    return rows
+
+
+def respond(request: Request, adapter: TypeAdapter, data) -> Response:
+    """
+    Serialize `data` (ORM objects, SQL rows, dicts or schema instances, or a
+    dict holding lists of them, such as a page) through `adapter`, as JSON
+    or as MessagePack if the client asked for it.
+    """
+    if isinstance(data, dict):
+        data = {key: _plain(value) if isinstance(value, list) else value for key, value in data.items()}
+    else:
+        data = _plain(data)
+    value = adapter.validate_python(data, from_attributes=True)
+    # The body depends on Accept once MessagePack can be served
+    headers = {"Vary": "Accept"} if MSGPACK_AVAILABLE else None
+    if wants_msgpack(request):
+        body = msgpack.packb(adapter.dump_python(value, mode="json"))
+        return Response(body, media_type=MSGPACK_MEDIA_TYPE, headers=headers)
+    return Response(adapter.dump_json(value), media_type=JSON_MEDIA_TYPE, headers=headers)
@@ -2,72 +2,125 @@
 Admin router — sync endpoints for football-data.org and admin operations.
 """
 
+import asyncio
 from datetime import datetime, timezone, timedelta
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, require_admin
+from app.config import settings
+from app.database import engine, async_engine, read_engine
+from app import db_pool, startup
+from app.dependencies import get_db, get_async_db, require_admin
 from app.models.user import User
-from app.models.football_data import Competition, Team, Player, Match, competition_teams
+from app.models.football_data import Competition, Team, Match, Player, competition_teams
 from app.models.tournament import Tournament
-from app.schemas.core import SyncSummary, CompetitionOut, TeamOut, PlayerOut
-from app.services.football_api import (
-    fetch_competitions,
-    fetch_teams_for_competition,
-    fetch_fixtures_for_competition,
-    fetch_squad_for_team,
-    fetch_matches_for_matchday,
-    fetch_competition_standings,
-    fetch_competition_stages,
-    FootballAPIError,
+from app.projections import COMPETITION_OUT, TEAM_OUT, PLAYER_OUT
+from app.responses import respond
+from app.schemas.core import (
+    SyncSummary,
+    SquadSyncJobOut,
+    CompetitionOut,
+    TeamOut,
+    PlayerOut,
+    COMPETITION_LIST,
+    TEAM_LIST,
+    PLAYER_LIST,
 )
+from app.services import bet_archive, cache_bus, loop_monitor, query_stats
+from app.services.bulk_upsert import bulk_upsert_async, bulk_insert_ignore_async
+from app.services.cache_bus import entity_key, invalidate_async
+
+if TYPE_CHECKING:
+    from app.services.squad_sync import SquadSyncJob
 
 router = APIRouter(prefix="/admin", tags=["Admin Sync"])
 
 SYNC_COOLDOWN_MINUTES = 30
 
 
+def football_client():
+    """
+    The shared football-data.org client (override in tests via
+    app.dependency_overrides). football_api, and httpx with it, are imported
+    on first use rather than at app startup.
+    """
+    from app.services.football_api import get_client
+
+    return get_client()
+
+
+def sync_due(synced_at, now: datetime):
+    """Upsert guard: the row was never synced, or not within the cooldown window."""
+    return or_(synced_at.is_(None), synced_at < now - timedelta(minutes=SYNC_COOLDOWN_MINUTES))
+
+
+async def _invalidate_tournaments(db: AsyncSession, competition_ids: list[int]) -> None:
+    """Evict the cached tournaments (which embed their competition) of these competitions."""
+    tournament_ids = await db.scalars(
+        select(Tournament.id).where(Tournament.competition_id.in_(competition_ids))
+    )
+    await invalidate_async(db, *(entity_key("tournament", t) for t in tournament_ids))
+
+
+async def _competition_id_for(db: AsyncSession, tournament_id: str) -> int:
+    """The tournament's competition id, or 404. Loads no relationships."""
+    competition_id = await db.scalar(
+        select(Tournament.competition_id).where(Tournament.id == tournament_id)
+    )
+    if competition_id is None:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    return competition_id
+
+
 # ─────────────── Sync competitions ───────────────
 
 @router.post("/sync/competitions", response_model=SyncSummary)
 async def sync_competitions(
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
 ):
     """Fetch all competitions from football-data.org and upsert locally."""
+    from app.services.football_api import FootballAPIError, fetch_competitions
+
     try:
-        api_data = await fetch_competitions()
+        api_data = await fetch_competitions(client)
     except FootballAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
     now = datetime.now(timezone.utc)
-    summary = SyncSummary()
-
-    for item in api_data:
-        existing = db.query(Competition).filter(Competition.id == item["id"]).first()
-        if existing:
-            # Check cooldown
-            if existing.synced_at and (now - existing.synced_at) < timedelta(minutes=SYNC_COOLDOWN_MINUTES):
-                summary.skipped += 1
-                continue
-            existing.name = item["name"]
-            existing.code = item.get("code")
-            existing.emblem_url = item.get("emblem_url")
-            existing.synced_at = now
-            summary.updated += 1
-        else:
-            db.add(Competition(
-                id=item["id"],
-                name=item["name"],
-                code=item.get("code"),
-                emblem_url=item.get("emblem_url"),
-                synced_at=now,
-            ))
-            summary.created += 1
-
-    db.commit()
-    return summary
+    rows = [
+        {
+            "id": item["id"],
+            "name": item["name"],
+            "code": item.get("code"),
+            "emblem_url": item.get("emblem_url"),
+            "synced_at": now,
+        }
+        for item in api_data
+    ]
+    # Competitions synced within the cooldown window are left untouched
+    result = await bulk_upsert_async(
+        db,
+        Competition,
+        rows,
+        where=sync_due(Competition.synced_at, now),
+        hash_column="content_hash",
+    )
+    if result.updated:
+        await _invalidate_tournaments(db, [r["id"] for r in rows])
+
+    await db.commit()
+    return SyncSummary(
+        created=result.created,
+        updated=result.updated,
+        unchanged=result.unchanged,
+        skipped=result.skipped,
+    )
 
 
 # ─────────────── Sync teams for a tournament ───────────────
@@ -76,58 +129,40 @@ async def sync_competitions(
 async def sync_teams(
     tournament_id: str,
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
 ):
     """Fetch teams for the tournament's competition and upsert them locally."""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
+    from app.services.football_api import FootballAPIError, fetch_teams_for_competition
+
+    competition_id = await _competition_id_for(db, tournament_id)
 
     try:
-        api_data = await fetch_teams_for_competition(tournament.competition_id)
+        api_data = await fetch_teams_for_competition(competition_id, client)
     except FootballAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
     now = datetime.now(timezone.utc)
-    summary = SyncSummary()
-
-    for item in api_data:
-        existing = db.query(Team).filter(Team.id == item["id"]).first()
-        if existing:
-            existing.name = item["name"]
-            existing.short_name = item.get("short_name")
-            existing.crest_url = item.get("crest_url")
-            existing.synced_at = now
-            summary.updated += 1
-        else:
-            existing = Team(
-                id=item["id"],
-                name=item["name"],
-                short_name=item.get("short_name"),
-                crest_url=item.get("crest_url"),
-                synced_at=now,
-            )
-            db.add(existing)
-            db.flush()  # ensure the team exists before inserting junction row
-            summary.created += 1
-
-        # Upsert the competition_teams junction
-        link_exists = db.execute(
-            competition_teams.select().where(
-                competition_teams.c.competition_id == tournament.competition_id,
-                competition_teams.c.team_id == item["id"],
-            )
-        ).first()
-        if not link_exists:
-            db.execute(
-                competition_teams.insert().values(
-                    competition_id=tournament.competition_id,
-                    team_id=item["id"],
-                )
-            )
-
-    db.commit()
-    return summary
+    rows = [
+        {
+            "id": item["id"],
+            "name": item["name"],
+            "short_name": item.get("short_name"),
+            "crest_url": item.get("crest_url"),
+            "synced_at": now,
+        }
+        for item in api_data
+    ]
+    result = await bulk_upsert_async(db, Team, rows, hash_column="content_hash")
+
+    # Link every team to the competition; existing links are left alone
+    await bulk_insert_ignore_async(db, competition_teams, [
+        {"competition_id": competition_id, "team_id": row["id"]}
+        for row in rows
+    ])
+
+    await db.commit()
+    return SyncSummary(created=result.created, updated=result.updated, unchanged=result.unchanged)
 
 
 # ─────────────── Sync fixtures for a tournament ───────────────
@@ -136,53 +171,59 @@ async def sync_teams(
 async def sync_fixtures(
     tournament_id: str,
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
 ):
     """Fetch all fixtures for the tournament's competition and upsert them locally."""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
+    from app.services.football_api import FootballAPIError, fetch_fixtures_for_competition
+
+    competition_id = await _competition_id_for(db, tournament_id)
 
     try:
-        api_data = await fetch_fixtures_for_competition(tournament.competition_id)
+        api_data = await fetch_fixtures_for_competition(competition_id, client)
     except FootballAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
     now = datetime.now(timezone.utc)
-    summary = SyncSummary()
-
+    rows = []
+    missing_teams = 0
     for item in api_data:
         # Skip matches with missing team data
         if not item.get("home_team_id") or not item.get("away_team_id"):
-            summary.skipped += 1
+            missing_teams += 1
             continue
-
-        existing = db.query(Match).filter(Match.id == item["id"]).first()
-        if existing:
-            existing.home_team_id = item["home_team_id"]
-            existing.away_team_id = item["away_team_id"]
-            existing.kickoff_at = item.get("kickoff_at")
-            existing.matchday = item.get("matchday")
-            existing.stage = item.get("stage")
-            existing.status = item.get("status")
-            existing.synced_at = now
-            summary.updated += 1
-        else:
-            db.add(Match(
-                id=item["id"],
-                competition_id=tournament.competition_id,
-                home_team_id=item["home_team_id"],
-                away_team_id=item["away_team_id"],
-                kickoff_at=item.get("kickoff_at"),
-                matchday=item.get("matchday"),
-                stage=item.get("stage"),
-                status=item.get("status"),
-                synced_at=now,
-            ))
-            summary.created += 1
-
-    db.commit()
-    return summary
+        rows.append({
+            "id": item["id"],
+            "competition_id": competition_id,
+            "home_team_id": item["home_team_id"],
+            "away_team_id": item["away_team_id"],
+            "kickoff_at": item.get("kickoff_at"),
+            "matchday": item.get("matchday"),
+            "stage": item.get("stage"),
+            "status": item.get("status"),
+            "synced_at": now,
+        })
+    # competition_id is fixed at creation, as before
+    result = await bulk_upsert_async(
+        db, Match, rows,
+        update_columns=[
+            "home_team_id", "away_team_id", "kickoff_at",
+            "matchday", "stage", "status", "synced_at",
+        ],
+        hash_column="content_hash",
+    )
+    if result.created or result.updated:
+        # Cached events embed their match; the tournament entry goes with them
+        match_keys = [f"match:{r['id']}" for r in rows] if result.updated else []
+        await invalidate_async(db, entity_key("tournament", tournament_id), *match_keys)
+
+    await db.commit()
+    return SyncSummary(
+        created=result.created,
+        updated=result.updated,
+        unchanged=result.unchanged,
+        skipped=missing_teams,
+    )
 
 
 # ─────────────── Sync squad for a single team ───────────────
@@ -191,84 +232,301 @@ async def sync_fixtures(
 async def sync_squad(
     team_id: int,
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
 ):
     """Fetch the current squad for a team and upsert players locally."""
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if not team:
-        raise HTTPException(status_code=404, detail="Team not found in local database. Sync teams first.")
+    from app.services.football_api import FootballAPIError, fetch_squad_for_team
+    from app.services.squad_sync import upsert_squad_async
 
-    now = datetime.now(timezone.utc)
+    if await db.scalar(select(Team.id).where(Team.id == team_id)) is None:
+        raise HTTPException(status_code=404, detail="Team not found in local database. Sync teams first.")
 
     try:
-        api_data = await fetch_squad_for_team(team_id)
+        api_data = await fetch_squad_for_team(team_id, client)
     except FootballAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
-    summary = SyncSummary()
+    result = await upsert_squad_async(db, team_id, api_data)
+    await db.commit()
+    return SyncSummary(created=result.created, updated=result.updated, unchanged=result.unchanged)
+
+
+# ─────────────── Sync every squad in a tournament ───────────────
+
+def _job_out(job: "SquadSyncJob") -> SquadSyncJobOut:
+    return SquadSyncJobOut(
+        id=job.id,
+        tournament_id=job.tournament_id,
+        competition_id=job.competition_id,
+        status=job.status,
+        teams_total=len(job.team_ids),
+        teams_done=job.teams_done,
+        teams_failed=job.teams_failed,
+        created=job.created,
+        updated=job.updated,
+        unchanged=job.unchanged,
+        errors=job.errors,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.post(
+    "/tournaments/{tournament_id}/sync-all-squads",
+    response_model=SquadSyncJobOut,
+    status_code=202,
+)
+async def sync_all_squads(
+    tournament_id: str,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
+):
+    """
+    Start syncing the squad of every team in the tournament's competition.
+    Runs in the background with bounded concurrency, paced by the API quota;
+    poll GET /admin/sync-jobs/{job_id} for progress.
+    """
+    from app.services.squad_sync import start_squad_sync
 
-    for item in api_data:
-        existing = db.query(Player).filter(Player.id == item["id"]).first()
-        if existing:
-            existing.name = item["name"]
-            existing.position = item.get("position")
-            existing.nationality = item.get("nationality")
-            existing.date_of_birth = item.get("date_of_birth")
-            existing.team_id = team_id
-            existing.synced_at = now
-            summary.updated += 1
-        else:
-            db.add(Player(
-                id=item["id"],
-                team_id=team_id,
-                name=item["name"],
-                position=item.get("position"),
-                nationality=item.get("nationality"),
-                date_of_birth=item.get("date_of_birth"),
-                synced_at=now,
-            ))
-            summary.created += 1
-
-    team.synced_at = now
-    db.commit()
-    return summary
+    competition_id = await _competition_id_for(db, tournament_id)
+
+    team_ids = list(await db.scalars(
+        select(competition_teams.c.team_id)
+        .where(competition_teams.c.competition_id == competition_id)
+    ))
+    if not team_ids:
+        raise HTTPException(status_code=400, detail="No teams for this competition. Sync teams first.")
+
+    job = start_squad_sync(tournament_id, competition_id, team_ids, client)
+    return _job_out(job)
+
+
+@router.get("/sync-jobs/{job_id}", response_model=SquadSyncJobOut)
+def get_sync_job(
+    job_id: str,
+    admin: User = Depends(require_admin),
+):
+    """Progress of a background squad sync started on this worker."""
+    from app.services.squad_sync import get_job
+
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+    return _job_out(job)
 
 
 # ─────────────── Read-only helpers for admin panel ───────────────
 
 @router.get("/competitions", response_model=list[CompetitionOut])
 def list_competitions(
+    request: Request,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """List all locally stored competitions (for dropdown)."""
-    return db.query(Competition).order_by(Competition.name).all()
+    competitions = db.query(Competition).options(*COMPETITION_OUT).order_by(Competition.name).all()
+    return respond(request, COMPETITION_LIST, competitions)
 
 
 @router.get("/competitions/{competition_id}/teams", response_model=list[TeamOut])
 def list_competition_teams(
     competition_id: int,
+    request: Request,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """List all locally stored teams for a competition."""
-    comp = db.query(Competition).filter(Competition.id == competition_id).first()
-    if not comp:
+    if not db.query(Competition.id).filter(Competition.id == competition_id).first():
         raise HTTPException(status_code=404, detail="Competition not found")
-    return comp.teams
+    teams = (
+        db.query(Team)
+        .options(*TEAM_OUT)
+        .join(competition_teams, competition_teams.c.team_id == Team.id)
+        .filter(competition_teams.c.competition_id == competition_id)
+        .all()
+    )
+    return respond(request, TEAM_LIST, teams)
 
 
 @router.get("/teams/{team_id}/players", response_model=list[PlayerOut])
 def list_team_players(
     team_id: int,
+    request: Request,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """List all locally stored players for a team (for prop market dropdowns)."""
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if not team:
+    if not db.query(Team.id).filter(Team.id == team_id).first():
         raise HTTPException(status_code=404, detail="Team not found")
-    return team.players
+    players = db.query(Player).options(*PLAYER_OUT).filter(Player.team_id == team_id).all()
+    return respond(request, PLAYER_LIST, players)
+
+
+@router.get("/football-api/quota")
+def get_football_api_quota(
+    admin: User = Depends(require_admin),
+):
+    """Remaining football-data.org quota, circuit state and cache counters for this worker."""
+    from app.services import football_api
+
+    return {
+        **football_api.scheduler.snapshot(),
+        "circuit": football_api.breaker.snapshot(),
+        "cache": football_api.response_cache.stats() if football_api.response_cache else None,
+        "transport": football_api.transport_stats(),
+    }
+
+
+@router.delete("/football-api/cache")
+async def clear_football_api_cache(
+    admin: User = Depends(require_admin),
+):
+    """Drop every cached football-data.org response so the next calls refetch."""
+    from app.services import football_api
+
+    if football_api.response_cache is None:
+        return {"cleared": 0}
+    return {"cleared": await football_api.response_cache.clear()}
+
+
+# ─────────────── Diagnostics ───────────────
+
+@router.get("/diagnostics/event-loop")
+def get_event_loop_diagnostics(
+    recent: int = 20,
+    admin: User = Depends(require_admin),
+):
+    """
+    Event-loop lag percentiles, the code sites that blocked the loop longest
+    and the most recent blocking stacks for this worker.
+    Requires LOOP_MONITOR_ENABLED=true.
+    """
+    if loop_monitor.monitor is None:
+        return {"enabled": False}
+    return loop_monitor.monitor.snapshot(offenders=min(max(recent, 0), 50))
+
+
+@router.delete("/diagnostics/event-loop")
+def reset_event_loop_diagnostics(
+    admin: User = Depends(require_admin),
+):
+    """Clear the collected lag samples and offenders."""
+    if loop_monitor.monitor is None:
+        raise HTTPException(status_code=404, detail="Event loop monitor is not enabled")
+    loop_monitor.monitor.reset()
+    return {"reset": True}
+
+
+@router.get("/diagnostics/queries")
+def get_query_diagnostics(
+    sort: str = Query("sql_ms_total", pattern="^(sql_ms_total|sql_ms_avg|queries_max|queries_avg|requests|n_plus_one_requests)$"),
+    admin: User = Depends(require_admin),
+):
+    """
+    Per-route SQL query counts and time for this worker, with the statements
+    each route repeats within a single request (likely N+1 patterns).
+    """
+    return {
+        "enabled": settings.QUERY_STATS_ENABLED,
+        "repeat_threshold": settings.QUERY_STATS_REPEAT_THRESHOLD,
+        "routes": query_stats.snapshot(sort),
+    }
+
+
+@router.delete("/diagnostics/queries")
+def reset_query_diagnostics(
+    admin: User = Depends(require_admin),
+):
+    """Clear the per-route query aggregates."""
+    query_stats.reset()
+    return {"reset": True}
+
+
+@router.get("/diagnostics/db-pool")
+def get_db_pool_diagnostics(
+    admin: User = Depends(require_admin),
+):
+    """
+    Connection-pool usage for this worker: in-use / idle / overflow
+    connections, checkout wait percentiles and checkout timeouts, per engine.
+    """
+    return {
+        "pre_ping": settings.DB_POOL_PRE_PING,
+        "recycle_s": settings.DB_POOL_RECYCLE,
+        "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+        "pgbouncer_mode": settings.DB_PGBOUNCER_MODE,
+        "sync": db_pool.pool_status(engine.pool),
+        "async": db_pool.pool_status(async_engine.sync_engine.pool),
+        "read": db_pool.pool_status(read_engine.pool) if read_engine is not engine else None,
+    }
+
+
+@router.delete("/diagnostics/db-pool")
+def reset_db_pool_diagnostics(
+    admin: User = Depends(require_admin),
+):
+    """Clear the pool counters and wait samples (live connection counts are unaffected)."""
+    db_pool.reset()
+    return {"reset": True}
+
+
+@router.get("/diagnostics/startup")
+def get_startup_diagnostics(
+    admin: User = Depends(require_admin),
+):
+    """
+    How this worker's startup was spent: import time, migrations and each
+    warm-up step (steps overlap; start_ms is relative to the first import).
+    """
+    return {"mode": settings.STARTUP_MODE, **startup.timeline.snapshot()}
+
+
+# ─────────────── Bet archive ───────────────
+
+@router.get("/bets/archive")
+def get_bet_archive_status(
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Row counts of the hot `bets` and cold `bets_archive` tables, and the last archival run."""
+    return {
+        "enabled": settings.BETS_ARCHIVE_ENABLED,
+        "after_days": settings.BETS_ARCHIVE_AFTER_DAYS,
+        "tables": bet_archive.table_sizes(db),
+        "last_run": bet_archive.last_run or None,
+    }
+
+
+@router.post("/bets/archive")
+async def run_bet_archive(
+    older_than_days: int | None = Query(None, ge=0, description="Default BETS_ARCHIVE_AFTER_DAYS"),
+    admin: User = Depends(require_admin),
+):
+    """Move bets settled, replaced or voided more than `older_than_days` ago to the archive now."""
+    return await asyncio.to_thread(bet_archive.archive_settled_bets, older_than_days)
+
+
+# ─────────────── Entity caches ───────────────
+
+@router.get("/cache")
+def get_cache_status(
+    admin: User = Depends(require_admin),
+):
+    """This worker's entity caches and the state of its invalidation listener."""
+    return cache_bus.snapshot()
+
+
+@router.delete("/cache")
+def clear_caches(
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Empty the entity caches on every worker."""
+    cache_bus.invalidate(db, cache_bus.ALL)
+    db.commit()
+    return {"cleared": True}
 
 
 # ─────────────── Fetch matches for tournament ───────────────
@@ -280,7 +538,8 @@ async def get_tournament_matches(
     stage: str | None = None,
     group: str | None = None,
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
 ):
     """
     Fetch matches from football-data.org for a tournament's competition.
@@ -292,22 +551,23 @@ async def get_tournament_matches(
     
     Returns live API data (not stored locally).
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
+    from app.services.football_api import FootballAPIError, fetch_matches_for_matchday
+
+    competition_id = await _competition_id_for(db, tournament_id)
 
     try:
         matches = await fetch_matches_for_matchday(
-            tournament.competition_id, 
+            competition_id, 
             matchday=matchday,
             stage=stage,
-            group=group
+            group=group,
+            client=client,
         )
     except FootballAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
     return {
-        "competition_id": tournament.competition_id,
+        "competition_id": competition_id,
         "tournament_id": tournament_id,
         "matchday": matchday,
         "stage": stage,
@@ -320,19 +580,27 @@ async def get_tournament_matches(
 async def get_tournament_season_info(
     tournament_id: str,
     admin: User = Depends(require_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    client=Depends(football_client),
 ):
     """
     Get season info for a tournament's competition from football-data.org.
     Includes: current_matchday, season dates, and available stages.
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
+    from app.services.football_api import (
+        FootballAPIError,
+        fetch_competition_stages,
+        fetch_competition_standings,
+    )
+
+    competition_id = await _competition_id_for(db, tournament_id)
 
     try:
-        standings = await fetch_competition_standings(tournament.competition_id)
-        stages = await fetch_competition_stages(tournament.competition_id)
+        # Both read /competitions/{id}; run together so they share one request
+        standings, stages = await asyncio.gather(
+            fetch_competition_standings(competition_id, client),
+            fetch_competition_stages(competition_id, client),
+        )
     except FootballAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
 
@@ -1,8 +1,8 @@
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 import jwt
 
 from app.config import settings
@@ -16,20 +16,11 @@ from app.schemas.auth import (
     ChangePasswordRequest,
 )
 from app.schemas.user import UserProfile
+from app.services.bet_archive import all_bets
+from app.services.passwords import hash_password, verify_password
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def _hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-
-def _verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
-
-
 def _create_access_token(user_id: str) -> str:
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.JWT_EXPIRE_MINUTES
@@ -44,7 +35,7 @@ def _create_access_token(user_id: str) -> str:
 def login(body: LoginRequest, db: Session = Depends(get_db)):
     """Authenticate with email and password, returns JWT."""
     user = db.query(User).filter(User.email == body.email).first()
-    if not user or not _verify_password(body.password, user.password_hash):
+    if not user or not verify_password(body.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -61,11 +52,17 @@ def login(body: LoginRequest, db: Session = Depends(get_db)):
 # ---------- Me ----------
 
 @router.get("/me", response_model=UserProfile)
-def get_me(current_user: User = Depends(get_current_user)):
+def get_me(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
     """Get the authenticated user's profile."""
-    total = len(current_user.bets)
-    won = sum(1 for b in current_user.bets if b.status == "won")
-    lost = sum(1 for b in current_user.bets if b.status == "lost")
+    bets = all_bets()
+    total, won, lost = db.query(
+        func.count(bets.id),
+        func.count(bets.id).filter(bets.status == "won"),
+        func.count(bets.id).filter(bets.status == "lost"),
+    ).filter(bets.user_id == current_user.id).one()
     win_rate = (won / total * 100) if total > 0 else 0.0
     return UserProfile(
         id=current_user.id,
@@ -91,12 +88,12 @@ def change_password(
     db: Session = Depends(get_db),
 ):
     """Let a user change their own password."""
-    if not _verify_password(body.current_password, current_user.password_hash):
+    if not verify_password(body.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
-    current_user.password_hash = _hash_password(body.new_password)
+    current_user.password_hash = hash_password(body.new_password)
     db.commit()
     return {"message": "Password changed successfully"}
 
@@ -126,7 +123,7 @@ def create_user(
     user = User(
         username=body.username,
         email=body.email,
-        password_hash=_hash_password(body.password),
+        password_hash=hash_password(body.password),
         balance=settings.DEFAULT_BALANCE,
         is_admin=body.is_admin,
     )
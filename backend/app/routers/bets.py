@@ -1,11 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, selectinload
+from datetime import datetime
 
-from app.dependencies import get_db, get_current_user, require_admin
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.dependencies import get_db, get_read_db, get_current_user, get_current_user_read, require_admin
 from app.models.user import User
 from app.models.bet import Bet
-from app.models.market import Selection
-from app.schemas.core import BetCreate, BetOut
+from app.models.market import Market, Selection
+from app.pagination import keyset_page
+from app.projections import bet_out_query
+from app.responses import respond
+from app.schemas.core import BetCreate, BetOut, BetPage, BET_PAGE
+from app.services.bet_archive import all_bets
 from app.services.betting import place_bet, BettingError
 
 router = APIRouter(tags=["Bets"])
@@ -24,60 +30,71 @@ def create_bet(
         bet = place_bet(db, current_user, body.selection_id, body.stake)
     except BettingError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    # Re-query with relationships loaded for response
-    bet = (
-        db.query(Bet)
-        .options(selectinload(Bet.selection).selectinload(Selection.market))
-        .filter(Bet.id == bet.id)
-        .first()
-    )
-    return bet
+    # Re-query with the selection and market fields flattened for the response
+    return bet_out_query(db).filter(Bet.id == bet.id).one()
 
 
 # ─────────────── User: My bets ───────────────
 
-@router.get("/bets/me", response_model=list[BetOut])
+@router.get("/bets/me", response_model=BetPage)
 def get_my_bets(
+    request: Request,
     status: str | None = Query(None, description="Filter: open, won, lost, voided"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    tournament_id: str | None = None,
+    market_type: str | None = None,
+    placed_from: datetime | None = None,
+    placed_to: datetime | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
-    """Get the current user's bets, optionally filtered by status."""
-    query = (
-        db.query(Bet)
-        .options(selectinload(Bet.selection).selectinload(Selection.market))
-        .filter(Bet.user_id == current_user.id)
-    )
+    """
+    Get the current user's bets, newest first, one page at a time.
+    Pass `next_cursor` from the previous response as `cursor` to fetch the next page.
+    """
+    # Open bets are never archived; everything else may be in either table
+    bets = Bet if status == "open" else all_bets()
+    query = bet_out_query(db, bets).filter(bets.user_id == current_user.id)
     if status:
-        query = query.filter(Bet.status == status)
+        query = query.filter(bets.status == status)
     else:
         # By default hide replaced bets — user only sees their latest per market
-        query = query.filter(Bet.status != "replaced")
-    return query.order_by(Bet.placed_at.desc()).all()
-
+        query = query.filter(bets.status != "replaced")
+    if tournament_id:
+        query = query.filter(Market.tournament_id == tournament_id)
+    if market_type:
+        query = query.filter(Market.market_type == market_type)
+    if placed_from:
+        query = query.filter(bets.placed_at >= placed_from)
+    if placed_to:
+        query = query.filter(bets.placed_at < placed_to)
+    rows, next_cursor = keyset_page(query, bets.placed_at, bets.id, limit, cursor)
+    return respond(request, BET_PAGE, {"items": rows, "next_cursor": next_cursor})
 
 
 # ─────────────── Admin: View bets on a market ───────────────
 
-@router.get("/admin/markets/{market_id}/bets", response_model=list[BetOut])
+@router.get("/admin/markets/{market_id}/bets", response_model=BetPage)
 def get_market_bets(
     market_id: str,
+    request: Request,
+    status: str | None = Query(None, description="Filter: open, won, lost, voided, replaced"),
+    placed_from: datetime | None = None,
+    placed_to: datetime | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Admin views all bets placed on a specific market (via its selections)."""
-    from app.models.market import Selection
-
-    selection_ids = [
-        s.id
-        for s in db.query(Selection).filter(Selection.market_id == market_id).all()
-    ]
-    if not selection_ids:
-        return []
-    return (
-        db.query(Bet)
-        .options(selectinload(Bet.selection).selectinload(Selection.market))
-        .filter(Bet.selection_id.in_(selection_ids))
-        .order_by(Bet.placed_at.desc())
-        .all()
-    )
+    """Admin views bets placed on a specific market (via its selections), one page at a time."""
+    bets = Bet if status == "open" else all_bets()
+    query = bet_out_query(db, bets).filter(Selection.market_id == market_id)
+    if status:
+        query = query.filter(bets.status == status)
+    if placed_from:
+        query = query.filter(bets.placed_at >= placed_from)
+    if placed_to:
+        query = query.filter(bets.placed_at < placed_to)
+    rows, next_cursor = keyset_page(query, bets.placed_at, bets.id, limit, cursor)
+    return respond(request, BET_PAGE, {"items": rows, "next_cursor": next_cursor})
@@ -1,16 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime
 
-from app.dependencies import get_db, get_current_user, require_admin
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session, selectinload
+
+from app.dependencies import get_db, get_read_db, get_current_user_read, require_admin
 from app.models.user import User
 from app.models.event import Event
 from app.models.market import Market, Selection
-from app.models.bet import Bet
+from app.models.bet import Bet, BetArchive
 from app.models.tournament import Tournament
-from app.schemas.core import EventCreate, EventUpdate, EventOut
+from app.pagination import keyset_page
+from app.projections import EVENT_OUT, MARKET_OUT, bet_out_query
+from app.responses import respond
+from app.schemas.core import (
+    EventCreate,
+    EventUpdate,
+    EventOut,
+    EventPage,
+    EventPageOut,
+    EVENT_PAGE,
+    EVENT_PAGE_OUT,
+)
+from app.services.cache_bus import EntityCache, entity_key, invalidate
+from app.services.trends import market_trends
 
 router = APIRouter(tags=["Events"])
 
+# Event details per worker, evicted on every worker when the event or its match changes
+event_cache = EntityCache("events")
+
 
 # ─────────────── Admin: Create event ───────────────
 
@@ -26,8 +44,7 @@ def create_event(
 ):
     """Admin creates a new event (match) within a tournament."""
     # Validate tournament exists
-    tournament = db.query(Tournament).filter(Tournament.id == body.tournament_id).first()
-    if not tournament:
+    if not db.query(Tournament.id).filter(Tournament.id == body.tournament_id).first():
         raise HTTPException(status_code=404, detail="Tournament not found")
 
     event = Event(
@@ -57,6 +74,7 @@ def update_event(
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     event.status = body.status
+    invalidate(db, entity_key("event", event.id))
     db.commit()
     db.refresh(event)
     return event
@@ -71,14 +89,32 @@ def delete_event(
     db: Session = Depends(get_db),
 ):
     """Admin deletes an event. Voids all open bets (refunds stakes),
-    then cascade-deletes markets, selections, and the event itself."""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    then cascade-deletes markets, selections, bets (archived ones too)
+    and the event itself."""
+    event = (
+        db.query(Event)
+        .options(
+            selectinload(Event.markets)
+            .selectinload(Market.selections)
+            .selectinload(Selection.bets)
+            .selectinload(Bet.user)
+        )
+        .filter(Event.id == event_id)
+        .first()
+    )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     voided_count = 0
     refunded_total = 0
 
+    # Archived bets are settled history only; nothing to refund
+    selection_ids = [s.id for m in event.markets for s in m.selections]
+    if selection_ids:
+        db.query(BetArchive).filter(BetArchive.selection_id.in_(selection_ids)).delete(
+            synchronize_session=False
+        )
+
     # For each market on this event, void open bets and refund
     for market in event.markets:
         for selection in market.selections:
@@ -92,6 +128,11 @@ def delete_event(
         db.delete(market)
 
     db.delete(event)
+    invalidate(
+        db,
+        entity_key("event", event.id),
+        *(entity_key("market", market.id) for market in event.markets),
+    )
     db.commit()
 
     return {
@@ -103,23 +144,30 @@ def delete_event(
 
 # ─────────────── Public: List events for tournament ───────────────
 
-@router.get("/tournaments/{tournament_id}/events", response_model=list[EventOut])
+@router.get("/tournaments/{tournament_id}/events", response_model=EventPage)
 def list_events(
     tournament_id: str,
+    request: Request,
     status: str | None = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    starts_from: datetime | None = None,
+    starts_to: datetime | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """
-    List all events for a tournament.
+    List events for a tournament, one page at a time.
     
     Query params:
     - status: Filter by status (upcoming, live, completed, cancelled)
               If not provided, defaults to showing upcoming + live only
+    - starts_from / starts_to: Only events kicking off in this range
+    - limit / cursor: Page size, and `next_cursor` from the previous page
     
     Ordered by creation date (newest first) so recently added matches appear first.
     """
-    query = db.query(Event).filter(Event.tournament_id == tournament_id)
+    query = db.query(Event).options(*EVENT_OUT).filter(Event.tournament_id == tournament_id)
     
     # Default filter: only show upcoming and live (hide completed/cancelled)
     if status:
@@ -127,9 +175,14 @@ def list_events(
     else:
         # Default: show only upcoming and live events
         query = query.filter(Event.status.in_(["upcoming", "live"]))
+    if starts_from:
+        query = query.filter(Event.starts_at >= starts_from)
+    if starts_to:
+        query = query.filter(Event.starts_at < starts_to)
     
     # Order by creation date (newest first) - recently added matches first
-    return query.order_by(Event.created_at.desc()).all()
+    events, next_cursor = keyset_page(query, Event.created_at, Event.id, limit, cursor)
+    return respond(request, EVENT_PAGE, {"items": events, "next_cursor": next_cursor})
 
 
 # ─────────────── Public: Get event detail ───────────────
@@ -137,12 +190,73 @@ def list_events(
 @router.get("/events/{event_id}", response_model=EventOut)
 def get_event(
     event_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_read),
+    # Cache misses read the primary: a lagging replica could refill a just-evicted entry
     db: Session = Depends(get_db),
 ):
-    """Get a single event with its details."""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    """Get a single event with its details (cached per worker)."""
+    def load():
+        event = db.query(Event).options(*EVENT_OUT).filter(Event.id == event_id).first()
+        return EventOut.model_validate(event) if event else None
+
+    event = event_cache.get_or_load(
+        entity_key("event", event_id),
+        load,
+        # The embedded match (status, kickoff) is written by the match poller and fixture sync
+        tags=lambda e: (f"match:{e.match_id}",) if e.match_id else (),
+    )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
     return event
 
+
+# ─────────────── Public: Event page (event + markets + trends + my bets) ───────────────
+
+@router.get("/events/{event_id}/page", response_model=EventPageOut)
+def get_event_page(
+    event_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Everything the event page shows in one round trip: the event, all its
+    markets with selections, betting trends per market and the caller's open
+    bets on those markets. Replaces GET /events/{id}, /events/{id}/markets,
+    one /markets/{id}/trends per market and /bets/me.
+
+    Five queries besides authentication, however many markets the event
+    has: event, markets, selections, open bets, one GROUP BY for the trends.
+    """
+    event = db.query(Event).options(*EVENT_OUT).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    markets = (
+        db.query(Market)
+        .options(*MARKET_OUT)
+        .filter(Market.event_id == event.id)
+        .order_by(Market.created_at.desc())
+        .all()
+    )
+
+    my_open_bets = []
+    if markets:
+        # Open bets are never archived, so the hot table is enough
+        my_open_bets = (
+            bet_out_query(db)
+            .filter(
+                Bet.user_id == current_user.id,
+                Bet.status == "open",
+                Selection.market_id.in_([m.id for m in markets]),
+            )
+            .order_by(Bet.placed_at.desc())
+            .all()
+        )
+
+    return respond(request, EVENT_PAGE_OUT, {
+        "event": event,
+        "markets": markets,
+        "trends": market_trends(db, markets),
+        "my_open_bets": my_open_bets,
+    })
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.orm import Session, joinedload, load_only
 
-from app.dependencies import get_db, get_current_user
+from app.dependencies import get_db, get_read_db, get_current_user, get_current_user_read
 from app.models.user import User
 from app.models.activity import ActivityFeed, Notification
-from app.schemas.core import ActivityOut, NotificationOut
+from app.responses import respond
+from app.schemas.core import ActivityOut, NotificationOut, ACTIVITY_LIST, NOTIFICATION_LIST
 
 router = APIRouter(tags=["Feed & Notifications"])
 
@@ -13,14 +14,16 @@ router = APIRouter(tags=["Feed & Notifications"])
 
 @router.get("/feed", response_model=list[ActivityOut])
 def get_feed(
+    request: Request,
     limit: int = Query(20, le=100),
     offset: int = Query(0, ge=0),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """Get the social activity feed — recent bets, settlements, etc."""
     activities = (
         db.query(ActivityFeed)
+        .options(joinedload(ActivityFeed.user).options(load_only(User.username)))
         .order_by(ActivityFeed.created_at.desc())
         .offset(offset)
         .limit(limit)
@@ -40,30 +43,32 @@ def get_feed(
             username=a.user.username if a.user else None,
         )
         result.append(out)
-    return result
+    return respond(request, ACTIVITY_LIST, result)
 
 
 # ─────────────── Notifications ───────────────
 
 @router.get("/notifications", response_model=list[NotificationOut])
 def get_notifications(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """Get the current user's notifications."""
-    return (
+    notifications = (
         db.query(Notification)
         .filter(Notification.user_id == current_user.id)
         .order_by(Notification.created_at.desc())
         .limit(50)
         .all()
     )
+    return respond(request, NOTIFICATION_LIST, notifications)
 
 
 @router.get("/notifications/unread-count")
 def get_unread_count(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """Get count of unread notifications."""
     count = (
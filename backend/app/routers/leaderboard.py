@@ -1,21 +1,23 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, get_current_user
+from app.dependencies import get_read_db, get_current_user_read
 from app.models.user import User
-from app.models.bet import Bet
 from app.models.market import Market, Selection
 from app.models.event import Event
-from app.schemas.core import LeaderboardEntry
+from app.responses import respond
+from app.schemas.core import LeaderboardEntry, LEADERBOARD
+from app.services.bet_archive import all_bets
 
 router = APIRouter(tags=["Leaderboard"])
 
 
 @router.get("/leaderboard", response_model=list[LeaderboardEntry])
 def global_leaderboard(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """Global leaderboard ranked by current coin balance."""
     users = (
@@ -25,12 +27,13 @@ def global_leaderboard(
         .all()
     )
 
+    bets = all_bets()
     result = []
     for rank, user in enumerate(users, start=1):
-        total_bets = db.query(func.count(Bet.id)).filter(Bet.user_id == user.id).scalar() or 0
+        total_bets = db.query(func.count(bets.id)).filter(bets.user_id == user.id).scalar() or 0
         won_bets = (
-            db.query(func.count(Bet.id))
-            .filter(Bet.user_id == user.id, Bet.status == "won")
+            db.query(func.count(bets.id))
+            .filter(bets.user_id == user.id, bets.status == "won")
             .scalar() or 0
         )
         result.append(
@@ -43,14 +46,15 @@ def global_leaderboard(
                 won_bets=won_bets,
             )
         )
-    return result
+    return respond(request, LEADERBOARD, result)
 
 
 @router.get("/leaderboard/{tournament_id}", response_model=list[LeaderboardEntry])
 def tournament_leaderboard(
     tournament_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """
     Per-tournament leaderboard showing profit/loss within that tournament.
@@ -88,12 +92,13 @@ def tournament_leaderboard(
 
     # Calculate per-user profit/loss
     users = db.query(User).filter(User.is_active == True, User.is_admin == False).all()
+    bets = all_bets()
     entries = []
 
     for user in users:
         user_bets = (
-            db.query(Bet)
-            .filter(Bet.user_id == user.id, Bet.selection_id.in_(selection_ids))
+            db.query(bets)
+            .filter(bets.user_id == user.id, bets.selection_id.in_(selection_ids))
             .all()
         )
         if not user_bets:
@@ -122,4 +127,4 @@ def tournament_leaderboard(
     for i, entry in enumerate(entries):
         entry.rank = i + 1
 
-    return entries
+    return respond(request, LEADERBOARD, entries)
@@ -1,21 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query as QueryParam, Request, status
+from sqlalchemy.orm import Query, Session, load_only, selectinload
 
-from app.dependencies import get_db, get_current_user, require_admin
+from app.dependencies import get_db, get_read_db, get_current_user_read, require_admin
 from app.models.user import User
 from app.models.market import Market, Selection
 from app.models.activity import ActivityFeed
+from app.pagination import keyset_page
+from app.projections import MARKET_OUT
+from app.responses import respond
 from app.schemas.core import (
     MarketCreate,
     MarketStatusUpdate,
     MarketOut,
+    MarketPage,
+    MarketTrends,
     SelectionUpdate,
     SettleMarketRequest,
+    MARKET_PAGE,
 )
 from app.services.betting import settle_market, void_market, BettingError
+from app.services.cache_bus import EntityCache, entity_key, invalidate
+from app.services.trends import market_trends
 
 router = APIRouter(tags=["Markets"])
 
+# Market details (status, odds) per worker, evicted on every worker when one changes
+market_cache = EntityCache("markets")
+
+
+def _market_out_query(db: Session) -> Query:
+    """Markets with exactly the columns and selections MarketOut serializes."""
+    return db.query(Market).options(*MARKET_OUT)
+
+
+def _filter_markets(query: Query, market_type: str | None, status: str | None) -> Query:
+    if market_type:
+        query = query.filter(Market.market_type == market_type)
+    if status:
+        query = query.filter(Market.status == status)
+    return query
+
 
 # ─────────────── Admin: Create market ───────────────
 
@@ -104,8 +128,7 @@ def create_market(
             ))
 
     db.commit()
-    db.refresh(market)
-    return market
+    return _market_out_query(db).filter(Market.id == market.id).first()
 
 
 # ─────────────── Admin: Update market status ───────────────
@@ -136,9 +159,9 @@ def update_market_status(
         )
 
     market.status = body.status
+    invalidate(db, entity_key("market", market.id))
     db.commit()
-    db.refresh(market)
-    return market
+    return _market_out_query(db).filter(Market.id == market.id).first()
 
 
 # ─────────────── Admin: Update selection odds ───────────────
@@ -163,6 +186,7 @@ def update_selection_odds(
         )
 
     selection.odds = body.odds
+    invalidate(db, entity_key("market", selection.market_id))
     db.commit()
     return {"message": "Odds updated", "new_odds": str(selection.odds)}
 
@@ -202,39 +226,49 @@ def void_market_endpoint(
 
 # ─────────────── Public: List markets for event ───────────────
 
-@router.get("/events/{event_id}/markets", response_model=list[MarketOut])
+@router.get("/events/{event_id}/markets", response_model=MarketPage)
 def list_event_markets(
     event_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    market_type: str | None = None,
+    status: str | None = QueryParam(None, description="Filter: coming_soon, open, locked, settled, voided"),
+    limit: int = QueryParam(50, ge=1, le=200),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
-    """List all markets for a specific event."""
-    return (
-        db.query(Market)
-        .filter(Market.event_id == event_id)
-        .order_by(Market.created_at.desc())
-        .all()
+    """List markets for a specific event, newest first, one page at a time."""
+    query = _filter_markets(
+        _market_out_query(db).filter(Market.event_id == event_id), market_type, status
     )
+    markets, next_cursor = keyset_page(query, Market.created_at, Market.id, limit, cursor)
+    return respond(request, MARKET_PAGE, {"items": markets, "next_cursor": next_cursor})
 
 
 # ─────────────── Public: List tournament markets ───────────────
 
-@router.get("/tournaments/{tournament_id}/markets", response_model=list[MarketOut])
+@router.get("/tournaments/{tournament_id}/markets", response_model=MarketPage)
 def list_tournament_markets(
     tournament_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    market_type: str | None = None,
+    status: str | None = QueryParam(None, description="Filter: coming_soon, open, locked, settled, voided"),
+    limit: int = QueryParam(50, ge=1, le=200),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
-    """List tournament-level markets (winner, golden boot, etc.)."""
-    return (
-        db.query(Market)
-        .filter(
+    """List tournament-level markets (winner, golden boot, etc.), one page at a time."""
+    query = _filter_markets(
+        _market_out_query(db).filter(
             Market.tournament_id == tournament_id,
             Market.event_id.is_(None),  # only top-level tournament markets
-        )
-        .order_by(Market.created_at.desc())
-        .all()
+        ),
+        market_type,
+        status,
     )
+    markets, next_cursor = keyset_page(query, Market.created_at, Market.id, limit, cursor)
+    return respond(request, MARKET_PAGE, {"items": markets, "next_cursor": next_cursor})
 
 
 # ─────────────── Public: Get market detail ───────────────
@@ -242,11 +276,16 @@ def list_tournament_markets(
 @router.get("/markets/{market_id}", response_model=MarketOut)
 def get_market(
     market_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_read),
+    # Cache misses read the primary: a lagging replica could refill a just-evicted entry
     db: Session = Depends(get_db),
 ):
-    """Get a single market with all its selections."""
-    market = db.query(Market).filter(Market.id == market_id).first()
+    """Get a single market with all its selections (cached per worker)."""
+    def load():
+        market = _market_out_query(db).filter(Market.id == market_id).first()
+        return MarketOut.model_validate(market) if market else None
+
+    market = market_cache.get_or_load(entity_key("market", market_id), load)
     if not market:
         raise HTTPException(status_code=404, detail="Market not found")
     return market
@@ -254,9 +293,14 @@ def get_market(
 
 # ─────────────── Admin: List ALL markets for tournament ───────────────
 
-@router.get("/admin/tournaments/{tournament_id}/all-markets", response_model=list[MarketOut])
+@router.get("/admin/tournaments/{tournament_id}/all-markets", response_model=MarketPage)
 def list_all_tournament_markets(
     tournament_id: str,
+    request: Request,
+    market_type: str | None = None,
+    status: str | None = QueryParam(None, description="Filter: coming_soon, open, locked, settled, voided"),
+    limit: int = QueryParam(50, ge=1, le=200),
+    cursor: str | None = None,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
@@ -265,76 +309,33 @@ def list_all_tournament_markets(
     - Tournament-level markets (winner, top scorer, etc.)
     - All event/match-level markets
     
-    Sorted by creation date (newest first).
+    Sorted by creation date (newest first), one page at a time.
     """
-    return (
-        db.query(Market)
-        .filter(Market.tournament_id == tournament_id)
-        .order_by(Market.created_at.desc())
-        .all()
+    query = _filter_markets(
+        _market_out_query(db).filter(Market.tournament_id == tournament_id), market_type, status
     )
+    markets, next_cursor = keyset_page(query, Market.created_at, Market.id, limit, cursor)
+    return respond(request, MARKET_PAGE, {"items": markets, "next_cursor": next_cursor})
 
 
 # ─────────────── Public: Get betting trends for a market ───────────────
 
-@router.get("/markets/{market_id}/trends")
+@router.get("/markets/{market_id}/trends", response_model=MarketTrends)
 def get_market_trends(
     market_id: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get betting trends for a market - shows percentage of bets on each selection.
-    Returns: { selection_id, label, percentage, bet_count, total_bets }
+    Returns: { market_id, total_bets, trends: [{ selection_id, label, percentage, bet_count }] }
     """
-    market = db.query(Market).filter(Market.id == market_id).first()
+    market = (
+        db.query(Market)
+        .options(load_only(Market.id), selectinload(Market.selections).load_only(Selection.id, Selection.label))
+        .filter(Market.id == market_id)
+        .first()
+    )
     if not market:
         raise HTTPException(status_code=404, detail="Market not found")
-    
-    # Count total bets on this market (via selections)
-    from app.models.bet import Bet
-    
-    total_bets = (
-        db.query(Bet)
-        .join(Selection)
-        .filter(Selection.market_id == market_id)
-        .count()
-    )
-    
-    if total_bets == 0:
-        # No bets yet - return 0% for all
-        return {
-            "market_id": market_id,
-            "total_bets": 0,
-            "trends": [
-                {
-                    "selection_id": str(sel.id),
-                    "label": sel.label,
-                    "percentage": 0,
-                    "bet_count": 0,
-                }
-                for sel in market.selections
-            ],
-        }
-    
-    # Count bets per selection
-    trends = []
-    for sel in market.selections:
-        bet_count = (
-            db.query(Bet)
-            .filter(Bet.selection_id == sel.id)
-            .count()
-        )
-        percentage = round((bet_count / total_bets) * 100, 1)
-        trends.append({
-            "selection_id": str(sel.id),
-            "label": sel.label,
-            "percentage": percentage,
-            "bet_count": bet_count,
-        })
-    
-    return {
-        "market_id": market_id,
-        "total_bets": total_bets,
-        "trends": trends,
-    }
+    return market_trends(db, [market])[0]
@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
 
-from app.dependencies import get_db, get_current_user, require_admin
+from app.dependencies import get_db, get_read_db, get_current_user_read, require_admin
 from app.models.user import User
 from app.models.tournament import Tournament
-from app.schemas.core import TournamentCreate, TournamentUpdate, TournamentOut
+from app.pagination import keyset_page
+from app.projections import TOURNAMENT_OUT
+from app.responses import respond
+from app.schemas.core import TournamentCreate, TournamentUpdate, TournamentOut, TournamentPage, TOURNAMENT_PAGE
+from app.services.cache_bus import EntityCache, entity_key, invalidate
 
 router = APIRouter(tags=["Tournaments"])
 
+# Tournament details per worker, evicted on every worker when one changes
+tournament_cache = EntityCache("tournaments")
+
 
 # ─────────────── Admin: Create tournament ───────────────
 
@@ -46,6 +53,7 @@ def update_tournament(
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
     tournament.status = body.status
+    invalidate(db, entity_key("tournament", tournament.id))
     db.commit()
     db.refresh(tournament)
     return tournament
@@ -53,17 +61,27 @@ def update_tournament(
 
 # ─────────────── Public: List tournaments ───────────────
 
-@router.get("/tournaments", response_model=list[TournamentOut])
+@router.get("/tournaments", response_model=TournamentPage)
 def list_tournaments(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    status: str | None = Query(None, description="Filter: upcoming, active, completed"),
+    competition_id: int | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
-    """List all tournaments."""
-    return (
-        db.query(Tournament)
-        .order_by(Tournament.created_at.desc())
-        .all()
-    )
+    """
+    List tournaments, newest first, one page at a time.
+    Pass `next_cursor` from the previous response as `cursor` to fetch the next page.
+    """
+    query = db.query(Tournament).options(*TOURNAMENT_OUT)
+    if status:
+        query = query.filter(Tournament.status == status)
+    if competition_id is not None:
+        query = query.filter(Tournament.competition_id == competition_id)
+    tournaments, next_cursor = keyset_page(query, Tournament.created_at, Tournament.id, limit, cursor)
+    return respond(request, TOURNAMENT_PAGE, {"items": tournaments, "next_cursor": next_cursor})
 
 
 # ─────────────── Public: Get tournament detail ───────────────
@@ -71,11 +89,21 @@ def list_tournaments(
 @router.get("/tournaments/{tournament_id}", response_model=TournamentOut)
 def get_tournament(
     tournament_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_read),
+    # Cache misses read the primary: a lagging replica could refill a just-evicted entry
     db: Session = Depends(get_db),
 ):
-    """Get a single tournament with its details."""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    """Get a single tournament with its details (cached per worker)."""
+    def load():
+        tournament = (
+            db.query(Tournament)
+            .options(*TOURNAMENT_OUT)
+            .filter(Tournament.id == tournament_id)
+            .first()
+        )
+        return TournamentOut.model_validate(tournament) if tournament else None
+
+    tournament = tournament_cache.get_or_load(entity_key("tournament", tournament_id), load)
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
     return tournament
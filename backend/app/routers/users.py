@@ -1,31 +1,145 @@
+import uuid
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, or_, tuple_
 
-from app.dependencies import get_db, get_current_user, require_admin
+from app.dependencies import get_db, get_read_db, get_async_db, get_current_user_read, require_admin
 from app.models.user import User
 from app.models.activity import ActivityFeed
-from app.models.bet import Bet
 from app.models.market import Market, Selection
 from app.models.event import Event
 from app.models.tournament import Tournament
-from app.schemas.user import UserListItem, UserProfile, AdjustBalanceRequest
+from app.pagination import encode_cursor, decode_cursor, escape_like
+from app.schemas.user import (
+    UserListItem,
+    UserListPage,
+    UserTotals,
+    UserProfile,
+    AdjustBalanceRequest,
+    UserImportReport,
+)
+from app.services.bet_archive import all_bets
+from app.services.user_import import import_users, UserImportError
 
 router = APIRouter(tags=["Users"])
 
 
 # ---------- Admin: List all users ----------
 
-@router.get("/admin/users", response_model=list[UserListItem])
+@router.get("/admin/users", response_model=UserListPage)
 def list_users(
+    q: str | None = Query(None, min_length=1, max_length=100, description="Search username or email"),
+    is_active: bool | None = None,
+    is_admin: bool | None = None,
+    min_balance: int | None = None,
+    max_balance: int | None = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
     admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Admin lists all user accounts."""
-    users = db.query(User).order_by(User.created_at.desc()).all()
-    return users
+    """
+    Admin lists user accounts, newest first, one page at a time.
+
+    Only the UserListItem columns are selected, so the user's bets, activities
+    and notifications are never loaded. Pass `next_cursor` from the previous
+    response as `cursor` to fetch the next page.
+    """
+    query = db.query(
+        User.id,
+        User.username,
+        User.email,
+        User.balance,
+        User.is_admin,
+        User.is_active,
+        User.created_at,
+    )
+
+    if q:
+        pattern = f"%{escape_like(q)}%"
+        query = query.filter(
+            or_(
+                User.username.ilike(pattern, escape="\\"),
+                User.email.ilike(pattern, escape="\\"),
+            )
+        )
+    if is_active is not None:
+        query = query.filter(User.is_active == is_active)
+    if is_admin is not None:
+        query = query.filter(User.is_admin == is_admin)
+    if min_balance is not None:
+        query = query.filter(User.balance >= min_balance)
+    if max_balance is not None:
+        query = query.filter(User.balance <= max_balance)
+
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor, datetime, uuid.UUID)
+        query = query.filter(
+            tuple_(User.created_at, User.id) < tuple_(last_created_at, last_id)
+        )
+
+    # Fetch one extra row to know whether another page exists
+    rows = (
+        query.order_by(User.created_at.desc(), User.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    return UserListPage(
+        items=[UserListItem.model_validate(r) for r in rows],
+        next_cursor=next_cursor,
+    )
+
+
+# ---------- Admin: User totals ----------
+
+@router.get("/admin/users/totals", response_model=UserTotals)
+def get_user_totals(
+    admin: User = Depends(require_admin),
+    db: Session = Depends(get_read_db),
+):
+    """Admin dashboard figures over every account, in one aggregate query."""
+    total_users, active_users, total_balance = db.query(
+        func.count(User.id),
+        func.count(User.id).filter(User.is_active.is_(True)),
+        func.coalesce(func.sum(User.balance), 0),
+    ).one()
+    return UserTotals(
+        total_users=total_users,
+        active_users=active_users,
+        total_balance=total_balance,
+    )
+
+
+# ---------- Admin: Bulk import users ----------
+
+@router.post("/admin/users/import", response_model=UserImportReport)
+async def import_users_endpoint(
+    request: Request,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Admin bulk-imports user accounts from a streamed request body.
+
+    Send `Content-Type: text/csv` (header row with username, email, password
+    and optional is_admin) or `application/x-ndjson` (one JSON object per
+    line). Returns a per-row report of created, duplicate and invalid rows.
+    """
+    try:
+        return await import_users(
+            db, request.stream(), request.headers.get("content-type", "")
+        )
+    except UserImportError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 # ---------- Admin: Adjust balance ----------
@@ -102,8 +216,8 @@ def activate_user(
 
 @router.get("/users/me/stats")
 def get_user_stats(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get detailed stats for the current user:
@@ -113,13 +227,14 @@ def get_user_stats(
     - Betting patterns
     """
     user_id = current_user.id
+    bets = all_bets()
     
     # Last 30 days win rate
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
     
     recent_bets = (
-        db.query(Bet)
-        .filter(Bet.user_id == user_id, Bet.placed_at >= thirty_days_ago)
+        db.query(bets)
+        .filter(bets.user_id == user_id, bets.placed_at >= thirty_days_ago)
         .all()
     )
     
@@ -128,15 +243,17 @@ def get_user_stats(
     recent_win_rate = (won_recent / total_recent * 100) if total_recent > 0 else 0
     
     # All-time stats
-    all_bets = db.query(Bet).filter(Bet.user_id == user_id).all()
-    total_bets = len(all_bets)
-    won_bets = sum(1 for b in all_bets if b.status == "won")
-    lost_bets = sum(1 for b in all_bets if b.status == "lost")
+    # All-time stats, aggregated in SQL so archived history is never loaded
+    total_bets, won_bets, lost_bets, total_staked, total_won = db.query(
+        func.count(bets.id),
+        func.count(bets.id).filter(bets.status == "won"),
+        func.count(bets.id).filter(bets.status == "lost"),
+        func.coalesce(func.sum(bets.stake), 0),
+        func.coalesce(func.sum(bets.potential_payout).filter(bets.status == "won"), 0),
+    ).filter(bets.user_id == user_id).one()
     all_time_win_rate = (won_bets / total_bets * 100) if total_bets > 0 else 0
     
     # Calculate total staked and total won
-    total_staked = sum(b.stake for b in all_bets)
-    total_won = sum(b.potential_payout for b in all_bets if b.status == "won")
     total_profit = total_won - total_staked
     
     # Daily P/L for last 30 days (for chart)
@@ -174,21 +291,22 @@ def get_user_stats(
 
 @router.get("/users/me/streak")
 def get_user_streak(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get current winning streak for the user.
     Returns current streak count and best streak ever.
     """
     # Get all settled bets ordered by settlement time
+    bets = all_bets()
     settled_bets = (
-        db.query(Bet)
+        db.query(bets)
         .filter(
-            Bet.user_id == current_user.id,
-            Bet.status.in_(["won", "lost"])
+            bets.user_id == current_user.id,
+            bets.status.in_(["won", "lost"])
         )
-        .order_by(Bet.settled_at.desc())
+        .order_by(bets.settled_at.desc())
         .all()
     )
     
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ───────────────────────── Football API sync ─────────────────────────
@@ -9,9 +9,26 @@ from pydantic import BaseModel, Field, model_validator
 class SyncSummary(BaseModel):
     created: int = 0
     updated: int = 0
+    unchanged: int = 0  # content hash matched; row not rewritten
     skipped: int = 0
 
 
+class SquadSyncJobOut(BaseModel):
+    id: str
+    tournament_id: str
+    competition_id: int
+    status: str  # running | completed | failed | cancelled
+    teams_total: int
+    teams_done: int
+    teams_failed: int
+    created: int
+    updated: int
+    unchanged: int
+    errors: dict[int, str] = {}  # team_id -> error message
+    started_at: datetime
+    finished_at: datetime | None = None
+
+
 # ───────────────────────── Competition ─────────────────────────
 
 class CompetitionOut(BaseModel):
@@ -90,6 +107,11 @@ class TournamentOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TournamentPage(BaseModel):
+    items: list[TournamentOut]
+    next_cursor: str | None = None  # pass back as ?cursor= to fetch the next page
+
+
 # ───────────────────────── Event ─────────────────────────
 
 class EventCreate(BaseModel):
@@ -118,6 +140,11 @@ class EventOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class EventPage(BaseModel):
+    items: list[EventOut]
+    next_cursor: str | None = None  # pass back as ?cursor= to fetch the next page
+
+
 # ───────────────────────── Selection ─────────────────────────
 
 class SelectionCreate(BaseModel):
@@ -170,6 +197,26 @@ class MarketOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class MarketPage(BaseModel):
+    items: list[MarketOut]
+    next_cursor: str | None = None  # pass back as ?cursor= to fetch the next page
+
+
+# ───────────────────────── Market trends ─────────────────────────
+
+class SelectionTrend(BaseModel):
+    selection_id: uuid.UUID
+    label: str
+    percentage: float
+    bet_count: int
+
+
+class MarketTrends(BaseModel):
+    market_id: uuid.UUID
+    total_bets: int
+    trends: list[SelectionTrend]
+
+
 # ───────────────────────── Bet ─────────────────────────
 
 class BetCreate(BaseModel):
@@ -186,36 +233,27 @@ class BetOut(BaseModel):
     status: str
     placed_at: datetime
     settled_at: datetime | None = None
-    # Flattened from relationships for frontend convenience
+    # Flattened from the selection and its market in SQL (projections.bet_out_query)
     selection_label: str | None = None
     market_question: str | None = None
     odds: float | None = None
 
     model_config = {"from_attributes": True}
 
-    @model_validator(mode="before")
-    @classmethod
-    def flatten_selection(cls, data):
-        """Extract selection label, odds, and market question from ORM relationships."""
-        # Handle SQLAlchemy ORM objects - convert to dict with flattened fields
-        if hasattr(data, "__dict__") and hasattr(data, "selection"):
-            sel = data.selection
-            result = {
-                "id": data.id,
-                "user_id": data.user_id,
-                "selection_id": data.selection_id,
-                "stake": data.stake,
-                "potential_payout": data.potential_payout,
-                "status": data.status,
-                "placed_at": data.placed_at,
-                "settled_at": data.settled_at,
-                "selection_label": sel.label if sel else None,
-                "odds": float(sel.odds) if sel else None,
-                "market_question": sel.market.question if sel and hasattr(sel, "market") and sel.market else None,
-            }
-            return result
-        return data
 
+class BetPage(BaseModel):
+    items: list[BetOut]
+    next_cursor: str | None = None  # pass back as ?cursor= to fetch the next page
+
+
+# ───────────────────────── Event page ─────────────────────────
+
+class EventPageOut(BaseModel):
+    """Everything the event page renders, in one response (GET /events/{id}/page)."""
+    event: EventOut
+    markets: list[MarketOut]
+    trends: list[MarketTrends]  # one per market, same order
+    my_open_bets: list[BetOut]  # the caller's open bets on these markets
 
 
 # ───────────────────────── Settlement ─────────────────────────
@@ -262,3 +300,22 @@ class LeaderboardEntry(BaseModel):
     total_bets: int = 0
     won_bets: int = 0
     profit: int = 0  # for tournament-specific leaderboard
+
+
+# ───────────────────────── List adapters ─────────────────────────
+# Built once at import; list and page endpoints serialize straight to JSON bytes
+# through these (app.responses.respond) instead of per-request validation
+# plus the stdlib encoder.
+
+COMPETITION_LIST = TypeAdapter(list[CompetitionOut])
+TEAM_LIST = TypeAdapter(list[TeamOut])
+PLAYER_LIST = TypeAdapter(list[PlayerOut])
+TOURNAMENT_PAGE = TypeAdapter(TournamentPage)
+EVENT_PAGE = TypeAdapter(EventPage)
+MARKET_PAGE = TypeAdapter(MarketPage)
+BET_LIST = TypeAdapter(list[BetOut])
+BET_PAGE = TypeAdapter(BetPage)
+EVENT_PAGE_OUT = TypeAdapter(EventPageOut)
+ACTIVITY_LIST = TypeAdapter(list[ActivityOut])
+NOTIFICATION_LIST = TypeAdapter(list[NotificationOut])
+LEADERBOARD = TypeAdapter(list[LeaderboardEntry])
@@ -31,6 +31,34 @@ class UserListItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class UserListPage(BaseModel):
+    items: list[UserListItem]
+    next_cursor: str | None = None  # pass back as ?cursor= to fetch the next page
+
+
+class UserTotals(BaseModel):
+    total_users: int
+    active_users: int
+    total_balance: int  # coins in circulation
+
+
 class AdjustBalanceRequest(BaseModel):
     amount: int  # positive to add, negative to deduct
     reason: str = ""
+
+
+class UserImportRowResult(BaseModel):
+    row: int  # 1-based data row (CSV header not counted)
+    username: str | None = None
+    email: str | None = None
+    # status: created | duplicate | invalid | failed
+    status: str
+    detail: str | None = None
+
+
+class UserImportReport(BaseModel):
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    rows: list[UserImportRowResult] = []
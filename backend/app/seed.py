@@ -8,9 +8,7 @@ Usage:
 
 from app.database import SessionLocal, init_db
 from app.models.user import User
-from passlib.context import CryptContext
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.services.passwords import hash_password, hash_passwords, shutdown_pool
 
 
 def seed():
@@ -28,7 +26,7 @@ def seed():
     admin = User(
         username="admin",
         email="admin@mailinator.com",
-        password_hash=pwd_context.hash("admin@123"),
+        password_hash=hash_password("admin@123"),
         balance=999999,
         is_admin=True,
     )
@@ -46,11 +44,12 @@ def seed():
     ("fenilK", "fenilK@mailinator.com", "fenilK@123"),
     ]
 
-    for username, email, password in sample_users:
+    hashes = hash_passwords([password for _, _, password in sample_users])
+    for (username, email, _), password_hash in zip(sample_users, hashes):
         user = User(
             username=username,
             email=email,
-            password_hash=pwd_context.hash(password),
+            password_hash=password_hash,
             balance=1000,
             is_admin=False,
         )
@@ -58,6 +57,7 @@ def seed():
 
     db.commit()
     db.close()
+    shutdown_pool()
     print("Seed complete: 1 admin + 8 users created.")
     print("Admin login: admin@mailinator.com / admin@123")
 
@@ -0,0 +1,256 @@
+"""
+Record / replay transports for the football-data.org client.
+
+FOOTBALL_API_TRANSPORT selects how app.services.football_api reaches the
+API:
+
+- live:   straight to the network (default).
+- record: to the network, and every 200 response is written to the
+          fixtures directory as one JSON file per request.
+- replay: no network at all; responses are served from the fixtures
+          directory with configurable latency and injected failures.
+
+Fixture files mirror the request path, e.g. `competitions/2021/matches.json`,
+with any query string folded into the file name
+(`competitions/2021/matches@dateFrom=2025-01-01&dateTo=2025-01-03.json`).
+When an exact query fixture is missing, replay answers a filtered
+`/competitions/{id}/matches` request from the unfiltered season file, so
+matchday, stage, group, status and date-window calls work offline.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+from datetime import date, timedelta
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MODES = ("live", "record", "replay")
+
+# Only headers a replayed response can sensibly carry; quota headers are
+# dropped so a recorded "0 requests left" can't throttle replay runs.
+KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+BUNDLED_FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "fixtures",
+    "football_api",
+)
+
+
+def fixture_relpath(url: httpx.URL, base_path: str = "") -> str:
+    """Fixture file path (relative to the fixtures dir) for a request URL."""
+    path = url.path
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path):]
+    name = path.strip("/") or "index"
+    params = sorted(parse_qsl(url.query.decode()))
+    if params:
+        name += "@" + urlencode(params)
+    return name + ".json"
+
+
+def _json_response(status_code: int, body: dict, headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(
+        status_code,
+        headers={"content-type": "application/json", **(headers or {})},
+        content=json.dumps(body).encode(),
+    )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests to `inner` and save each successful response as a fixture."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, fixtures_dir: str, base_path: str = ""):
+        self.inner = inner
+        self.fixtures_dir = fixtures_dir
+        self.base_path = base_path
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        resp = await self.inner.handle_async_request(request)
+        if resp.status_code != 200:
+            return resp
+
+        # Read the (decoded) body so it can be saved and handed back
+        raw = httpx.Response(resp.status_code, headers=resp.headers, stream=resp.stream)
+        content = await raw.aread()
+        await raw.aclose()
+        headers = {k: v for k, v in resp.headers.items() if k.lower() in KEPT_HEADERS}
+        try:
+            body = json.loads(content)
+        except ValueError:
+            logger.warning("Not recording non-JSON response for %s", request.url)
+        else:
+            await asyncio.to_thread(self._write, request.url, headers, body)
+
+        passthrough = {
+            k: v for k, v in resp.headers.items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+        return httpx.Response(resp.status_code, headers=passthrough, content=content)
+
+    def _write(self, url: httpx.URL, headers: dict, body: dict) -> None:
+        path = os.path.join(self.fixtures_dir, fixture_relpath(url, self.base_path))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"status": 200, "headers": headers, "body": body}, f, indent=1)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serve recorded fixtures without touching the network.
+
+    - latency / jitter: seconds added to every response (uniform jitter).
+    - error_rate: fraction of requests (0-1) answered with an injected
+      failure, picked from `error_kinds`: an HTTP status such as "503" or
+      "429", or "timeout" / "connect" to raise the matching httpx error.
+    - seed: makes latency and error injection reproducible across runs.
+
+    Responses carry an ETag derived from the body and honour If-None-Match,
+    so cache revalidation behaves as it does against the real API.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: str,
+        base_path: str = "",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_kinds: tuple[str, ...] = ("503",),
+        seed: int | None = None,
+    ):
+        self.fixtures_dir = fixtures_dir
+        self.base_path = base_path
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_kinds = error_kinds or ("503",)
+        self._random = random.Random(seed)
+        self._fixtures: dict[str, dict | None] = {}
+        self.served = 0
+        self.injected_errors = 0
+        self.missing = 0
+
+    def _load(self, relpath: str) -> dict | None:
+        if relpath not in self._fixtures:
+            path = os.path.join(self.fixtures_dir, relpath)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    fixture = json.load(f)
+            except FileNotFoundError:
+                fixture = None
+            if fixture is not None and not fixture.get("headers", {}).get("etag"):
+                digest = hashlib.sha256(json.dumps(fixture["body"], sort_keys=True).encode())
+                fixture.setdefault("headers", {})["etag"] = f'"{digest.hexdigest()[:32]}"'
+            self._fixtures[relpath] = fixture
+        return self._fixtures[relpath]
+
+    def _find(self, url: httpx.URL) -> dict | None:
+        fixture = self._load(fixture_relpath(url, self.base_path))
+        if fixture is not None or not url.query:
+            return fixture
+        # Filtered match list: derive it from the full season file
+        base = self._load(fixture_relpath(url.copy_with(query=None), self.base_path))
+        if base is None or "matches" not in base.get("body", {}):
+            return None
+        matches = _filter_matches(base["body"]["matches"], dict(parse_qsl(url.query.decode())))
+        body = {**base["body"], "matches": matches, "resultSet": {"count": len(matches)}}
+        return {"status": 200, "headers": {}, "body": body}
+
+    def _inject_error(self, request: httpx.Request) -> httpx.Response | None:
+        if self.error_rate <= 0 or self._random.random() >= self.error_rate:
+            return None
+        self.injected_errors += 1
+        kind = self._random.choice(self.error_kinds)
+        if kind == "timeout":
+            raise httpx.ReadTimeout("Injected replay timeout", request=request)
+        if kind == "connect":
+            raise httpx.ConnectError("Injected replay connection failure", request=request)
+        status = int(kind)
+        headers = {"Retry-After": "1"} if status == 429 else {}
+        return _json_response(status, {"message": "Injected replay error", "errorCode": status}, headers)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        injected = self._inject_error(request)
+        if injected is not None:
+            return injected
+
+        fixture = await asyncio.to_thread(self._find, request.url)
+        if fixture is None:
+            self.missing += 1
+            logger.warning("No replay fixture for %s", request.url)
+            return _json_response(
+                404, {"message": f"No fixture recorded for {request.url.path}", "errorCode": 404}
+            )
+
+        self.served += 1
+        headers = {k: v for k, v in fixture.get("headers", {}).items() if k.lower() in KEPT_HEADERS}
+        etag = headers.get("etag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return _json_response(fixture.get("status", 200), fixture["body"], headers)
+
+    def stats(self) -> dict:
+        return {
+            "fixtures_dir": self.fixtures_dir,
+            "served": self.served,
+            "injected_errors": self.injected_errors,
+            "missing": self.missing,
+        }
+
+
+def _filter_matches(matches: list[dict], params: dict) -> list[dict]:
+    """Apply football-data.org's /matches query filters to a recorded list."""
+    result = matches
+    if "matchday" in params:
+        result = [m for m in result if str(m.get("matchday")) == params["matchday"]]
+    if "stage" in params:
+        result = [m for m in result if m.get("stage") == params["stage"]]
+    if "group" in params:
+        result = [m for m in result if m.get("group") == params["group"]]
+    if "status" in params:
+        wanted = set(params["status"].split(","))
+        result = [m for m in result if m.get("status") in wanted]
+    if "dateFrom" in params and "dateTo" in params:
+        start = date.fromisoformat(params["dateFrom"]).isoformat()
+        # dateTo is inclusive; compare against the start of the following day
+        end = (date.fromisoformat(params["dateTo"]) + timedelta(days=1)).isoformat()
+        result = [m for m in result if start <= (m.get("utcDate") or "") < end]
+    return result
+
+
+def build_transport(
+    mode: str,
+    live_factory: Callable[[], httpx.AsyncBaseTransport],
+    fixtures_dir: str | None = None,
+    base_path: str = "",
+    **replay_options,
+) -> httpx.AsyncBaseTransport | None:
+    """
+    Transport for the given mode; None for live (the caller then uses
+    `live_factory` directly). `live_factory` builds the network transport
+    that record mode wraps.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown football API transport mode '{mode}'. Use one of {MODES}.")
+    fixtures_dir = fixtures_dir or BUNDLED_FIXTURES_DIR
+    if mode == "record":
+        return RecordingTransport(live_factory(), fixtures_dir, base_path)
+    if mode == "replay":
+        return ReplayTransport(fixtures_dir, base_path, **replay_options)
+    return None
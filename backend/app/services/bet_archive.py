@@ -0,0 +1,147 @@
+"""
+Hot/cold split of bet history.
+
+`bets` keeps open bets and recently settled ones. A background task moves
+bets that were settled, replaced or voided more than BETS_ARCHIVE_AFTER_DAYS
+ago into `bets_archive`, in batches of BETS_ARCHIVE_BATCH_SIZE, each batch
+copied and deleted in one transaction. Settlement, voiding and place_bet
+only ever look at open bets, so they never need the archive and their
+indexes stay the size of the live book rather than of all history.
+
+Reads that need a user's whole history (bets/me, stats, streak, profile
+counts, leaderboards, trends) query all_bets(): Bet aliased over
+`bets UNION ALL bets_archive`. PostgreSQL pushes the WHERE clause into both
+branches, so each side is served by its own (user_id, placed_at) index.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from functools import cache
+
+from sqlalchemy import delete, func, insert, literal, select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.bet import Bet, BetArchive
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_STATUSES = ("won", "lost", "replaced", "voided")
+COLUMNS = [c.name for c in Bet.__table__.columns]
+
+_task: asyncio.Task | None = None
+last_run: dict = {}
+
+
+@cache
+def all_bets():
+    """
+    Bet mapped over hot and archived rows, for read-only queries:
+
+        bets = all_bets()
+        db.query(bets).filter(bets.user_id == user_id)
+
+    Rows come back as Bet instances (relationships such as .selection load
+    as usual). Never modify or delete them; archived bets do not exist in
+    the `bets` table.
+    """
+    hot = Bet.__table__
+    cold = BetArchive.__table__
+    union = union_all(
+        select(*(hot.c[name] for name in COLUMNS)),
+        select(*(cold.c[name] for name in COLUMNS)),
+    ).subquery("all_bets")
+    return aliased(Bet, union, name="all_bets")
+
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int) -> int:
+    """Move up to `batch_size` bets settled before `cutoff` to the archive. Returns the number moved."""
+    ids_query = (
+        select(Bet.id)
+        .where(Bet.status.in_(ARCHIVED_STATUSES), Bet.settled_at < cutoff)
+        .order_by(Bet.settled_at)
+        .limit(batch_size)
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        # Another worker archiving at the same time takes the next rows
+        ids_query = ids_query.with_for_update(skip_locked=True)
+    ids = db.execute(ids_query).scalars().all()
+    if not ids:
+        return 0
+
+    hot = Bet.__table__
+    db.execute(
+        insert(BetArchive).from_select(
+            COLUMNS + ["archived_at"],
+            select(*(hot.c[name] for name in COLUMNS), literal(datetime.now(timezone.utc)))
+            .where(hot.c.id.in_(ids)),
+        )
+    )
+    db.execute(delete(hot).where(hot.c.id.in_(ids)))
+    db.commit()
+    return len(ids)
+
+
+def archive_settled_bets(older_than_days: int | None = None) -> dict:
+    """Archive every bet settled more than `older_than_days` (default BETS_ARCHIVE_AFTER_DAYS) ago."""
+    days = settings.BETS_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
+    batch_size = settings.BETS_ARCHIVE_BATCH_SIZE
+
+    archived = 0
+    with SessionLocal() as db:
+        while True:
+            moved = archive_batch(db, cutoff, batch_size)
+            archived += moved
+            if moved < batch_size:
+                break
+
+    last_run.update({
+        "at": now.isoformat(),
+        "cutoff": cutoff.isoformat(),
+        "archived": archived,
+    })
+    if archived:
+        logger.info("Archived %d bets settled before %s", archived, cutoff.date())
+    return dict(last_run)
+
+
+def table_sizes(db: Session) -> dict:
+    """Row counts of the hot and cold tables."""
+    return {
+        "hot": db.scalar(select(func.count()).select_from(Bet.__table__)),
+        "open": db.scalar(select(func.count()).select_from(Bet.__table__).where(Bet.status == "open")),
+        "archived": db.scalar(select(func.count()).select_from(BetArchive.__table__)),
+    }
+
+
+async def _run() -> None:
+    while True:
+        try:
+            await asyncio.to_thread(archive_settled_bets)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Bet archival run failed")
+        await asyncio.sleep(settings.BETS_ARCHIVE_INTERVAL)
+
+
+def start() -> None:
+    """Start the archival task (called from the app lifespan)."""
+    global _task
+    if _task is None:
+        _task = asyncio.create_task(_run())
+
+
+async def stop() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
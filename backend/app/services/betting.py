@@ -7,12 +7,13 @@ import math
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.models.user import User
 from app.models.market import Market, Selection
 from app.models.bet import Bet
 from app.models.activity import ActivityFeed
+from app.services.cache_bus import entity_key, invalidate
 
 logger = logging.getLogger(__name__)
 
@@ -135,7 +136,12 @@ def settle_market(db: Session, market_id, winning_selection_id) -> dict:
 
     Returns a summary dict.
     """
-    market = db.query(Market).filter(Market.id == market_id).first()
+    market = (
+        db.query(Market)
+        .options(selectinload(Market.selections).selectinload(Selection.bets))
+        .filter(Market.id == market_id)
+        .first()
+    )
     if not market:
         raise BettingError("Market not found")
 
@@ -199,6 +205,7 @@ def settle_market(db: Session, market_id, winning_selection_id) -> dict:
         )
     )
 
+    invalidate(db, entity_key("market", market.id))
     db.commit()
     return {
         "winners_paid": winners_paid,
@@ -211,7 +218,12 @@ def void_market(db: Session, market_id) -> dict:
     """
     Void a market: refund all stakes to users, mark all bets as voided.
     """
-    market = db.query(Market).filter(Market.id == market_id).first()
+    market = (
+        db.query(Market)
+        .options(selectinload(Market.selections).selectinload(Selection.bets))
+        .filter(Market.id == market_id)
+        .first()
+    )
     if not market:
         raise BettingError("Market not found")
 
@@ -251,5 +263,6 @@ def void_market(db: Session, market_id) -> dict:
         )
     )
 
+    invalidate(db, entity_key("market", market.id))
     db.commit()
     return {"refunded_count": refunded_count, "total_refunded": total_refunded}
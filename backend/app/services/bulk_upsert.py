@@ -0,0 +1,203 @@
+"""
+Bulk upsert helpers for the football-data.org sync endpoints.
+
+Rows are written with multi-row `INSERT ... ON CONFLICT DO UPDATE`
+statements, one per batch, and Postgres reports whether each row was
+inserted or updated through `RETURNING (xmax = 0)` — a freshly inserted
+tuple has no deleting transaction id. A full season of fixtures becomes a
+handful of statements instead of one SELECT + INSERT/UPDATE per row.
+
+With `hash_column` set, each row carries a content hash of its mapped
+payload. Stored hashes are compared in one SELECT per batch and rows whose
+hash is unchanged are not written at all (no WAL, no synced_at bump).
+
+The `*_async` variants run the same statements on an AsyncSession
+(asyncpg) so async routes never block the event loop on Postgres.
+
+SQLite has the same ON CONFLICT / RETURNING syntax but no xmax, so there
+the keys of a batch that already exist are looked up first and every row
+the upsert returns for another key counts as created.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Iterable
+
+from sqlalchemy import Table, literal_column, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+BATCH_SIZE = 1000
+
+
+@dataclass
+class UpsertResult:
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0  # stored content hash already matched
+    skipped: int = 0  # conflicting rows the `where` guard chose not to update
+
+
+# Bookkeeping columns excluded from the content hash
+UNHASHED_COLUMNS = {"synced_at"}
+
+
+def content_hash(row: dict, exclude: set[str] = frozenset()) -> str:
+    """Stable sha256 of a row's mapped values (key order independent)."""
+    payload = {k: v for k, v in row.items() if k not in UNHASHED_COLUMNS and k not in exclude}
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _batches(rows: list[dict], size: int) -> Iterable[list[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _insert(db: Session, table: Table):
+    """An INSERT supporting ON CONFLICT for the session's dialect."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"Bulk upsert is not supported on {dialect}")
+
+
+def _keys(table: Table, batch: list[dict], index_elements: list[str]):
+    """The key columns, an expression to match them with IN, and each row's key."""
+    key_cols = [table.c[k] for k in index_elements]
+    key_expr = key_cols[0] if len(key_cols) == 1 else tuple_(*key_cols)
+    keys = [
+        r[index_elements[0]] if len(key_cols) == 1 else tuple(r[k] for k in index_elements)
+        for r in batch
+    ]
+    return key_cols, key_expr, keys
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: list[dict],
+    index_elements: list[str] | None = None,
+    update_columns: list[str] | None = None,
+    where=None,
+    hash_column: str | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> UpsertResult:
+    """
+    Insert or update `rows` (dicts of column values) into `model`'s table.
+
+    - index_elements: conflict target, defaults to the primary key.
+    - update_columns: columns overwritten on conflict, defaults to every
+      supplied column except the conflict target.
+    - where: optional guard on the existing row (e.g. a sync cooldown);
+      conflicting rows that fail it are left untouched and counted as skipped.
+    - hash_column: column storing content_hash(row); rows whose stored hash
+      matches are counted as unchanged and not written.
+    """
+    result = UpsertResult()
+    if not rows:
+        return result
+
+    table: Table = model.__table__ if hasattr(model, "__table__") else model
+    index_elements = index_elements or [c.name for c in table.primary_key.columns]
+    if hash_column:
+        rows = [{**r, hash_column: content_hash(r, exclude={hash_column})} for r in rows]
+    if update_columns is None:
+        update_columns = [k for k in rows[0] if k not in index_elements]
+    elif hash_column and hash_column not in update_columns:
+        update_columns = [*update_columns, hash_column]
+
+    # A row may not be touched twice by one ON CONFLICT statement; last one wins
+    rows = list({tuple(r[k] for k in index_elements): r for r in rows}.values())
+
+    for batch in _batches(rows, batch_size):
+        if hash_column:
+            batch = _drop_unchanged(db, table, batch, index_elements, hash_column, result)
+            if not batch:
+                continue
+
+        stmt = _insert(db, table).values(batch)
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={col: stmt.excluded[col] for col in update_columns},
+                where=where,
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=index_elements)
+
+        if db.get_bind().dialect.name == "postgresql":
+            stmt = stmt.returning(literal_column("(xmax = 0)").label("inserted"))
+            flags = db.execute(stmt).scalars().all()
+        else:
+            key_cols, key_expr, keys = _keys(table, batch, index_elements)
+            existing = {
+                row[0] if len(key_cols) == 1 else tuple(row)
+                for row in db.execute(select(*key_cols).where(key_expr.in_(keys)))
+            }
+            flags = [
+                (row[0] if len(key_cols) == 1 else tuple(row)) not in existing
+                for row in db.execute(stmt.returning(*key_cols))
+            ]
+        created = sum(1 for inserted in flags if inserted)
+        result.created += created
+        result.updated += len(flags) - created
+        result.skipped += len(batch) - len(flags)
+
+    return result
+
+
+def _drop_unchanged(
+    db: Session,
+    table: Table,
+    batch: list[dict],
+    index_elements: list[str],
+    hash_column: str,
+    result: UpsertResult,
+) -> list[dict]:
+    """Return the rows of `batch` whose stored hash differs (or that are new)."""
+    key_cols, key_expr, keys = _keys(table, batch, index_elements)
+    stored = {
+        (row[0] if len(key_cols) == 1 else tuple(row[:-1])): row[-1]
+        for row in db.execute(
+            select(*key_cols, table.c[hash_column]).where(key_expr.in_(keys))
+        )
+    }
+
+    changed = []
+    for key, row in zip(keys, batch):
+        if stored.get(key) == row[hash_column]:
+            result.unchanged += 1
+        else:
+            changed.append(row)
+    return changed
+
+
+def bulk_insert_ignore(
+    db: Session,
+    table: Table,
+    rows: list[dict],
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Insert rows, silently skipping ones that already exist. Returns rows inserted."""
+    inserted = 0
+    for batch in _batches(rows, batch_size):
+        stmt = _insert(db, table).values(batch).on_conflict_do_nothing()
+        inserted += db.execute(stmt).rowcount or 0
+    return inserted
+
+
+async def bulk_upsert_async(db: AsyncSession, model, rows: list[dict], **kwargs) -> UpsertResult:
+    """bulk_upsert() on an AsyncSession; same arguments after `rows`."""
+    return await db.run_sync(bulk_upsert, model, rows, **kwargs)
+
+
+async def bulk_insert_ignore_async(
+    db: AsyncSession, table: Table, rows: list[dict], batch_size: int = BATCH_SIZE
+) -> int:
+    """bulk_insert_ignore() on an AsyncSession."""
+    return await db.run_sync(bulk_insert_ignore, table, rows, batch_size)
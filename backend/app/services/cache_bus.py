@@ -0,0 +1,276 @@
+"""
+In-process entity caches with cross-worker invalidation over PostgreSQL
+LISTEN/NOTIFY.
+
+Read endpoints keep response objects per entity key ("market:<uuid>") in an
+EntityCache in each worker. Writers call invalidate(db, *keys) before they
+commit. On PostgreSQL that queues a NOTIFY on CHANNEL inside the
+transaction, so it is delivered only if the transaction commits, and every
+worker's listener evicts those keys. The writing worker also evicts them
+itself as soon as its commit returns (Session after_commit), without waiting
+for the round trip.
+
+The listener runs from the app lifespan on a dedicated asyncpg connection,
+not a pooled one. LISTEN is session state, which PgBouncer in transaction
+pooling mode does not keep, so when DATABASE_URL goes through such a pooler
+CACHE_BUS_DATABASE_URL must point at Postgres directly. NOTIFY itself is an
+ordinary statement and works through any pooler. Replicas never see
+notifications, so the listener always uses the primary.
+
+Caches only serve while an invalidation cannot be missed: on PostgreSQL
+that means while the listener is connected. They are cleared whenever it
+(re)connects. On SQLite there is a single process and local eviction is
+enough. CACHE_TTL bounds the life of every entry regardless, for reference
+data written outside the bus.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable
+
+import asyncpg
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import direct_dsn, engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+ALL = "*"  # key that clears every cache
+KEYS_PER_NOTIFY = 100  # keeps each payload well under Postgres' 8000-byte limit
+_PENDING = "cache_bus_pending"  # Session.info key: evictions waiting for commit
+
+_caches: list["EntityCache"] = []
+_task: asyncio.Task | None = None
+state = {
+    "listening": False,
+    "connects": 0,
+    "notifications": 0,
+    "evicted": 0,
+    "last_error": None,
+}
+
+
+def entity_key(kind: str, entity_id) -> str | None:
+    """Canonical cache key for a UUID entity, or None if `entity_id` is not a UUID."""
+    try:
+        return f"{kind}:{uuid.UUID(str(entity_id))}"
+    except ValueError:
+        return None
+
+
+def active() -> bool:
+    """Whether caches may serve: enabled, and no invalidation can be missed."""
+    if not settings.CACHE_ENABLED:
+        return False
+    return state["listening"] or engine.dialect.name != "postgresql"
+
+
+class EntityCache:
+    """
+    Per-worker TTL + LRU cache of response objects keyed by entity key.
+    An entry can also carry tags (other entity keys it was built from);
+    evicting a tag evicts the entry.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._entries: OrderedDict[str, tuple[float, object, tuple[str, ...]]] = OrderedDict()
+        self._tagged: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        # Bumped on every eviction; a load that overlapped one is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        _caches.append(self)
+
+    def get_or_load(
+        self,
+        key: str | None,
+        load: Callable[[], object],
+        tags: Callable[[object], tuple] | None = None,
+    ):
+        """
+        The cached value for `key`, or load() stored under it. A None from
+        load() (not found) is returned but not cached.
+        """
+        if key is None or not active():
+            return load()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            generation = self._generation
+
+        value = load()
+        if value is None:
+            return None
+        entry_tags = tuple(tags(value)) if tags else ()
+        with self._lock:
+            # An invalidation landed while loading: the value may predate it
+            if self._generation == generation:
+                self._discard(key)
+                self._entries[key] = (now + settings.CACHE_TTL, value, entry_tags)
+                for tag in entry_tags:
+                    self._tagged.setdefault(tag, set()).add(key)
+                while len(self._entries) > settings.CACHE_MAX_ENTRIES:
+                    self._discard(next(iter(self._entries)))
+        return value
+
+    def _discard(self, key: str) -> int:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return 0
+        for tag in entry[2]:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+        return 1
+
+    def evict(self, keys) -> int:
+        evicted = 0
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                evicted += self._discard(key)
+                for tagged in list(self._tagged.get(key, ())):
+                    evicted += self._discard(tagged)
+        return evicted
+
+    def clear(self) -> int:
+        with self._lock:
+            self._generation += 1
+            cleared = len(self._entries)
+            self._entries.clear()
+            self._tagged.clear()
+        return cleared
+
+    def stats(self) -> dict:
+        return {"name": self.name, "entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def evict(keys) -> int:
+    """Evict `keys` (and entries tagged with them) from this worker's caches."""
+    keys = set(keys)
+    if ALL in keys:
+        evicted = sum(cache.clear() for cache in _caches)
+    else:
+        evicted = sum(cache.evict(keys) for cache in _caches)
+    state["evicted"] += evicted
+    return evicted
+
+
+# ─────────────── Publishing ───────────────
+
+def invalidate(db: Session, *keys: str | None) -> None:
+    """
+    Evict `keys` from every worker's caches once `db`'s transaction commits.
+    Call before db.commit(); nothing is evicted if it rolls back.
+    """
+    keys = sorted({key for key in keys if key})
+    if not keys or not settings.CACHE_ENABLED:
+        return
+    db.info.setdefault(_PENDING, set()).update(keys)
+    if db.get_bind().dialect.name == "postgresql":
+        for i in range(0, len(keys), KEYS_PER_NOTIFY):
+            db.execute(select(func.pg_notify(CHANNEL, " ".join(keys[i:i + KEYS_PER_NOTIFY]))))
+
+
+async def invalidate_async(db: AsyncSession, *keys: str | None) -> None:
+    await db.run_sync(invalidate, *keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed(session: Session) -> None:
+    keys = session.info.pop(_PENDING, None)
+    if keys:
+        evict(keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+# ─────────────── Listener ───────────────
+
+def _on_notify(connection, pid: int, channel: str, payload: str) -> None:
+    state["notifications"] += 1
+    evict(payload.split())
+
+
+async def _listen() -> None:
+    backoff = 1.0
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(direct_dsn(), timeout=10)
+            await conn.add_listener(CHANNEL, _on_notify)
+            # Writes made while nobody was listening may be cached: start empty
+            evict([ALL])
+            state.update(listening=True, last_error=None)
+            state["connects"] += 1
+            backoff = 1.0
+            while True:
+                await asyncio.sleep(settings.CACHE_BUS_PING_INTERVAL)
+                # A silently dropped connection would never deliver again
+                await conn.fetchval("SELECT 1", timeout=10)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Cache invalidation listener disconnected: %s", e)
+            state["last_error"] = str(e)
+        finally:
+            state["listening"] = False
+            if conn is not None:
+                conn.terminate()
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, 30.0)
+
+
+def snapshot() -> dict:
+    return {
+        "enabled": settings.CACHE_ENABLED,
+        "active": active(),
+        "channel": CHANNEL,
+        **state,
+        "caches": [cache.stats() for cache in _caches],
+    }
+
+
+def start() -> None:
+    """Start the invalidation listener (called from the app lifespan; PostgreSQL only)."""
+    global _task
+    if _task is not None or engine.dialect.name != "postgresql":
+        return
+    if settings.DB_PGBOUNCER_MODE and not settings.CACHE_BUS_DATABASE_URL:
+        logger.warning(
+            "DB_PGBOUNCER_MODE is on but CACHE_BUS_DATABASE_URL is not set; LISTEN needs a "
+            "direct connection, so in-process caches stay off"
+        )
+        return
+    _task = asyncio.create_task(_listen())
+
+
+async def stop() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -6,18 +6,57 @@ the external API directly. Data is mapped to internal Pydantic schemas before
 being returned to the caller.
 """
 
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
 import logging
-from datetime import datetime, timezone
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from enum import IntEnum
 
 import httpx
 
 from app.config import settings
+from app.services.api_transport import build_transport, ReplayTransport, MODES as TRANSPORT_MODES
+from app.services.response_cache import ResponseCache, CachedResponse
+from app.services.staleness import mark_stale
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = settings.FOOTBALL_API_BASE_URL
 HEADERS = {"X-Auth-Token": settings.FOOTBALL_API_KEY}
-TIMEOUT = 15.0  # seconds
+TIMEOUT = settings.FOOTBALL_API_TIMEOUT  # seconds
+MAX_RATE_LIMIT_RETRIES = 2
+STALE_FALLBACK_TIMEOUT = settings.FOOTBALL_API_STALE_FALLBACK_TIMEOUT  # seconds
+
+TRANSPORT_MODE = settings.FOOTBALL_API_TRANSPORT.lower()
+if TRANSPORT_MODE not in TRANSPORT_MODES:
+    raise ValueError(
+        f"FOOTBALL_API_TRANSPORT must be one of {TRANSPORT_MODES}, got '{settings.FOOTBALL_API_TRANSPORT}'"
+    )
+REPLAYING = TRANSPORT_MODE == "replay"
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pooled client per process, opened/closed by app.main.lifespan
+_client: httpx.AsyncClient | None = None
+
+# On-disk response cache (None when disabled) and single-flight registry
+# (replay runs get their own file so fixture bodies never leak into live use).
+_cache_path = settings.FOOTBALL_API_CACHE_PATH
+if REPLAYING:
+    _cache_path = "{0}.replay{1}".format(*os.path.splitext(_cache_path))
+response_cache: ResponseCache | None = (
+    ResponseCache(_cache_path) if settings.FOOTBALL_API_CACHE_ENABLED else None
+)
+_inflight: dict[str, asyncio.Task] = {}
 
 
 class FootballAPIError(Exception):
@@ -25,36 +64,498 @@ class FootballAPIError(Exception):
     pass
 
 
-async def _get(path: str) -> dict:
-    """Make a GET request to football-data.org and return parsed JSON."""
-    url = f"{BASE_URL}{path}"
-    async with httpx.AsyncClient(timeout=TIMEOUT) as client:
+class CircuitOpenError(FootballAPIError):
+    """Raised without calling upstream while the circuit breaker is open."""
+    pass
+
+
+# ─────────────── Quota-aware request scheduler ───────────────
+
+
+class Priority(IntEnum):
+    """Lower value is served first when callers queue for quota."""
+    INTERACTIVE = 0  # admin clicking around the panel
+    BACKGROUND = 1  # bulk syncs and pollers
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    "football_api_priority", default=Priority.INTERACTIVE
+)
+
+QUEUE_TIMEOUTS = {
+    Priority.INTERACTIVE: settings.FOOTBALL_API_INTERACTIVE_QUEUE_TIMEOUT,
+    Priority.BACKGROUND: settings.FOOTBALL_API_BACKGROUND_QUEUE_TIMEOUT,
+}
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority):
+    """Run the enclosed fetcher calls at the given priority, e.g. for background syncs."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RequestScheduler:
+    """
+    Token bucket pacing calls against football-data.org's per-minute and
+    per-day quotas. Callers wait in a priority queue (interactive before
+    background, FIFO within a class) until a token is free or their deadline
+    passes. The server's own X-Requests-Available-Minute / Retry-After
+    headers override our local estimate whenever they are seen.
+    """
+
+    def __init__(self, per_minute: int, per_day: int):
+        self.per_minute = per_minute  # 0 = unpaced (replay mode)
+        self.per_day = per_day  # 0 = no daily cap
+        self._tokens = float(per_minute)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0  # monotonic time; set by 429s / exhausted headers
+        self._day = datetime.now(timezone.utc).date()
+        self._day_used = 0
+        self._server_available: int | None = None
+        self._waiters: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = asyncio.Condition()
+        self.throttled_total = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._refilled_at
+        self._tokens = min(self.per_minute, self._tokens + elapsed * self.per_minute / 60.0)
+        self._refilled_at = now
+        today = datetime.now(timezone.utc).date()
+        if today != self._day:
+            self._day = today
+            self._day_used = 0
+
+    def _seconds_until_available(self, now: float) -> float:
+        """How long until one token can be spent (0 if now)."""
+        if self.per_day and self._day_used >= self.per_day:
+            midnight = datetime.combine(
+                self._day + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc
+            )
+            return (midnight - datetime.now(timezone.utc)).total_seconds()
+        wait = max(0.0, self._blocked_until - now)
+        if self.per_minute and self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) * 60.0 / self.per_minute)
+        return wait
+
+    async def acquire(self, priority: Priority, timeout: float) -> None:
+        """Wait for a request slot, raising FootballAPIError if `timeout` elapses first."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        entry = (int(priority), next(self._seq))
+        async with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    wait = self._seconds_until_available(now)
+                    if self._waiters[0] == entry and wait <= 0:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= 1
+                        self._day_used += 1
+                        self._cond.notify_all()
+                        return
+                    remaining = deadline - loop.time()
+                    if remaining <= 0 or (self._waiters[0] == entry and wait > remaining):
+                        self.throttled_total += 1
+                        raise FootballAPIError(
+                            f"football-data.org quota exhausted; next slot in {wait:.0f}s. "
+                            "Try again later."
+                        )
+                    # Head of queue sleeps until its slot; others until woken
+                    sleep_for = min(wait, remaining) if self._waiters[0] == entry else remaining
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), timeout=max(sleep_for, 0.01))
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                    self._cond.notify_all()
+
+    def observe(self, resp: httpx.Response) -> None:
+        """Reconcile the local bucket with the quota headers on a response."""
+        now = time.monotonic()
+        reset = _header_seconds(resp, "X-RequestCounter-Reset")
+        available = resp.headers.get("X-Requests-Available-Minute")
+        if available is not None and available.isdigit():
+            self._server_available = int(available)
+            self._refill(now)
+            self._tokens = min(self._tokens, float(self._server_available))
+            if self._server_available == 0 and reset:
+                self._blocked_until = max(self._blocked_until, now + reset)
+        if resp.status_code == 429:
+            retry_after = _header_seconds(resp, "Retry-After") or reset or 60.0
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def snapshot(self) -> dict:
+        """Current quota state for the admin quota endpoint."""
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "per_minute_limit": self.per_minute or None,
+            "per_day_limit": self.per_day or None,
+            "minute_tokens_available": int(self._tokens) if self.per_minute else None,
+            "server_reported_available_minute": self._server_available,
+            "day_used": self._day_used,
+            "day_remaining": max(self.per_day - self._day_used, 0) if self.per_day else None,
+            "blocked_for_seconds": round(max(0.0, self._blocked_until - now), 1),
+            "queued": len(self._waiters),
+            "throttled_total": self.throttled_total,
+        }
+
+
+def _header_seconds(resp: httpx.Response, name: str) -> float | None:
+    """Parse a header holding a number of seconds; None if absent or malformed."""
+    value = resp.headers.get(name)
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# Replayed fixtures cost no quota, so offline benchmarks run unpaced
+scheduler = RequestScheduler(
+    per_minute=0 if REPLAYING else settings.FOOTBALL_API_REQUESTS_PER_MINUTE,
+    per_day=0 if REPLAYING else settings.FOOTBALL_API_REQUESTS_PER_DAY,
+)
+
+
+# ─────────────── Circuit breaker & stale fallback ───────────────
+
+
+class CircuitBreaker:
+    """
+    Classic closed → open → half-open breaker. After `failure_threshold`
+    consecutive upstream failures (network errors, timeouts, 5xx) calls fail
+    fast for `reset_timeout` seconds; then a single trial call is let through
+    and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.opened_total = 0
+
+    def seconds_until_retry(self) -> float:
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call must not reach upstream."""
+        if self.state == "open":
+            if self.seconds_until_retry() > 0:
+                raise CircuitOpenError(
+                    "football-data.org is unavailable (circuit open); "
+                    f"retrying in {self.seconds_until_retry():.0f}s."
+                )
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._trial_in_flight:
+                raise CircuitOpenError("football-data.org is recovering; trial call in progress.")
+            self._trial_in_flight = True
+
+    def cancel_trial(self) -> None:
+        """Release a half-open trial slot for a call that never reached upstream."""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._trial_in_flight = False
+        self.state = "closed"
+
+    def record_failure(self) -> None:
+        self._trial_in_flight = False
+        self._failures += 1
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning("football-data.org circuit opened after %d failures", self._failures)
+                self.opened_total += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_in_seconds": round(self.seconds_until_retry(), 1),
+            "opened_total": self.opened_total,
+        }
+
+
+breaker = CircuitBreaker(
+    failure_threshold=settings.FOOTBALL_API_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.FOOTBALL_API_BREAKER_RESET_SECONDS,
+)
+
+_background: set[asyncio.Task] = set()
+_recovering: set[str] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """Run a background task, keeping a reference until it finishes."""
+    task = asyncio.ensure_future(coro)
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+def _schedule_recovery(path: str, client: httpx.AsyncClient) -> None:
+    """Refresh `path` in the background once the breaker allows a trial call."""
+    if path in _recovering or response_cache is None:
+        return
+    _recovering.add(path)
+
+    async def recover():
+        try:
+            await asyncio.sleep(breaker.seconds_until_retry())
+            with request_priority(Priority.BACKGROUND):
+                await _refresh(path, client, await response_cache.get(path))
+            logger.info("Refreshed stale football-data.org response for %s", path)
+        except FootballAPIError as e:
+            logger.info("Background refresh of %s failed: %s", path, e)
+        finally:
+            _recovering.discard(path)
+
+    _spawn(recover())
+
+
+# ─────────────── Shared HTTP client ───────────────
+
+
+def create_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    """
+    Build a keep-alive pooled client for football-data.org.
+    Pass `transport` (e.g. httpx.MockTransport) to substitute the network in tests;
+    otherwise FOOTBALL_API_TRANSPORT picks live, record or replay.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.FOOTBALL_API_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.FOOTBALL_API_MAX_KEEPALIVE,
+        keepalive_expiry=settings.FOOTBALL_API_KEEPALIVE_EXPIRY,
+    )
+    http2 = settings.FOOTBALL_API_HTTP2 and HTTP2_AVAILABLE
+
+    def live_transport() -> httpx.AsyncHTTPTransport:
+        # AsyncClient ignores its own limits/http2 once given a transport, so both go here
+        return httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+
+    if transport is None:
+        transport = build_transport(
+            TRANSPORT_MODE,
+            live_transport,
+            fixtures_dir=settings.FOOTBALL_API_FIXTURES_DIR or None,
+            base_path=httpx.URL(BASE_URL).path.rstrip("/"),
+            latency=settings.FOOTBALL_API_REPLAY_LATENCY,
+            jitter=settings.FOOTBALL_API_REPLAY_JITTER,
+            error_rate=settings.FOOTBALL_API_REPLAY_ERROR_RATE,
+            error_kinds=tuple(
+                k.strip() for k in settings.FOOTBALL_API_REPLAY_ERROR_KINDS.split(",") if k.strip()
+            ),
+            seed=settings.FOOTBALL_API_REPLAY_SEED,
+        ) or live_transport()
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers=HEADERS,
+        timeout=httpx.Timeout(TIMEOUT, connect=settings.FOOTBALL_API_CONNECT_TIMEOUT),
+        transport=transport,
+    )
+
+
+def transport_stats() -> dict:
+    """Transport mode, plus replay counters when serving fixtures."""
+    stats = {"mode": TRANSPORT_MODE}
+    transport = getattr(_client, "_transport", None)
+    if isinstance(transport, ReplayTransport):
+        stats.update(transport.stats())
+    return stats
+
+
+async def start_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    """Open the process-wide client. Called once from the app lifespan."""
+    global _client
+    if _client is None:
+        _client = create_client(transport)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the process-wide client and its pooled connections."""
+    global _client
+    for task in list(_background):
+        task.cancel()
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if response_cache is not None:
+        response_cache.close()
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    The shared client, created on first use. Routes get it through
+    app.routers.admin.football_client; override that in tests via
+    app.dependency_overrides to inject a mock transport.
+    """
+    global _client
+    if _client is None:
+        _client = create_client()
+    return _client
+
+
+async def _request(
+    path: str, client: httpx.AsyncClient, headers: dict | None = None
+) -> httpx.Response:
+    """
+    Send one GET through the circuit breaker and quota scheduler and return
+    the 200/304 response. A 429 is retried after Retry-After as long as the
+    caller's queue deadline allows; any other status raises FootballAPIError.
+    """
+    priority = _priority.get()
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        breaker.before_call()
         try:
-            resp = await client.get(url, headers=HEADERS)
+            await scheduler.acquire(priority, QUEUE_TIMEOUTS[priority])
+            resp = await client.get(path, headers=headers)
         except httpx.RequestError as e:
+            breaker.record_failure()
             raise FootballAPIError(f"Network error reaching football-data.org: {e}")
+        except (FootballAPIError, asyncio.CancelledError):
+            # Never reached upstream (quota wait gave up or caller went away)
+            breaker.cancel_trial()
+            raise
+        scheduler.observe(resp)
+
+        if resp.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
 
         if resp.status_code == 429:
-            raise FootballAPIError(
-                "Rate limit exceeded on football-data.org (100 requests/day). "
-                "Try again later."
-            )
-        if resp.status_code != 200:
+            logger.warning("football-data.org returned 429 for %s (attempt %d)", path, attempt + 1)
+            continue
+        if resp.status_code not in (200, 304):
             raise FootballAPIError(
                 f"football-data.org returned HTTP {resp.status_code}: {resp.text[:300]}"
             )
+        return resp
+
+    raise FootballAPIError(
+        "Rate limit exceeded on football-data.org after repeated retries. "
+        "Try again later."
+    )
+
+
+async def _refresh(path: str, client: httpx.AsyncClient, cached: CachedResponse | None) -> dict:
+    """Fetch `path` (conditionally when we hold validators) and update the cache."""
+    headers = {}
+    if cached and cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+
+    resp = await _request(path, client, headers or None)
+    if resp.status_code == 304 and cached:
+        response_cache.revalidated += 1
+        await response_cache.touch(path)
+        return cached.body
+    if resp.status_code == 304:
+        # 304 without anything to revalidate: refetch unconditionally
+        resp = await _request(path, client)
+
+    response_cache.misses += 1
+    body = resp.json()
+    await response_cache.put(path, CachedResponse(
+        body=body,
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+        fetched_at=time.time(),
+    ))
+    return body
+
+
+async def _get_cached(path: str, client: httpx.AsyncClient) -> dict:
+    """
+    Serve from the response cache, revalidating once the TTL expires.
+
+    When an expired entry exists and upstream fails, is circuit-broken, or
+    takes longer than STALE_FALLBACK_TIMEOUT, the last good body is returned
+    (flagged stale) and the refresh continues in the background.
+    """
+    if response_cache is None:
+        resp = await _request(path, client)
         return resp.json()
 
+    cached = await response_cache.get(path)
+    if cached and cached.age() < response_cache.ttl_for(path):
+        response_cache.hits += 1
+        return cached.body
+    if cached is None:
+        return await _refresh(path, client, None)
+
+    refresh = _spawn(_refresh(path, client, cached))
+    try:
+        return await asyncio.wait_for(asyncio.shield(refresh), STALE_FALLBACK_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.info("football-data.org slow for %s; serving stale copy", path)
+    except FootballAPIError as e:
+        logger.info("Serving stale copy of %s: %s", path, e)
+        _schedule_recovery(path, client)
+    mark_stale(path)
+    return cached.body
+
+
+async def _get(path: str, client: httpx.AsyncClient | None = None) -> dict:
+    """
+    Make a GET request to football-data.org and return parsed JSON.
+    Concurrent calls for the same path share one upstream request, run as
+    its own task so a cancelled caller does not cancel it for the others.
+    """
+    client = client or get_client()
+    fetch = _inflight.get(path)
+    if fetch is None:
+        fetch = _spawn(_get_cached(path, client))
+        _inflight[path] = fetch
+        fetch.add_done_callback(lambda _: _inflight.pop(path, None))
+    return await asyncio.shield(fetch)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """An aware datetime from an API timestamp such as '2024-08-16T19:00:00Z'."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_date(value: str | None) -> date | None:
+    """A date from an API date such as '1998-12-20' (any time part is dropped)."""
+    if not value:
+        return None
+    return date.fromisoformat(value[:10])
+
 
 # ─────────────── Public functions ───────────────
 
 
-async def fetch_competitions() -> list[dict]:
+async def fetch_competitions(client: httpx.AsyncClient | None = None) -> list[dict]:
     """
     Fetch all available competitions.
     Returns a list of dicts with keys: id, name, code, emblem_url.
     """
-    data = await _get("/competitions")
+    data = await _get("/competitions", client)
     result = []
     for comp in data.get("competitions", []):
         result.append({
@@ -66,12 +567,14 @@ async def fetch_competitions() -> list[dict]:
     return result
 
 
-async def fetch_teams_for_competition(competition_id: int) -> list[dict]:
+async def fetch_teams_for_competition(
+    competition_id: int, client: httpx.AsyncClient | None = None
+) -> list[dict]:
     """
     Fetch all teams in a competition.
     Returns a list of dicts with keys: id, name, short_name, crest_url.
     """
-    data = await _get(f"/competitions/{competition_id}/teams")
+    data = await _get(f"/competitions/{competition_id}/teams", client)
     result = []
     for team in data.get("teams", []):
         result.append({
@@ -83,22 +586,30 @@ async def fetch_teams_for_competition(competition_id: int) -> list[dict]:
     return result
 
 
-async def fetch_fixtures_for_competition(competition_id: int) -> list[dict]:
+async def fetch_fixtures_for_competition(
+    competition_id: int,
+    client: httpx.AsyncClient | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> list[dict]:
     """
-    Fetch all matches/fixtures for a competition.
+    Fetch all matches/fixtures for a competition, optionally limited to
+    kickoffs between date_from and date_to (inclusive, UTC dates).
     Returns a list of dicts with keys: id, home_team_id, away_team_id,
     kickoff_at, matchday, stage, status.
     """
-    data = await _get(f"/competitions/{competition_id}/matches")
+    path = f"/competitions/{competition_id}/matches"
+    if date_from and date_to:
+        path += f"?dateFrom={date_from.isoformat()}&dateTo={date_to.isoformat()}"
+    data = await _get(path, client)
     result = []
     for match in data.get("matches", []):
-        kickoff = match.get("utcDate")
         result.append({
             "id": match["id"],
             "competition_id": competition_id,
             "home_team_id": match.get("homeTeam", {}).get("id"),
             "away_team_id": match.get("awayTeam", {}).get("id"),
-            "kickoff_at": kickoff,
+            "kickoff_at": _parse_datetime(match.get("utcDate")),
             "matchday": match.get("matchday"),
             "stage": match.get("stage"),
             "status": match.get("status"),
@@ -106,12 +617,14 @@ async def fetch_fixtures_for_competition(competition_id: int) -> list[dict]:
     return result
 
 
-async def fetch_squad_for_team(team_id: int) -> list[dict]:
+async def fetch_squad_for_team(
+    team_id: int, client: httpx.AsyncClient | None = None
+) -> list[dict]:
     """
     Fetch the current squad for a team.
     Returns a list of dicts with keys: id, name, position, nationality, date_of_birth.
     """
-    data = await _get(f"/teams/{team_id}")
+    data = await _get(f"/teams/{team_id}", client)
     result = []
     for player in data.get("squad", []):
         result.append({
@@ -120,7 +633,7 @@ async def fetch_squad_for_team(team_id: int) -> list[dict]:
             "name": player["name"],
             "position": player.get("position"),
             "nationality": player.get("nationality"),
-            "date_of_birth": player.get("dateOfBirth"),
+            "date_of_birth": _parse_date(player.get("dateOfBirth")),
         })
     return result
 
@@ -129,7 +642,8 @@ async def fetch_matches_for_matchday(
     competition_id: int, 
     matchday: int | None = None,
     stage: str | None = None,
-    group: str | None = None
+    group: str | None = None,
+    client: httpx.AsyncClient | None = None,
 ) -> list[dict]:
     """
     Fetch all matches for a specific competition with optional filters.
@@ -155,7 +669,7 @@ async def fetch_matches_for_matchday(
     if query_string:
         url += f"?{query_string}"
     
-    data = await _get(url)
+    data = await _get(url, client)
     result = []
     for match in data.get("matches", []):
         home_team = match.get("homeTeam", {})
@@ -183,26 +697,30 @@ async def fetch_matches_for_matchday(
     return result
 
 
-async def fetch_competition_stages(competition_id: int) -> list[str]:
+async def fetch_competition_stages(
+    competition_id: int, client: httpx.AsyncClient | None = None
+) -> list[str]:
     """
     Fetch available stages for a competition from current season.
     Returns list of stage names like ['GROUP_STAGE', 'LAST_16', etc.]
     """
     try:
-        data = await _get(f"/competitions/{competition_id}")
+        data = await _get(f"/competitions/{competition_id}", client)
         current_season = data.get("currentSeason", {})
         return current_season.get("stages", [])
     except FootballAPIError:
         return []
 
 
-async def fetch_competition_standings(competition_id: int) -> dict | None:
+async def fetch_competition_standings(
+    competition_id: int, client: httpx.AsyncClient | None = None
+) -> dict | None:
     """
     Fetch current standings for a competition to get current matchday info.
     Returns dict with current_matchday or None if not available.
     """
     try:
-        data = await _get(f"/competitions/{competition_id}")
+        data = await _get(f"/competitions/{competition_id}", client)
         current_season = data.get("currentSeason", {})
         return {
             "current_matchday": current_season.get("currentMatchday"),
@@ -0,0 +1,228 @@
+"""
+Event-loop lag monitor — opt-in diagnostics (LOOP_MONITOR_ENABLED).
+
+A heartbeat task sleeps for a fixed interval and records how late it wakes
+up; that delay is time the loop spent running something else without
+yielding. A watchdog thread notices when the heartbeat is overdue by more
+than the threshold and snapshots the loop thread's stack *while it is still
+blocked*, so the offending code (a sync DB call in an async handler, a big
+json.dumps, ...) shows up directly in the report.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timezone
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_STACK_FRAMES = 25
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _format_stack(frame) -> tuple[list[str], str | None]:
+    """Formatted frames (outermost first) and the innermost app-code frame (else the innermost)."""
+    frames = traceback.extract_stack(frame)[-MAX_STACK_FRAMES:]
+    lines = [f"{f.filename}:{f.lineno} in {f.name}" for f in frames]
+    site = next(
+        (
+            f"{os.path.relpath(f.filename, os.path.dirname(APP_ROOT))}:{f.lineno} in {f.name}"
+            for f in reversed(frames)
+            if f.filename.startswith(APP_ROOT) and not f.filename.endswith("loop_monitor.py")
+        ),
+        lines[-1] if lines else None,
+    )
+    return lines, site
+
+
+class LoopMonitor:
+    """Measures event-loop lag and captures stacks of callbacks that block it."""
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        max_offenders: int = 50,
+        window: int = 2000,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self._lags: deque[float] = deque(maxlen=window)
+        self.offenders: deque[dict] = deque(maxlen=max_offenders)
+        self.sites: dict[str, dict] = {}
+        self.samples = 0
+        self.blocked_count = 0
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+        self.started_at: datetime | None = None
+
+        self._lock = threading.Lock()
+        self._pending: dict | None = None  # stack captured while the loop is blocked
+        self._last_tick = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+        self._task: asyncio.Task | None = None
+        self._thread: threading.Thread | None = None
+
+    # ── Loop side ──
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            self._last_tick = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._record(max(0.0, loop.time() - started - self.interval))
+
+    def _record(self, lag: float) -> None:
+        with self._lock:
+            self.samples += 1
+            self._lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            pending, self._pending = self._pending, None
+            if lag < self.threshold:
+                return
+
+            self.blocked_count += 1
+            self.blocked_seconds += lag
+            offender = pending or {
+                "at": datetime.now(timezone.utc).isoformat(),
+                "site": None,
+                "stack": None,  # ended before the watchdog looked
+            }
+            offender["lag_ms"] = round(lag * 1000, 1)
+            self.offenders.append(offender)
+
+            site = self.sites.setdefault(
+                offender["site"] or "<unknown>", {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            site["count"] += 1
+            site["total_ms"] += lag * 1000
+            site["max_ms"] = max(site["max_ms"], lag * 1000)
+        logger.warning(
+            "Event loop blocked for %.0f ms at %s", lag * 1000, offender["site"] or "unknown site"
+        )
+
+    # ── Watchdog thread ──
+
+    def _watch(self) -> None:
+        poll = max(self.threshold / 4, 0.005)
+        while not self._stop.wait(poll):
+            overdue = time.monotonic() - self._last_tick - self.interval
+            if overdue < self.threshold:
+                continue
+            with self._lock:
+                if self._pending is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is None:
+                    continue
+                stack, site = _format_stack(frame)
+                self._pending = {
+                    "at": datetime.now(timezone.utc).isoformat(),
+                    "site": site,
+                    "stack": stack,
+                }
+
+    # ── Lifecycle / reporting ──
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self.started_at = datetime.now(timezone.utc)
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lags.clear()
+            self.offenders.clear()
+            self.sites.clear()
+            self.samples = self.blocked_count = 0
+            self.blocked_seconds = self.max_lag = 0.0
+
+    def snapshot(self, offenders: int = 20) -> dict:
+        with self._lock:
+            lags = sorted(self._lags)
+            recent = list(self.offenders)[-offenders:][::-1]
+            sites = sorted(self.sites.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+            return {
+                "enabled": True,
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "interval_ms": self.interval * 1000,
+                "threshold_ms": self.threshold * 1000,
+                "samples": self.samples,
+                "lag_ms": {
+                    "mean": round(sum(lags) / len(lags) * 1000, 2) if lags else 0.0,
+                    "p50": round(_percentile(lags, 50) * 1000, 2),
+                    "p95": round(_percentile(lags, 95) * 1000, 2),
+                    "p99": round(_percentile(lags, 99) * 1000, 2),
+                    "max": round(self.max_lag * 1000, 2),
+                },
+                "blocked_count": self.blocked_count,
+                "blocked_seconds_total": round(self.blocked_seconds, 3),
+                "sites": [
+                    {
+                        "site": name,
+                        "count": s["count"],
+                        "total_ms": round(s["total_ms"], 1),
+                        "max_ms": round(s["max_ms"], 1),
+                    }
+                    for name, s in sites
+                ],
+                "recent": recent,
+            }
+
+
+monitor: LoopMonitor | None = None
+
+
+def start() -> None:
+    """Install the monitor on the running loop (called from the app lifespan)."""
+    global monitor
+    if monitor is None:
+        monitor = LoopMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL,
+            threshold=settings.LOOP_MONITOR_THRESHOLD,
+            max_offenders=settings.LOOP_MONITOR_MAX_OFFENDERS,
+        )
+        monitor.start()
+        logger.info(
+            "Event loop monitor on (threshold %.0f ms)", settings.LOOP_MONITOR_THRESHOLD * 1000
+        )
+
+
+async def stop() -> None:
+    global monitor
+    if monitor is not None:
+        await monitor.stop()
+        monitor = None
@@ -0,0 +1,304 @@
+"""
+Background match poller — keeps Match status/kickoff (and linked Event
+rows) current without an admin clicking sync.
+
+Only competitions with a match that is live or kicks off soon are polled,
+and only for a two-day date window. The interval adapts: every minute
+while something is live or about to start, every few minutes when a
+kickoff is a couple of hours away, and rarely otherwise.
+
+Every worker starts the poller, but on PostgreSQL only the one holding
+ADVISORY_LOCK_KEY polls. The lock is taken on a dedicated connection (a
+direct one, see app.database.direct_dsn) and lasts as long as it; the other
+workers retry every MATCH_POLLER_LOCK_RETRY seconds and take over when the
+owner exits or loses its connection.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+import httpx
+from sqlalchemy import and_, case, or_, select, update
+
+from app.config import settings
+from app.database import AsyncSessionLocal, direct_dsn, engine
+from app.models.event import Event
+from app.models.football_data import Match
+from app.services.bulk_upsert import bulk_upsert_async
+from app.services.cache_bus import invalidate_async
+from app.services.football_api import (
+    fetch_fixtures_for_competition,
+    request_priority,
+    Priority,
+    FootballAPIError,
+)
+
+logger = logging.getLogger(__name__)
+
+LIVE_STATUSES = ("IN_PLAY", "PAUSED", "LIVE")
+DONE_STATUSES = ("FINISHED", "AWARDED", "CANCELLED", "POSTPONED", "SUSPENDED")
+
+# football-data.org match status -> Event.status
+EVENT_STATUS_FOR_MATCH = {
+    "SCHEDULED": "upcoming",
+    "TIMED": "upcoming",
+    "IN_PLAY": "live",
+    "PAUSED": "live",
+    "LIVE": "live",
+    "FINISHED": "completed",
+    "AWARDED": "completed",
+    "CANCELLED": "cancelled",
+}
+# Events only move forward; an admin's manual change is never rolled back.
+# completed and cancelled are both terminal: neither replaces the other.
+EVENT_STATUS_RANK = {"upcoming": 0, "live": 1, "completed": 2, "cancelled": 2}
+
+IMMINENT_WINDOW = timedelta(hours=2)
+KICKOFF_SOON = timedelta(minutes=15)
+LIVE_LOOKBACK = timedelta(hours=3)  # long enough to cover extra time + penalties
+
+# Held (pg_try_advisory_lock) by the one worker that polls
+ADVISORY_LOCK_KEY = 0x706F6C6C6572
+
+_task: asyncio.Task | None = None
+last_run: dict = {}
+
+
+async def _active_competitions(now: datetime) -> tuple[dict[int, datetime | None], bool]:
+    """
+    Competitions with a live or imminent match, mapped to their nearest
+    upcoming kickoff; plus whether any match is currently live.
+    """
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(Match.competition_id, Match.kickoff_at, Match.status).where(
+                or_(
+                    Match.status.in_(LIVE_STATUSES),
+                    and_(
+                        Match.kickoff_at.between(now - LIVE_LOOKBACK, now + IMMINENT_WINDOW),
+                        or_(Match.status.is_(None), Match.status.not_in(DONE_STATUSES)),
+                    ),
+                )
+            )
+        )).all()
+
+    competitions: dict[int, datetime | None] = {}
+    any_live = False
+    for competition_id, kickoff_at, status in rows:
+        if status in LIVE_STATUSES or (kickoff_at and kickoff_at <= now):
+            any_live = True
+        nearest = competitions.get(competition_id)
+        if kickoff_at and kickoff_at > now and (nearest is None or kickoff_at < nearest):
+            competitions[competition_id] = kickoff_at
+        else:
+            competitions.setdefault(competition_id, None)
+    return competitions, any_live
+
+
+def _next_interval(competitions: dict[int, datetime | None], any_live: bool, now: datetime) -> float:
+    if not competitions:
+        return settings.MATCH_POLLER_IDLE_INTERVAL
+    if any_live:
+        return settings.MATCH_POLLER_LIVE_INTERVAL
+    nearest = min((k for k in competitions.values() if k), default=None)
+    if nearest and nearest - now <= KICKOFF_SOON:
+        return settings.MATCH_POLLER_LIVE_INTERVAL
+    return settings.MATCH_POLLER_IMMINENT_INTERVAL
+
+
+def _event_status_expr():
+    """CASE mapping matches.status to the Event status it implies (NULL if none)."""
+    return case(
+        *[(Match.status == m, e) for m, e in EVENT_STATUS_FOR_MATCH.items()],
+        else_=None,
+    )
+
+
+def _rank(expr):
+    return case(*[(expr == s, r) for s, r in EVENT_STATUS_RANK.items()], else_=-1)
+
+
+async def _apply_updates(api_rows: list[dict]) -> tuple[int, int]:
+    """
+    Diff-upsert known matches and propagate status/kickoff onto their
+    events in one UPDATE ... FROM per batch. Returns (matches, events) changed.
+    """
+    async with AsyncSessionLocal() as db:
+        ids = [r["id"] for r in api_rows]
+        known = set(await db.scalars(select(Match.id).where(Match.id.in_(ids))))
+        # New fixtures (and their teams) come from the admin sync endpoints
+        rows = [
+            {
+                "id": r["id"],
+                "competition_id": r["competition_id"],
+                "home_team_id": r["home_team_id"],
+                "away_team_id": r["away_team_id"],
+                "kickoff_at": r.get("kickoff_at"),
+                "matchday": r.get("matchday"),
+                "stage": r.get("stage"),
+                "status": r.get("status"),
+                "synced_at": datetime.now(timezone.utc),
+            }
+            for r in api_rows
+            if r["id"] in known
+        ]
+        result = await bulk_upsert_async(
+            db, Match, rows,
+            update_columns=[
+                "home_team_id", "away_team_id", "kickoff_at",
+                "matchday", "stage", "status", "synced_at",
+            ],
+            hash_column="content_hash",
+        )
+
+        events_changed = 0
+        if rows:
+            new_status = _event_status_expr()
+            target_status = case(
+                (_rank(new_status) > _rank(Event.status), new_status),
+                else_=Event.status,
+            )
+            events_changed = (await db.execute(
+                update(Event)
+                .where(
+                    Event.match_id == Match.id,
+                    Match.id.in_([r["id"] for r in rows]),
+                    or_(
+                        _rank(new_status) > _rank(Event.status),
+                        and_(
+                            Match.kickoff_at.is_not(None),
+                            Event.status == "upcoming",
+                            Event.starts_at.is_distinct_from(Match.kickoff_at),
+                        ),
+                    ),
+                )
+                .values(
+                    status=target_status,
+                    starts_at=case(
+                        (Event.status == "upcoming", Match.kickoff_at),
+                        else_=Event.starts_at,
+                    ),
+                )
+                .execution_options(synchronize_session=False)
+            )).rowcount
+        if result.updated or events_changed:
+            # Cached events embed their match; evict those built from the polled matches
+            await invalidate_async(db, *(f"match:{r['id']}" for r in rows))
+        await db.commit()
+        return result.created + result.updated, events_changed
+
+
+async def poll_once(client: httpx.AsyncClient) -> float:
+    """Run one poll cycle and return the number of seconds until the next one."""
+    now = datetime.now(timezone.utc)
+    competitions, any_live = await _active_competitions(now)
+
+    matches_changed = events_changed = 0
+    with request_priority(Priority.BACKGROUND):
+        for competition_id in competitions:
+            try:
+                api_rows = await fetch_fixtures_for_competition(
+                    competition_id,
+                    client,
+                    date_from=(now - timedelta(days=1)).date(),
+                    date_to=(now + timedelta(days=1)).date(),
+                )
+            except FootballAPIError as e:
+                logger.warning("Match poller: competition %s fetch failed: %s", competition_id, e)
+                continue
+            api_rows = [r for r in api_rows if r.get("home_team_id") and r.get("away_team_id")]
+            if not api_rows:
+                continue
+            m, e = await _apply_updates(api_rows)
+            matches_changed += m
+            events_changed += e
+
+    interval = _next_interval(competitions, any_live, now)
+    last_run.update({
+        "at": now.isoformat(),
+        "competitions": list(competitions),
+        "matches_changed": matches_changed,
+        "events_changed": events_changed,
+        "next_in_seconds": interval,
+    })
+    return interval
+
+
+async def _poll(client: httpx.AsyncClient, lock_conn: asyncpg.Connection | None) -> None:
+    while True:
+        if lock_conn is not None:
+            # The lock goes with the connection; never poll on a dead one
+            await lock_conn.fetchval("SELECT 1", timeout=10)
+        try:
+            interval = await poll_once(client)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Match poller cycle failed")
+            interval = settings.MATCH_POLLER_IMMINENT_INTERVAL
+        await asyncio.sleep(interval)
+
+
+async def _try_lock() -> asyncpg.Connection | None:
+    """A connection holding the poller lock, or None while another worker holds it."""
+    conn = await asyncpg.connect(direct_dsn(), timeout=10)
+    try:
+        if await conn.fetchval("SELECT pg_try_advisory_lock($1)", ADVISORY_LOCK_KEY):
+            return conn
+    except BaseException:
+        conn.terminate()
+        raise
+    await conn.close()
+    return None
+
+
+async def _run(client: httpx.AsyncClient) -> None:
+    if engine.dialect.name != "postgresql":
+        await _poll(client, None)  # a single process: nobody to share with
+        return
+    while True:
+        conn = None
+        try:
+            conn = await _try_lock()
+            if conn is not None:
+                logger.info("Match poller: this worker polls")
+                await _poll(client, conn)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Match poller lost its lock connection: %s", e)
+        finally:
+            if conn is not None:
+                conn.terminate()
+        await asyncio.sleep(settings.MATCH_POLLER_LOCK_RETRY)
+
+
+def start(client: httpx.AsyncClient) -> None:
+    """Start the poller task (called from the app lifespan)."""
+    global _task
+    if _task is not None:
+        return
+    if (
+        engine.dialect.name == "postgresql"
+        and settings.DB_PGBOUNCER_MODE
+        and not settings.CACHE_BUS_DATABASE_URL
+    ):
+        logger.warning(
+            "DB_PGBOUNCER_MODE is on but CACHE_BUS_DATABASE_URL is not set; the poller's "
+            "advisory lock needs a direct connection, so the match poller stays off"
+        )
+        return
+    _task = asyncio.create_task(_run(client))
+
+
+async def stop() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,71 @@
+"""
+Password hashing service.
+
+bcrypt is deliberately slow (~250ms per hash), so bulk operations fan the
+work out to a process pool instead of hashing one password at a time on
+the request thread.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import settings
+
+_pwd_context = None
+_pool: ProcessPoolExecutor | None = None
+
+
+def _context():
+    """passlib context, imported and built on first use to keep it off the startup path."""
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
+
+
+def warm() -> None:
+    """Load passlib and select the bcrypt backend ahead of the first login."""
+    _context().handler("bcrypt").get_backend()
+
+
+def hash_password(password: str) -> str:
+    return _context().hash(password)
+
+
+def verify_password(plain: str, hashed: str) -> bool:
+    return _context().verify(plain, hashed)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the hashing pool on first use (worker count from settings)."""
+    global _pool
+    if _pool is None:
+        workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+        _pool = ProcessPoolExecutor(max_workers=workers)
+    return _pool
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash many passwords in parallel. Blocks until all are done."""
+    if not passwords:
+        return []
+    pool = _get_pool()
+    chunksize = max(1, len(passwords) // (pool._max_workers * 4))
+    return list(pool.map(hash_password, passwords, chunksize=chunksize))
+
+
+async def hash_passwords_async(passwords: list[str]) -> list[str]:
+    """Hash many passwords in parallel without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, hash_passwords, passwords)
+
+
+def shutdown_pool() -> None:
+    """Stop the hashing workers. Called from the app lifespan on shutdown."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
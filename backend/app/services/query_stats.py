@@ -0,0 +1,203 @@
+"""
+Per-request SQL instrumentation and N+1 detection.
+
+Engine-level SQLAlchemy hooks time every statement and attribute it to the
+current request (a contextvar set by app.middleware.QueryStatsMiddleware),
+covering both the sync engine and the async engine's underlying one.
+Statements are fingerprinted — bind values and IN-list lengths stripped —
+so the same query issued in a loop shows up as one fingerprint with a high
+repeat count: the N+1 signature.
+
+Per request the totals go out as a `Server-Timing` header; per route they
+are aggregated for GET /admin/diagnostics/queries. app.testing turns the
+same counters into query-budget assertions for tests.
+"""
+
+import contextvars
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_FINGERPRINTS_PER_ROUTE = 5
+
+_PLACEHOLDER = r"(?:%\(\w+\)s|\?|\$\d+|:\w+|%s)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_PARAM = re.compile(_PLACEHOLDER)
+_VALUES_ROWS = re.compile(r"VALUES\s*(\(\?\))(?:\s*,\s*\(\?\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Statement text with bind parameters and list lengths normalized away."""
+    sql = _IN_LIST.sub("(?)", statement)
+    sql = _PARAM.sub("?", sql)
+    sql = _VALUES_ROWS.sub(r"VALUES \1", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+@dataclass
+class QueryStats:
+    """Queries seen during one request (or one capture_queries() block)."""
+    count: int = 0
+    duration: float = 0.0  # seconds spent inside the DB driver
+    statements: Counter = field(default_factory=Counter)  # fingerprint -> executions
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.statements[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Fingerprints executed at least `threshold` times, most frequent first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    def report(self, limit: int = 10) -> str:
+        lines = [f"{self.count} queries, {self.duration * 1000:.1f} ms"]
+        for sql, n in self.statements.most_common(limit):
+            lines.append(f"  {n:>4}x {sql[:300]}")
+        return "\n".join(lines)
+
+
+_current: contextvars.ContextVar[QueryStats | None] = contextvars.ContextVar(
+    "query_stats", default=None
+)
+# Process-wide collectors for capture_queries(); used by tests and scripts
+# where the code under test runs on another thread/context.
+_captures: list[QueryStats] = []
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Nothing is collecting (QUERY_STATS_ENABLED off, no capture): skip the bookkeeping
+    if _current.get() is None and not _captures:
+        return
+    conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_stats_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    for capture in _captures:
+        capture.record(statement, elapsed)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_stats_start"):
+        conn.info["query_stats_start"].pop()
+
+
+@contextmanager
+def track_request() -> Iterator[QueryStats]:
+    """Attribute queries run in this context (and threads/tasks it spawns) to one request."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Record every statement on any engine, from any thread, while the block runs."""
+    stats = QueryStats()
+    _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        _captures.remove(stats)
+
+
+# ─────────────── Per-route aggregates ───────────────
+
+
+@dataclass
+class RouteStats:
+    requests: int = 0
+    queries_total: int = 0
+    queries_max: int = 0
+    sql_ms_total: float = 0.0
+    sql_ms_max: float = 0.0
+    n_plus_one_requests: int = 0
+    repeated: dict[str, int] = field(default_factory=dict)  # fingerprint -> worst repeat count
+
+    def add(self, stats: QueryStats, repeated: list[tuple[str, int]]) -> None:
+        sql_ms = stats.duration * 1000
+        self.requests += 1
+        self.queries_total += stats.count
+        self.queries_max = max(self.queries_max, stats.count)
+        self.sql_ms_total += sql_ms
+        self.sql_ms_max = max(self.sql_ms_max, sql_ms)
+        if repeated:
+            self.n_plus_one_requests += 1
+            for sql, n in repeated:
+                self.repeated[sql] = max(self.repeated.get(sql, 0), n)
+            worst = sorted(self.repeated.items(), key=lambda kv: kv[1], reverse=True)
+            self.repeated = dict(worst[:MAX_FINGERPRINTS_PER_ROUTE])
+
+
+_routes: dict[str, RouteStats] = {}
+
+
+def record_request(route: str, stats: QueryStats) -> None:
+    """Fold one finished request into its route's aggregate and flag N+1 patterns."""
+    repeated = stats.repeated(settings.QUERY_STATS_REPEAT_THRESHOLD)
+    if repeated:
+        sql, n = repeated[0]
+        logger.warning("Possible N+1 on %s: %d executions of %s", route, n, sql[:200])
+    _routes.setdefault(route, RouteStats()).add(stats, repeated)
+
+
+def server_timing(stats: QueryStats) -> str:
+    """`Server-Timing` header value for one request."""
+    return f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+
+
+def snapshot(sort: str = "sql_ms_total") -> list[dict]:
+    rows = []
+    for route, r in _routes.items():
+        rows.append({
+            "route": route,
+            "requests": r.requests,
+            "queries_avg": round(r.queries_total / r.requests, 1) if r.requests else 0,
+            "queries_max": r.queries_max,
+            "sql_ms_total": round(r.sql_ms_total, 1),
+            "sql_ms_avg": round(r.sql_ms_total / r.requests, 2) if r.requests else 0,
+            "sql_ms_max": round(r.sql_ms_max, 1),
+            "n_plus_one_requests": r.n_plus_one_requests,
+            "repeated_statements": [
+                {
+                    "fingerprint_id": hashlib.sha1(sql.encode()).hexdigest()[:10],
+                    "max_repeats": n,
+                    "sql": sql[:500],
+                }
+                for sql, n in r.repeated.items()
+            ],
+        })
+    rows.sort(key=lambda row: row.get(sort, 0), reverse=True)
+    return rows
+
+
+def reset() -> None:
+    _routes.clear()
@@ -0,0 +1,148 @@
+"""
+Persistent HTTP response cache for football-data.org.
+
+Bodies are stored in a local SQLite file keyed by request path + query, so
+they survive restarts. Each entry keeps the validators (ETag /
+Last-Modified) needed to revalidate it with a conditional GET once its TTL
+has expired.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# First matching pattern wins. Seconds an entry is served without revalidation.
+DEFAULT_TTLS: list[tuple[str, int]] = [
+    (r"^/competitions$", 24 * 3600),  # competition list barely changes
+    (r"^/competitions/\d+$", 3600),  # season info / current matchday
+    (r"^/competitions/\d+/teams", 12 * 3600),
+    (r"^/competitions/\d+/matches\?dateFrom=", 30),  # match poller's live window
+    (r"^/competitions/\d+/matches", 300),  # kickoff times & statuses move
+    (r"^/teams/\d+$", 12 * 3600),  # squads
+]
+FALLBACK_TTL = 300
+
+
+@dataclass
+class CachedResponse:
+    body: dict
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float  # unix time of the last 200 or 304
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class ResponseCache:
+    """SQLite-backed cache. All disk work runs in a worker thread."""
+
+    def __init__(self, path: str, ttls: list[tuple[str, int]] | None = None):
+        self.path = path
+        self._ttls = [(re.compile(p), ttl) for p, ttl in (ttls or DEFAULT_TTLS)]
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def ttl_for(self, key: str) -> int:
+        """TTL for a cache key; patterns see the full path including the query."""
+        for pattern, ttl in self._ttls:
+            if pattern.search(key):
+                return ttl
+        return FALLBACK_TTL
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " body TEXT NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " fetched_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _get_sync(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(json.loads(row[0]), row[1], row[2], row[3])
+
+    def _put_sync(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(entry.body), entry.etag, entry.last_modified, entry.fetched_at),
+            )
+            conn.commit()
+
+    def _touch_sync(self, key: str, fetched_at: float) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (fetched_at, key))
+            conn.commit()
+
+    def _clear_sync(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            deleted = conn.execute("DELETE FROM responses").rowcount
+            conn.commit()
+        return deleted
+
+    async def get(self, key: str) -> CachedResponse | None:
+        try:
+            return await asyncio.to_thread(self._get_sync, key)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Response cache read failed for %s: %s", key, e)
+            return None
+
+    async def put(self, key: str, entry: CachedResponse) -> None:
+        try:
+            await asyncio.to_thread(self._put_sync, key, entry)
+        except sqlite3.Error as e:
+            logger.warning("Response cache write failed for %s: %s", key, e)
+
+    async def touch(self, key: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        try:
+            await asyncio.to_thread(self._touch_sync, key, time.time())
+        except sqlite3.Error as e:
+            logger.warning("Response cache touch failed for %s: %s", key, e)
+
+    async def clear(self) -> int:
+        return await asyncio.to_thread(self._clear_sync)
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,147 @@
+"""
+Squad sync service — upserts a team's players and runs whole-competition
+squad syncs as background jobs with bounded concurrency.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import httpx
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.football_data import Player, Team
+from app.services.bulk_upsert import bulk_upsert, UpsertResult
+from app.services.football_api import (
+    fetch_squad_for_team,
+    request_priority,
+    Priority,
+    FootballAPIError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def upsert_squad(db: Session, team_id: int, api_data: list[dict]) -> UpsertResult:
+    """Bulk-upsert a team's squad and stamp the team's synced_at. Does not commit."""
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": item["id"],
+            "team_id": team_id,
+            "name": item["name"],
+            "position": item.get("position"),
+            "nationality": item.get("nationality"),
+            "date_of_birth": item.get("date_of_birth"),
+            "synced_at": now,
+        }
+        for item in api_data
+    ]
+    result = bulk_upsert(db, Player, rows, hash_column="content_hash")
+    db.execute(update(Team).where(Team.id == team_id).values(synced_at=now))
+    return result
+
+
+async def upsert_squad_async(db: AsyncSession, team_id: int, api_data: list[dict]) -> UpsertResult:
+    """upsert_squad() on an AsyncSession. Does not commit."""
+    return await db.run_sync(upsert_squad, team_id, api_data)
+
+
+# ─────────────── Whole-competition jobs ───────────────
+
+
+@dataclass
+class SquadSyncJob:
+    id: str
+    tournament_id: str
+    competition_id: int
+    team_ids: list[int]
+    status: str = "running"  # running | completed | failed | cancelled
+    teams_done: int = 0
+    teams_failed: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: dict[int, str] = field(default_factory=dict)
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+# Jobs live in this worker's memory; poll the worker that started the job.
+_jobs: dict[str, SquadSyncJob] = {}
+MAX_FINISHED_JOBS = 50
+
+
+def get_job(job_id: str) -> SquadSyncJob | None:
+    return _jobs.get(job_id)
+
+
+async def _save_squad(team_id: int, api_data: list[dict]) -> UpsertResult:
+    async with AsyncSessionLocal() as db:
+        result = await upsert_squad_async(db, team_id, api_data)
+        await db.commit()
+        return result
+
+
+async def _sync_one(job: SquadSyncJob, team_id: int, client: httpx.AsyncClient, sem: asyncio.Semaphore):
+    async with sem:
+        try:
+            api_data = await fetch_squad_for_team(team_id, client)
+            result = await _save_squad(team_id, api_data)
+        except (FootballAPIError, SQLAlchemyError) as e:
+            job.teams_failed += 1
+            job.errors[team_id] = str(e)
+            logger.warning("Squad sync for team %s failed: %s", team_id, e)
+            return
+        job.teams_done += 1
+        job.created += result.created
+        job.updated += result.updated
+        job.unchanged += result.unchanged
+
+
+async def _run(job: SquadSyncJob, client: httpx.AsyncClient) -> None:
+    sem = asyncio.Semaphore(settings.SQUAD_SYNC_CONCURRENCY)
+    try:
+        # Bulk work queues behind interactive admin calls for API quota
+        with request_priority(Priority.BACKGROUND):
+            await asyncio.gather(*(_sync_one(job, t, client, sem) for t in job.team_ids))
+        job.status = "completed"
+    except asyncio.CancelledError:
+        job.status = "cancelled"
+        raise
+    except Exception:
+        logger.exception("Squad sync job %s crashed", job.id)
+        job.status = "failed"
+    finally:
+        job.finished_at = datetime.now(timezone.utc)
+
+
+def _prune_jobs() -> None:
+    finished = [j for j in _jobs.values() if j.finished_at is not None]
+    finished.sort(key=lambda j: j.finished_at)
+    for job in finished[:-MAX_FINISHED_JOBS]:
+        _jobs.pop(job.id, None)
+
+
+def start_squad_sync(
+    tournament_id: str, competition_id: int, team_ids: list[int], client: httpx.AsyncClient
+) -> SquadSyncJob:
+    """Start syncing every team's squad in the background and return the job."""
+    _prune_jobs()
+    job = SquadSyncJob(
+        id=str(uuid.uuid4()),
+        tournament_id=tournament_id,
+        competition_id=competition_id,
+        team_ids=team_ids,
+    )
+    _jobs[job.id] = job
+    job.task = asyncio.create_task(_run(job, client))
+    return job
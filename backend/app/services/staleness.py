@@ -0,0 +1,32 @@
+"""
+Per-request record of football-data.org payloads served from stale cache.
+
+app.middleware.StaleDataMiddleware opens a tracking block around every
+request and football_api marks the paths it answers stale. Kept apart from
+football_api so the middleware does not import it (and httpx) at startup.
+"""
+
+import contextlib
+import contextvars
+from typing import Iterator
+
+_stale_paths: contextvars.ContextVar[set[str] | None] = contextvars.ContextVar(
+    "football_api_stale_paths", default=None
+)
+
+
+@contextlib.contextmanager
+def track_staleness() -> Iterator[set[str]]:
+    """Collect the paths served stale within the block; yields the (live) set."""
+    paths: set[str] = set()
+    token = _stale_paths.set(paths)
+    try:
+        yield paths
+    finally:
+        _stale_paths.reset(token)
+
+
+def mark_stale(path: str) -> None:
+    paths = _stale_paths.get()
+    if paths is not None:
+        paths.add(path)
@@ -0,0 +1,55 @@
+"""
+Betting trends: the share of bets on each selection of a market.
+
+Counts come from one GROUP BY over all_bets() for any number of markets, so
+a market's trends and an event page's trends for all its markets cost the
+same single query. Settled history is included, as for bets/me.
+"""
+
+import uuid
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.market import Market
+from app.services.bet_archive import all_bets
+
+
+def bet_counts(db: Session, selection_ids: list[uuid.UUID]) -> dict[uuid.UUID, int]:
+    """Number of bets per selection id (selections without bets are omitted)."""
+    if not selection_ids:
+        return {}
+    bets = all_bets()
+    rows = (
+        db.query(bets.selection_id, func.count())
+        .filter(bets.selection_id.in_(selection_ids))
+        .group_by(bets.selection_id)
+        .all()
+    )
+    return dict(rows)
+
+
+def market_trends(db: Session, markets: list[Market]) -> list[dict]:
+    """
+    Trends for each market, in order. `markets` must have their selections
+    loaded. Each item: { market_id, total_bets, trends: [{ selection_id,
+    label, percentage, bet_count }] }.
+    """
+    counts = bet_counts(db, [sel.id for market in markets for sel in market.selections])
+    result = []
+    for market in markets:
+        total_bets = sum(counts.get(sel.id, 0) for sel in market.selections)
+        result.append({
+            "market_id": market.id,
+            "total_bets": total_bets,
+            "trends": [
+                {
+                    "selection_id": sel.id,
+                    "label": sel.label,
+                    "percentage": round(counts.get(sel.id, 0) / total_bets * 100, 1) if total_bets else 0,
+                    "bet_count": counts.get(sel.id, 0),
+                }
+                for sel in market.selections
+            ],
+        })
+    return result
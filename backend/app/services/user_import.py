@@ -0,0 +1,244 @@
+"""
+Bulk user import service — streams CSV or NDJSON rows, hashes passwords in
+a process pool, dedupes against existing accounts once per batch and
+bulk-inserts each batch in a single statement.
+"""
+
+import codecs
+import csv
+import json
+import logging
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.user import User
+from app.schemas.auth import CreateUserRequest
+from app.schemas.user import UserImportReport, UserImportRowResult
+from app.services.passwords import hash_passwords_async
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+CSV_TYPES = ("text/csv", "application/csv")
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+class UserImportError(Exception):
+    """Raised when the import payload cannot be parsed at all."""
+    pass
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Turn a stream of byte chunks into decoded lines without buffering it all."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def _iter_records(
+    chunks: AsyncIterator[bytes], content_type: str
+) -> AsyncIterator[tuple[int, dict | None, str | None]]:
+    """
+    Yield (row_number, record, parse_error) for each non-blank data row.
+    CSV input must start with a header row; quoted newlines are not supported.
+    """
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in CSV_TYPES:
+        is_csv = True
+    elif media_type in NDJSON_TYPES:
+        is_csv = False
+    else:
+        raise UserImportError(
+            f"Unsupported content type '{media_type}'. Use text/csv or application/x-ndjson."
+        )
+
+    header: list[str] | None = None
+    row_number = 0
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        if is_csv:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [h.strip().lower() for h in values]
+                if not {"username", "email", "password"} <= set(header):
+                    raise UserImportError(
+                        "CSV header must include username, email and password columns"
+                    )
+                continue
+            row_number += 1
+            if len(values) != len(header):
+                yield row_number, None, f"Expected {len(header)} columns, got {len(values)}"
+                continue
+            yield row_number, dict(zip(header, values)), None
+        else:
+            row_number += 1
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row_number, None, f"Invalid JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield row_number, None, "Each line must be a JSON object"
+                continue
+            yield row_number, record, None
+
+
+async def _find_existing(
+    db: AsyncSession, rows: list[CreateUserRequest]
+) -> tuple[set[str], set[str]]:
+    """Return the emails and usernames from `rows` that already exist — one query."""
+    emails = [r.email for r in rows]
+    usernames = [r.username for r in rows]
+    existing = (await db.execute(
+        select(User.email, User.username).where(
+            or_(User.email.in_(emails), User.username.in_(usernames))
+        )
+    )).all()
+    return {e for e, _ in existing}, {u for _, u in existing}
+
+
+async def _insert_batch(db: AsyncSession, values: list[dict]) -> None:
+    """Insert a batch of users in one executemany and commit."""
+    try:
+        await db.execute(insert(User), values)
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise
+
+
+async def _flush_batch(
+    db: AsyncSession,
+    batch: list[tuple[int, CreateUserRequest]],
+    seen_emails: set[str],
+    seen_usernames: set[str],
+    report: UserImportReport,
+) -> None:
+    """Dedupe, hash and insert one batch of validated rows, appending results to the report."""
+    existing_emails, existing_usernames = await _find_existing(db, [r for _, r in batch])
+
+    # This batch's rows; they join seen_* only once the insert commits
+    batch_emails: set[str] = set()
+    batch_usernames: set[str] = set()
+    accepted: list[tuple[int, CreateUserRequest]] = []
+    for row_number, row in batch:
+        if row.email in existing_emails or row.email in seen_emails or row.email in batch_emails:
+            field = "email"
+        elif (
+            row.username in existing_usernames
+            or row.username in seen_usernames
+            or row.username in batch_usernames
+        ):
+            field = "username"
+        else:
+            field = None
+        if field:
+            report.duplicates += 1
+            report.rows.append(UserImportRowResult(
+                row=row_number, username=row.username, email=row.email,
+                status="duplicate", detail=f"A user with this {field} already exists",
+            ))
+            continue
+        batch_emails.add(row.email)
+        batch_usernames.add(row.username)
+        accepted.append((row_number, row))
+
+    if not accepted:
+        return
+
+    hashes = await hash_passwords_async([r.password for _, r in accepted])
+    values = [
+        {
+            "username": row.username,
+            "email": row.email,
+            "password_hash": password_hash,
+            "balance": settings.DEFAULT_BALANCE,
+            "is_admin": row.is_admin,
+        }
+        for (_, row), password_hash in zip(accepted, hashes)
+    ]
+
+    try:
+        await _insert_batch(db, values)
+    except IntegrityError:
+        # A concurrent writer took one of these emails/usernames between our
+        # dedupe query and the insert; report the batch rather than guess.
+        logger.warning("User import batch of %d rows hit a unique conflict", len(values))
+        for row_number, row in accepted:
+            report.failed += 1
+            report.rows.append(UserImportRowResult(
+                row=row_number, username=row.username, email=row.email,
+                status="failed", detail="Conflicting user created concurrently; retry this row",
+            ))
+        return
+
+    seen_emails.update(batch_emails)
+    seen_usernames.update(batch_usernames)
+    for row_number, row in accepted:
+        report.created += 1
+        report.rows.append(UserImportRowResult(
+            row=row_number, username=row.username, email=row.email, status="created",
+        ))
+
+
+async def import_users(
+    db: AsyncSession, chunks: AsyncIterator[bytes], content_type: str
+) -> UserImportReport:
+    """
+    Import users from a CSV or NDJSON byte stream.
+
+    Rows are validated against CreateUserRequest, deduplicated against the
+    database and earlier rows, and inserted in batches of BATCH_SIZE.
+    Returns a per-row report; invalid rows never abort the import.
+    """
+    report = UserImportReport()
+    seen_emails: set[str] = set()
+    seen_usernames: set[str] = set()
+    batch: list[tuple[int, CreateUserRequest]] = []
+
+    async for row_number, record, error in _iter_records(chunks, content_type):
+        row = None
+        if error is None:
+            try:
+                row = CreateUserRequest.model_validate(
+                    {k: v for k, v in record.items() if v not in ("", None)}
+                )
+            except ValidationError as e:
+                first = e.errors()[0]
+                error = f"{'.'.join(str(p) for p in first['loc'])}: {first['msg']}"
+        if row is None:
+            report.invalid += 1
+            record = record or {}
+            report.rows.append(UserImportRowResult(
+                row=row_number,
+                username=str(record["username"]) if record.get("username") is not None else None,
+                email=str(record["email"]) if record.get("email") is not None else None,
+                status="invalid",
+                detail=error,
+            ))
+            continue
+
+        batch.append((row_number, row))
+        if len(batch) >= BATCH_SIZE:
+            await _flush_batch(db, batch, seen_emails, seen_usernames, report)
+            batch = []
+
+    if batch:
+        await _flush_batch(db, batch, seen_emails, seen_usernames, report)
+
+    report.rows.sort(key=lambda r: r.row)
+    return report
@@ -0,0 +1,181 @@
+"""
+Startup phases, warm-up and their timing.
+
+STARTUP_MODE=full (default) applies pending migrations before serving.
+STARTUP_MODE=fast is for autoscaled instances, where migrations are applied
+by the deploy (`python -m app.migrations upgrade`). It skips schema
+management and only checks for pending migrations, in parallel with the
+warm-up.
+
+In both modes the warm-up runs its independent steps concurrently, so
+startup costs only as long as the slowest step:
+- open STARTUP_WARM_CONNECTIONS connections per engine, so the first
+  requests do not pay the TCP/TLS/auth handshake
+- configure the ORM mappers and build the loader projections
+- load passlib's bcrypt backend
+
+football_api and httpx are not imported at startup; the football-data.org
+client is created on first use (admin syncs, or the match poller right
+after startup when it is enabled).
+
+A failed warm-up step is logged and startup carries on. The timeline is
+logged once the app is ready and is served at GET /admin/diagnostics/startup.
+
+Importing this module costs nothing beyond the stdlib. app.main imports it
+first so the "imports" phase covers the whole application import.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimeline:
+    """Phase start offsets and durations (ms) from the moment the app began importing."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc)
+        self.phases: list[dict] = []
+        self.ready_ms: float | None = None
+
+    def _offset(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def _record(self, name: str, start_ms: float, status: str) -> None:
+        self.phases.append({
+            "phase": name,
+            "start_ms": round(start_ms, 1),
+            "duration_ms": round(self._offset() - start_ms, 1),
+            "status": status,
+        })
+
+    def mark(self, name: str) -> None:
+        """Record a phase that ran from the previous mark (or import start) until now."""
+        start = self.phases[-1]["start_ms"] + self.phases[-1]["duration_ms"] if self.phases else 0.0
+        self._record(name, start, "ok")
+
+    def skip(self, name: str) -> None:
+        self.phases.append({"phase": name, "start_ms": round(self._offset(), 1),
+                            "duration_ms": 0.0, "status": "skipped"})
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self._offset()
+        try:
+            yield
+        except Exception as e:
+            self._record(name, start, f"failed: {e}")
+            raise
+        self._record(name, start, "ok")
+
+    async def run(self, name: str, fn: Callable[[], object]) -> None:
+        """Run a blocking warm-up step in a thread; failures are logged, not raised."""
+        await self.run_async(name, asyncio.to_thread(fn))
+
+    async def run_async(self, name: str, coro: Awaitable) -> None:
+        start = self._offset()
+        try:
+            await coro
+        except Exception as e:
+            logger.warning("Startup step %s failed: %s", name, e)
+            self._record(name, start, f"failed: {e}")
+            return
+        self._record(name, start, "ok")
+
+    def ready(self) -> None:
+        self.ready_ms = round(self._offset(), 1)
+        self.phases.sort(key=lambda p: p["start_ms"])
+        breakdown = ", ".join(
+            f"{p['phase']} {p['duration_ms']:.0f}" + ("" if p["status"] == "ok" else f" ({p['status']})")
+            for p in self.phases
+        )
+        logger.info("Ready in %.0f ms: %s", self.ready_ms, breakdown)
+
+    def snapshot(self) -> dict:
+        return {
+            "started_at": self.started_at.isoformat(),
+            "ready_ms": self.ready_ms,
+            "phases": self.phases,
+        }
+
+
+timeline = StartupTimeline()
+
+
+# ─────────────── Warm-up steps ───────────────
+
+
+def warm_pool(engine, connections: int) -> None:
+    """Open `connections` pooled connections at once, then return them to the pool idle."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        opened = list(executor.map(lambda _: engine.raw_connection(), range(connections)))
+    for conn in opened:
+        conn.close()
+
+
+async def warm_async_pool(async_engine, connections: int) -> None:
+    # Connections beyond pool_size are overflow, closed again on return
+    connections = min(connections, async_engine.pool.size())
+    opened = await asyncio.gather(*(async_engine.connect() for _ in range(connections)))
+    for conn in opened:
+        await conn.close()
+
+
+def warm_mappers() -> None:
+    from sqlalchemy.orm import configure_mappers
+
+    from app import projections
+
+    configure_mappers()
+    projections.build_all()
+
+
+def check_schema() -> None:
+    """Fast mode: warn when the database is behind the code's migrations."""
+    from app.database import engine
+    from app.migrations import pending
+
+    versions = pending(engine)
+    if versions:
+        logger.warning(
+            "Schema is behind by %d migration(s) (%s); run `python -m app.migrations upgrade`",
+            len(versions), ", ".join(versions),
+        )
+
+
+async def warm_up(fast: bool) -> None:
+    """Run every warm-up step concurrently, waiting at most STARTUP_WARM_TIMEOUT."""
+    from app.config import settings
+    from app.database import async_engine, engine, read_engine
+    from app.services import passwords
+
+    n = settings.STARTUP_WARM_CONNECTIONS
+    steps = [
+        timeline.run("warm_mappers", warm_mappers),
+        timeline.run("warm_bcrypt", passwords.warm),
+    ]
+    if n > 0:
+        steps.append(timeline.run("warm_pool", lambda: warm_pool(engine, n)))
+        if read_engine is not engine:
+            steps.append(timeline.run("warm_read_pool", lambda: warm_pool(read_engine, n)))
+        steps.append(timeline.run_async("warm_async_pool", warm_async_pool(async_engine, n)))
+    if fast:
+        steps.append(timeline.run("schema_check", check_schema))
+
+    tasks = [asyncio.create_task(step) for step in steps]
+    _, unfinished = await asyncio.wait(tasks, timeout=settings.STARTUP_WARM_TIMEOUT)
+    if unfinished:
+        # Serve anyway; the stragglers finish in the background
+        logger.warning(
+            "Warm-up not finished after %.0f s; serving with %d step(s) still running",
+            settings.STARTUP_WARM_TIMEOUT, len(unfinished),
+        )
+
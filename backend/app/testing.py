@@ -0,0 +1,75 @@
+"""
+Test helpers — query budgets for endpoints.
+
+    from app.testing import assert_query_budget, query_budget
+
+    def test_list_events_is_constant(client):
+        assert_query_budget(client, "GET", f"/tournaments/{tid}/events", max_queries=3)
+
+    def test_settle(db):
+        with query_budget(max_queries=10):
+            settle_market(db, market_id, winner_id)
+
+Both fail with the per-statement breakdown when the budget is exceeded, or
+when one statement repeats `max_repeats` times or more (an N+1 loop).
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.config import settings
+from app.services.query_stats import QueryStats, capture_queries
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block or request runs more SQL than its budget allows."""
+    pass
+
+
+def check_budget(
+    stats: QueryStats, max_queries: int, max_repeats: int | None = None, label: str = "block"
+) -> None:
+    """Raise QueryBudgetExceeded if `stats` breaks either limit."""
+    max_repeats = max_repeats or settings.QUERY_STATS_REPEAT_THRESHOLD
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{label} ran {stats.count} queries, budget is {max_queries}:\n{stats.report()}"
+        )
+    repeated = stats.repeated(max_repeats)
+    if repeated:
+        sql, n = repeated[0]
+        raise QueryBudgetExceeded(
+            f"{label} ran one statement {n} times (N+1?), limit is {max_repeats - 1}:\n"
+            f"  {sql[:300]}\n{stats.report()}"
+        )
+
+
+@contextmanager
+def query_budget(max_queries: int, max_repeats: int | None = None) -> Iterator[QueryStats]:
+    """Fail the enclosed block if it exceeds the query budget."""
+    with capture_queries() as stats:
+        yield stats
+    check_budget(stats, max_queries, max_repeats)
+
+
+def assert_query_budget(
+    client,
+    method: str,
+    url: str,
+    max_queries: int,
+    max_repeats: int | None = None,
+    expected_status: int | None = None,
+    **request_kwargs,
+):
+    """
+    Send one request through a Starlette/FastAPI TestClient and fail if it
+    exceeds the budget. Returns the response for further assertions.
+    """
+    with capture_queries() as stats:
+        response = client.request(method, url, **request_kwargs)
+    if expected_status is not None:
+        assert response.status_code == expected_status, (
+            f"{method} {url} returned {response.status_code}: {response.text[:500]}"
+        )
+    check_budget(stats, max_queries, max_repeats, label=f"{method} {url}")
+    return response
@@ -0,0 +1,137 @@
+"""
+Time-to-first-response of a fresh worker process, per STARTUP_MODE.
+
+Every trial starts a new Python process (nothing cached in memory), runs
+the app's startup and then sends its first requests: GET /health and a
+DB-backed POST /auth/login. By default the app is driven in-process
+through httpx's ASGI transport. --uvicorn starts a real server and polls
+it over HTTP instead, as the platform health check does.
+
+Run from backend/ against a database that is already migrated:
+
+    python benchmarks/cold_start.py --trials 5
+    python benchmarks/cold_start.py --modes fast --uvicorn
+
+Reported per mode (median over trials, ms from process spawn): ready
+(lifespan finished / first /health 200), first login response, and the
+startup phases the worker logged.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child process; prints one JSON line of absolute timestamps
+CHILD = """
+import asyncio, json, sys, time
+import httpx
+from app.main import app
+from app import startup
+
+async def main():
+    async with app.router.lifespan_context(app):
+        ready = time.time()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await client.get("/health")
+            health = time.time()
+            await client.post("/auth/login", json={"email": sys.argv[1], "password": sys.argv[2]})
+            login = time.time()
+    print(json.dumps({"ready": ready, "health": health, "login": login,
+                      "phases": startup.timeline.snapshot()["phases"]}))
+
+asyncio.run(main())
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def trial_asgi(env: dict, email: str, password: str) -> dict:
+    spawned = time.time()
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, email, password],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    return {
+        "ready_ms": (result["ready"] - spawned) * 1000,
+        "first_health_ms": (result["health"] - spawned) * 1000,
+        "first_login_ms": (result["login"] - spawned) * 1000,
+        "phases": result["phases"],
+    }
+
+
+def trial_uvicorn(env: dict, email: str, password: str) -> dict:
+    import httpx
+
+    port = free_port()
+    spawned = time.time()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env,
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        with httpx.Client(base_url=base, timeout=5) as client:
+            while True:
+                try:
+                    if client.get("/health").status_code == 200:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.005)
+                if proc.poll() is not None:
+                    raise RuntimeError("uvicorn exited during startup")
+            health = time.time()
+            client.post("/auth/login", json={"email": email, "password": password})
+            login = time.time()
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {
+        "ready_ms": (health - spawned) * 1000,
+        "first_health_ms": (health - spawned) * 1000,
+        "first_login_ms": (login - spawned) * 1000,
+        "phases": [],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", default="full,fast", help="comma list of STARTUP_MODE values")
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--uvicorn", action="store_true", help="measure a real server over HTTP")
+    parser.add_argument("--email", default="admin@mailinator.com")
+    parser.add_argument("--password", default="admin@123")
+    args = parser.parse_args()
+
+    run = trial_uvicorn if args.uvicorn else trial_asgi
+    print(f"{'mode':<6} {'ready ms':>9} {'1st health':>11} {'1st login':>10}   phases (median ms)")
+    for mode in args.modes.split(","):
+        env = {**os.environ, "STARTUP_MODE": mode, "MATCH_POLLER_ENABLED": "false"}
+        trials = [run(env, args.email, args.password) for _ in range(args.trials)]
+        phases: dict[str, list[float]] = {}
+        for t in trials:
+            for p in t["phases"]:
+                phases.setdefault(p["phase"], []).append(p["duration_ms"])
+        breakdown = ", ".join(f"{name} {statistics.median(v):.0f}" for name, v in phases.items())
+        print(
+            f"{mode:<6} "
+            f"{statistics.median(t['ready_ms'] for t in trials):>9.0f} "
+            f"{statistics.median(t['first_health_ms'] for t in trials):>11.0f} "
+            f"{statistics.median(t['first_login_ms'] for t in trials):>10.0f}   {breakdown}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Regenerate the bundled football-data.org replay fixtures.
+
+Produces a deterministic Premier League 2025/26 season in the API's v4
+response shapes: the competition list, competition details, 20 teams,
+380 fixtures (finished up to RECORDED_AT, scheduled after) and a 25-man
+squad per team. Run from backend/:
+
+    python fixtures/football_api/generate.py
+
+Real recordings can replace any file; use FOOTBALL_API_TRANSPORT=record.
+"""
+
+import json
+import os
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+OUT_DIR = os.path.dirname(os.path.abspath(__file__))
+SEED = 2025
+RECORDED_AT = datetime(2026, 1, 10, 12, 0, tzinfo=timezone.utc)
+SEASON_START = date(2025, 8, 16)
+AREA_ENGLAND = {"id": 2072, "name": "England", "code": "ENG", "flag": "https://crests.football-data.org/770.svg"}
+
+COMPETITIONS = [
+    (2021, "Premier League", "PL", "LEAGUE"),
+    (2001, "UEFA Champions League", "CL", "CUP"),
+    (2002, "Bundesliga", "BL1", "LEAGUE"),
+    (2003, "Eredivisie", "DED", "LEAGUE"),
+    (2013, "Campeonato Brasileiro Série A", "BSA", "LEAGUE"),
+    (2014, "Primera Division", "PD", "LEAGUE"),
+    (2015, "Ligue 1", "FL1", "LEAGUE"),
+    (2016, "Championship", "ELC", "LEAGUE"),
+    (2017, "Primeira Liga", "PPL", "LEAGUE"),
+    (2018, "European Championship", "EC", "CUP"),
+    (2019, "Serie A", "SA", "LEAGUE"),
+    (2000, "FIFA World Cup", "WC", "CUP"),
+]
+
+TEAMS = [
+    (57, "Arsenal FC", "Arsenal", "ARS"),
+    (58, "Aston Villa FC", "Aston Villa", "AVL"),
+    (1044, "AFC Bournemouth", "Bournemouth", "BOU"),
+    (402, "Brentford FC", "Brentford", "BRE"),
+    (397, "Brighton & Hove Albion FC", "Brighton Hove", "BHA"),
+    (328, "Burnley FC", "Burnley", "BUR"),
+    (61, "Chelsea FC", "Chelsea", "CHE"),
+    (354, "Crystal Palace FC", "Crystal Palace", "CRY"),
+    (62, "Everton FC", "Everton", "EVE"),
+    (63, "Fulham FC", "Fulham", "FUL"),
+    (341, "Leeds United FC", "Leeds United", "LEE"),
+    (64, "Liverpool FC", "Liverpool", "LIV"),
+    (65, "Manchester City FC", "Man City", "MCI"),
+    (66, "Manchester United FC", "Man United", "MUN"),
+    (67, "Newcastle United FC", "Newcastle", "NEW"),
+    (351, "Nottingham Forest FC", "Nottingham", "NOT"),
+    (71, "Sunderland AFC", "Sunderland", "SUN"),
+    (73, "Tottenham Hotspur FC", "Tottenham", "TOT"),
+    (563, "West Ham United FC", "West Ham", "WHU"),
+    (76, "Wolverhampton Wanderers FC", "Wolverhampton", "WOL"),
+]
+
+FIRST_NAMES = [
+    "James", "Oliver", "Jack", "Harry", "Lucas", "Mateo", "Noah", "Leon", "Bruno", "Kai",
+    "Rodrigo", "Martin", "Declan", "Bukayo", "Mohamed", "Virgil", "Erling", "Phil", "Alexis",
+    "Cole", "Moisés", "Dominik", "Pedro", "Yoane", "Ollie", "Jarrod", "Morgan", "Ibrahima",
+]
+LAST_NAMES = [
+    "Walker", "Silva", "Fernandes", "Rice", "Saka", "Salah", "van Dijk", "Haaland", "Foden",
+    "Mac Allister", "Palmer", "Caicedo", "Szoboszlai", "Neto", "Wissa", "Watkins", "Bowen",
+    "Gibbs-White", "Konaté", "Ødegaard", "Gordon", "Isak", "Mbeumo", "Eze", "Guéhi", "Mitoma",
+    "Semenyo", "Kerkez", "Trossard", "Rogers", "Tonali", "Kudus", "Cunha", "Solanke",
+]
+NATIONALITIES = [
+    "England", "Spain", "Brazil", "France", "Portugal", "Netherlands", "Norway", "Argentina",
+    "Belgium", "Germany", "Ghana", "Egypt", "Scotland", "Wales", "Ireland", "Japan", "Ecuador",
+]
+SQUAD_SHAPE = [("Goalkeeper", 3), ("Defence", 9), ("Midfield", 8), ("Offence", 5)]
+KICKOFF_SLOTS = [
+    (5, time(11, 30)), (5, time(14, 0)), (5, time(14, 0)), (5, time(14, 0)), (5, time(16, 30)),
+    (6, time(13, 0)), (6, time(14, 0)), (6, time(14, 0)), (6, time(15, 30)), (0, time(19, 0)),
+]
+
+
+def write(relpath: str, body: dict) -> None:
+    path = os.path.join(OUT_DIR, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"status": 200, "headers": {"content-type": "application/json"}, "body": body},
+                  f, ensure_ascii=False, indent=1)
+
+
+def iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def team_ref(team: tuple) -> dict:
+    team_id, name, short, tla = team
+    return {"id": team_id, "name": name, "shortName": short, "tla": tla,
+            "crest": f"https://crests.football-data.org/{team_id}.png"}
+
+
+def round_robin(teams: list) -> list[list[tuple]]:
+    """Circle-method double round robin: 38 matchdays of 10 (home, away) pairs."""
+    rotation = list(teams)
+    first_half = []
+    for rnd in range(len(teams) - 1):
+        pairs = []
+        for i in range(len(teams) // 2):
+            a, b = rotation[i], rotation[-1 - i]
+            pairs.append((a, b) if (rnd + i) % 2 == 0 else (b, a))
+        first_half.append(pairs)
+        rotation = [rotation[0], rotation[-1], *rotation[1:-1]]
+    second_half = [[(away, home) for home, away in rnd] for rnd in first_half]
+    return first_half + second_half
+
+
+def build_season(rng: random.Random) -> tuple[list[dict], int]:
+    season = {"id": 2403, "startDate": SEASON_START.isoformat(), "endDate": "2026-05-24",
+              "currentMatchday": None, "winner": None}
+    matches = []
+    current_matchday = 1
+    for idx, fixtures in enumerate(round_robin(TEAMS)):
+        matchday = idx + 1
+        saturday = SEASON_START + timedelta(weeks=idx)
+        for slot, (home, away) in zip(KICKOFF_SLOTS, fixtures):
+            offset, kick = slot
+            day = saturday + timedelta(days=(offset - 5) % 7)
+            kickoff = datetime.combine(day, kick, tzinfo=timezone.utc)
+            finished = kickoff + timedelta(hours=2) < RECORDED_AT
+            if finished:
+                current_matchday = max(current_matchday, matchday)
+                home_goals, away_goals = rng.choices(range(6), [25, 32, 22, 12, 6, 3], k=2)
+                winner = ("HOME_TEAM" if home_goals > away_goals
+                          else "AWAY_TEAM" if away_goals > home_goals else "DRAW")
+                score = {"winner": winner, "duration": "REGULAR",
+                         "fullTime": {"home": home_goals, "away": away_goals},
+                         "halfTime": {"home": min(home_goals, rng.randint(0, 2)),
+                                      "away": min(away_goals, rng.randint(0, 2))}}
+            else:
+                score = {"winner": None, "duration": "REGULAR",
+                         "fullTime": {"home": None, "away": None},
+                         "halfTime": {"home": None, "away": None}}
+            matches.append({
+                "area": AREA_ENGLAND,
+                "competition": {"id": 2021, "name": "Premier League", "code": "PL",
+                                "type": "LEAGUE", "emblem": "https://crests.football-data.org/PL.png"},
+                "season": season,
+                "id": 537000 + len(matches) + 1,
+                "utcDate": iso(kickoff),
+                "status": "FINISHED" if finished else "TIMED",
+                "matchday": matchday,
+                "stage": "REGULAR_SEASON",
+                "group": None,
+                "lastUpdated": iso(min(kickoff + timedelta(hours=2, minutes=5), RECORDED_AT)),
+                "homeTeam": team_ref(home),
+                "awayTeam": team_ref(away),
+                "score": score,
+                "odds": {"msg": "Activate Odds-Package in User-Panel to retrieve odds."},
+                "referees": [],
+            })
+    season["currentMatchday"] = current_matchday
+    return matches, current_matchday
+
+
+def build_squad(rng: random.Random, team: tuple, next_player_id: int) -> tuple[list[dict], int]:
+    squad = []
+    for position, count in SQUAD_SHAPE:
+        for _ in range(count):
+            born = date(1992, 1, 1) + timedelta(days=rng.randint(0, 13 * 365))
+            squad.append({
+                "id": next_player_id,
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "position": position,
+                "dateOfBirth": born.isoformat(),
+                "nationality": rng.choice(NATIONALITIES),
+            })
+            next_player_id += 1
+    return squad, next_player_id
+
+
+def main() -> None:
+    rng = random.Random(SEED)
+    matches, current_matchday = build_season(rng)
+    season = matches[0]["season"]
+    competition = {"id": 2021, "area": AREA_ENGLAND, "name": "Premier League", "code": "PL",
+                   "type": "LEAGUE", "emblem": "https://crests.football-data.org/PL.png"}
+
+    write("competitions.json", {
+        "count": len(COMPETITIONS),
+        "filters": {"client": "replay"},
+        "competitions": [
+            {"id": cid, "area": AREA_ENGLAND if code == "PL" else {"id": 2000 + i, "name": name},
+             "name": name, "code": code, "type": ctype,
+             "emblem": f"https://crests.football-data.org/{code}.png", "plan": "TIER_ONE",
+             "numberOfAvailableSeasons": 30, "lastUpdated": iso(RECORDED_AT)}
+            for i, (cid, name, code, ctype) in enumerate(COMPETITIONS)
+        ],
+    })
+    write("competitions/2021.json", {
+        **competition,
+        "currentSeason": {**season, "stages": ["REGULAR_SEASON"]},
+        "seasons": [season],
+        "lastUpdated": iso(RECORDED_AT),
+    })
+    write("competitions/2021/matches.json", {
+        "filters": {"season": "2025"},
+        "resultSet": {"count": len(matches), "first": matches[0]["utcDate"][:10],
+                      "last": matches[-1]["utcDate"][:10],
+                      "played": sum(1 for m in matches if m["status"] == "FINISHED")},
+        "competition": competition,
+        "matches": matches,
+    })
+
+    teams = []
+    next_player_id = 180000
+    for team in TEAMS:
+        squad, next_player_id = build_squad(rng, team, next_player_id)
+        detail = {**team_ref(team), "area": AREA_ENGLAND,
+                  "address": "England", "website": None, "founded": rng.randint(1865, 1905),
+                  "clubColors": None, "venue": f"{team[2]} Stadium",
+                  "runningCompetitions": [competition], "squad": squad,
+                  "lastUpdated": iso(RECORDED_AT)}
+        write(f"teams/{team[0]}.json", detail)
+        teams.append({k: v for k, v in detail.items() if k != "squad"})
+    write("competitions/2021/teams.json", {
+        "count": len(teams),
+        "filters": {"season": "2025"},
+        "competition": competition,
+        "season": season,
+        "teams": teams,
+    })
+    print(f"Wrote {len(matches)} matches, {len(teams)} teams "
+          f"(current matchday {current_matchday}) to {OUT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Shared fixtures. The suite runs the app on in-memory SQLite with the
+football-data.org client replaying the bundled fixtures, so it needs
+neither PostgreSQL nor network access:
+
+    cd backend
+    python -m pytest
+
+Settings are read when app modules are imported, so the environment is set
+here before anything from `app` is.
+"""
+
+import os
+import time
+
+os.environ.update(
+    DATABASE_URL="sqlite://",
+    ASYNC_DATABASE_URL="",
+    READ_DATABASE_URL="",
+    FOOTBALL_API_TRANSPORT="replay",
+    FOOTBALL_API_FIXTURES_DIR="",
+    FOOTBALL_API_CACHE_ENABLED="false",
+    MATCH_POLLER_ENABLED="false",
+    BETS_ARCHIVE_ENABLED="false",
+    QUERY_STATS_ENABLED="true",
+    STARTUP_MODE="full",
+)
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.seed import seed  # noqa: E402
+
+COMPETITION_ID = 2021  # Premier League, bundled in fixtures/football_api
+TEAM_ID = 57
+
+
+def login(client: TestClient, email: str, password: str) -> dict:
+    response = client.post("/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def wait_for_job(client: TestClient, headers: dict, job_id: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/admin/sync-jobs/{job_id}", headers=headers).json()
+        if job["status"] != "running" or time.monotonic() > deadline:
+            return job
+        time.sleep(0.05)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        seed()
+        yield c
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    return login(client, "admin@mailinator.com", "admin@123")
+
+
+@pytest.fixture(scope="session")
+def user_headers(client):
+    return login(client, "raj@mailinator.com", "raj@123")
+
+
+@pytest.fixture(scope="session")
+def other_user_headers(client):
+    return login(client, "kavya@mailinator.com", "kavya@123")
+
+
+@pytest.fixture(scope="session")
+def synced(client, admin_headers):
+    """
+    A tournament on COMPETITION_ID with competitions, teams and fixtures
+    synced from the replayed API, plus each sync's first summary.
+    """
+    competitions = client.post("/admin/sync/competitions", headers=admin_headers)
+    assert competitions.status_code == 200, competitions.text
+    tournament = client.post(
+        "/admin/tournaments",
+        json={"name": "Premier League", "competition_id": COMPETITION_ID},
+        headers=admin_headers,
+    )
+    assert tournament.status_code == 201, tournament.text
+    tournament_id = tournament.json()["id"]
+    teams = client.post(f"/admin/tournaments/{tournament_id}/sync-teams", headers=admin_headers)
+    assert teams.status_code == 200, teams.text
+    fixtures = client.post(f"/admin/tournaments/{tournament_id}/sync-fixtures", headers=admin_headers)
+    assert fixtures.status_code == 200, fixtures.text
+    return {
+        "tournament": tournament.json(),
+        "competitions": competitions.json(),
+        "teams": teams.json(),
+        "fixtures": fixtures.json(),
+    }
+
+
+@pytest.fixture
+def event(client, admin_headers, synced):
+    response = client.post(
+        "/admin/events",
+        json={"tournament_id": synced["tournament"]["id"], "title": "Arsenal vs Chelsea"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+@pytest.fixture
+def market(client, admin_headers, event):
+    response = client.post(
+        "/admin/markets",
+        json={
+            "event_id": event["id"],
+            "tournament_id": event["tournament_id"],
+            "question": "Match Result",
+            "market_type": "match_result",
+            "status": "open",
+            "selections": [
+                {"label": "Arsenal Win", "odds": 2.10},
+                {"label": "Draw", "odds": 3.25},
+                {"label": "Chelsea Win", "odds": 3.50},
+            ],
+        },
+        headers=admin_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
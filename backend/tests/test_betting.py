@@ -0,0 +1,139 @@
+"""Events, markets, bets, settlement, voiding and the bet archive."""
+
+import pytest
+
+from app.database import SessionLocal
+from app.models.football_data import Match
+
+
+def balance(client, headers) -> int:
+    return client.get("/auth/me", headers=headers).json()["balance"]
+
+
+def my_bet(client, headers, bet_id: str) -> dict:
+    items = client.get("/bets/me?limit=200", headers=headers).json()["items"]
+    return next(b for b in items if b["id"] == bet_id)
+
+
+def place_bet(client, headers, selection_id: str, stake: int) -> dict:
+    response = client.post("/bets", json={"selection_id": selection_id, "stake": stake}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_create_event_for_synced_match(client, admin_headers, user_headers, synced):
+    tournament_id = synced["tournament"]["id"]
+    with SessionLocal() as db:
+        match_id = db.query(Match.id).order_by(Match.kickoff_at).first()[0]
+    response = client.post(
+        "/admin/events",
+        json={"tournament_id": tournament_id, "match_id": match_id, "title": "Liverpool vs Everton"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 201, response.text
+    event = response.json()
+    assert event["match_id"] == match_id
+
+    assert client.get(f"/events/{event['id']}", headers=user_headers).json()["title"] == "Liverpool vs Everton"
+    updated = client.patch(f"/admin/events/{event['id']}", json={"status": "live"}, headers=admin_headers)
+    assert updated.json()["status"] == "live"
+    # The cached detail follows the update
+    assert client.get(f"/events/{event['id']}", headers=user_headers).json()["status"] == "live"
+
+
+def test_create_event_unknown_tournament(client, admin_headers, synced):
+    response = client.post(
+        "/admin/events",
+        json={"tournament_id": "00000000-0000-0000-0000-000000000000", "title": "Nobody vs Nobody"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 404
+
+
+def test_create_market(client, user_headers, market):
+    assert market["status"] == "open"
+    assert [s["label"] for s in market["selections"]] == ["Arsenal Win", "Draw", "Chelsea Win"]
+    assert client.get(f"/markets/{market['id']}", headers=user_headers).json()["id"] == market["id"]
+
+
+def test_place_bet(client, user_headers, market):
+    before = balance(client, user_headers)
+    bet = place_bet(client, user_headers, market["selections"][0]["id"], 200)
+
+    assert bet["status"] == "open"
+    assert bet["potential_payout"] == 420
+    assert balance(client, user_headers) == before - 200
+
+
+def test_bet_rejected_on_locked_market(client, admin_headers, user_headers, market):
+    locked = client.patch(
+        f"/admin/markets/{market['id']}/status", json={"status": "locked"}, headers=admin_headers
+    )
+    assert locked.status_code == 200, locked.text
+
+    response = client.post(
+        "/bets", json={"selection_id": market["selections"][0]["id"], "stake": 100}, headers=user_headers
+    )
+    assert response.status_code == 400
+
+
+def test_settle_market(client, admin_headers, user_headers, other_user_headers, market):
+    winner, loser = market["selections"][0], market["selections"][2]
+    won = place_bet(client, user_headers, winner["id"], 200)
+    lost = place_bet(client, other_user_headers, loser["id"], 300)
+    before = balance(client, user_headers)
+
+    response = client.post(
+        f"/admin/markets/{market['id']}/settle",
+        json={"winning_selection_id": winner["id"]},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == {"winners_paid": 1, "losers_marked": 1, "total_credited": 420}
+    assert balance(client, user_headers) == before + 420
+    assert my_bet(client, user_headers, won["id"])["status"] == "won"
+    assert my_bet(client, other_user_headers, lost["id"])["status"] == "lost"
+    assert client.get(f"/markets/{market['id']}", headers=user_headers).json()["status"] == "settled"
+
+    again = client.post(
+        f"/admin/markets/{market['id']}/settle",
+        json={"winning_selection_id": winner["id"]},
+        headers=admin_headers,
+    )
+    assert again.status_code == 400
+
+
+def test_void_market(client, admin_headers, user_headers, market):
+    before = balance(client, user_headers)
+    bet = place_bet(client, user_headers, market["selections"][1]["id"], 150)
+
+    response = client.post(f"/admin/markets/{market['id']}/void", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["total_refunded"] == 150
+    assert balance(client, user_headers) == before
+    assert my_bet(client, user_headers, bet["id"])["status"] == "voided"
+
+
+def test_archive_settled_bets(client, admin_headers, user_headers, market):
+    bet = place_bet(client, user_headers, market["selections"][0]["id"], 100)
+    client.post(
+        f"/admin/markets/{market['id']}/settle",
+        json={"winning_selection_id": market["selections"][0]["id"]},
+        headers=admin_headers,
+    )
+
+    response = client.post("/admin/bets/archive?older_than_days=0", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["archived"] >= 1
+    status = client.get("/admin/bets/archive", headers=admin_headers).json()
+    assert status["tables"]["archived"] >= 1
+    # Archived bets still show in the user's history
+    assert my_bet(client, user_headers, bet["id"])["status"] == "won"
+
+
+@pytest.mark.parametrize("stake", [0, -10])
+def test_bet_rejects_non_positive_stake(client, user_headers, market, stake):
+    response = client.post(
+        "/bets", json={"selection_id": market["selections"][0]["id"], "stake": stake}, headers=user_headers
+    )
+    assert response.status_code == 422
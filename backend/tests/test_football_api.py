@@ -0,0 +1,30 @@
+"""football_api request sharing."""
+
+import asyncio
+
+from app.services import football_api
+
+
+def test_follower_gets_result_when_leader_is_cancelled(monkeypatch):
+    calls = []
+
+    async def slow_fetch(path, client):
+        calls.append(path)
+        await asyncio.sleep(0.05)
+        return {"path": path}
+
+    monkeypatch.setattr(football_api, "_get_cached", slow_fetch)
+
+    async def scenario():
+        leader = asyncio.create_task(football_api._get("/shared", client=object()))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(football_api._get("/shared", client=object()))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result = await follower
+        assert leader.cancelled()
+        return result
+
+    assert asyncio.run(scenario()) == {"path": "/shared"}
+    assert calls == ["/shared"]
+    assert "/shared" not in football_api._inflight
@@ -0,0 +1,127 @@
+"""
+Paged list endpoints: cursors walk every row once, filters apply, and each
+page costs a fixed number of queries however many rows it holds.
+"""
+
+import pytest
+
+from app.testing import assert_query_budget
+
+EVENTS = 7
+MARKETS_PER_EVENT = 2
+
+
+def walk(client, headers, url: str, limit: int) -> list[dict]:
+    """Every item of a paged list, following next_cursor."""
+    items, cursor = [], None
+    sep = "&" if "?" in url else "?"
+    while True:
+        page_url = f"{url}{sep}limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(page_url, headers=headers).json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+@pytest.fixture(scope="module")
+def populated(client, admin_headers, user_headers, synced):
+    """A tournament with EVENTS events, their markets and one bet on each market."""
+    tournament = client.post(
+        "/admin/tournaments",
+        json={"name": "Paged Cup", "competition_id": synced["tournament"]["competition_id"]},
+        headers=admin_headers,
+    ).json()
+    events, markets = [], []
+    for i in range(EVENTS):
+        event = client.post(
+            "/admin/events",
+            json={"tournament_id": tournament["id"], "title": f"Match {i}"},
+            headers=admin_headers,
+        ).json()
+        events.append(event)
+        for j in range(MARKETS_PER_EVENT):
+            market = client.post(
+                "/admin/markets",
+                json={
+                    "event_id": event["id"],
+                    "tournament_id": tournament["id"],
+                    "question": f"Market {i}.{j}",
+                    "market_type": "match_result" if j == 0 else "special",
+                    "status": "open",
+                    "selections": [{"label": "Yes", "odds": 2.0}, {"label": "No", "odds": 1.8}],
+                },
+                headers=admin_headers,
+            ).json()
+            markets.append(market)
+            bet = client.post(
+                "/bets", json={"selection_id": market["selections"][0]["id"], "stake": 10}, headers=user_headers
+            )
+            assert bet.status_code == 201, bet.text
+    return {"tournament": tournament, "events": events, "markets": markets}
+
+
+def test_tournaments_page(client, user_headers, populated):
+    tournaments = walk(client, user_headers, "/tournaments", limit=1)
+    ids = [t["id"] for t in tournaments]
+    assert populated["tournament"]["id"] in ids
+    assert len(ids) == len(set(ids))
+
+
+def test_tournament_events_page(client, user_headers, populated):
+    tournament_id = populated["tournament"]["id"]
+    events = walk(client, user_headers, f"/tournaments/{tournament_id}/events", limit=3)
+
+    assert sorted(e["id"] for e in events) == sorted(e["id"] for e in populated["events"])
+    assert_query_budget(
+        client, "GET", f"/tournaments/{tournament_id}/events?limit=200",
+        max_queries=4, expected_status=200, headers=user_headers,
+    )
+
+
+def test_event_markets_page(client, user_headers, populated):
+    event = populated["events"][0]
+    markets = walk(client, user_headers, f"/events/{event['id']}/markets", limit=1)
+    assert len(markets) == MARKETS_PER_EVENT
+
+    special = client.get(f"/events/{event['id']}/markets?market_type=special", headers=user_headers).json()
+    assert [m["market_type"] for m in special["items"]] == ["special"]
+
+
+def test_all_tournament_markets_page(client, admin_headers, populated):
+    tournament_id = populated["tournament"]["id"]
+    url = f"/admin/tournaments/{tournament_id}/all-markets"
+    markets = walk(client, admin_headers, url, limit=5)
+
+    assert sorted(m["id"] for m in markets) == sorted(m["id"] for m in populated["markets"])
+    response = assert_query_budget(
+        client, "GET", f"{url}?limit=200", max_queries=4, expected_status=200, headers=admin_headers,
+    )
+    assert all(len(m["selections"]) == 2 for m in response.json()["items"])
+
+
+def test_my_bets_page(client, user_headers, populated):
+    tournament_id = populated["tournament"]["id"]
+    url = f"/bets/me?tournament_id={tournament_id}"
+    bets = walk(client, user_headers, url, limit=4)
+
+    assert len(bets) == len(populated["markets"])
+    assert_query_budget(
+        client, "GET", f"{url}&limit=200", max_queries=4, expected_status=200, headers=user_headers,
+    )
+
+
+def test_event_page(client, user_headers, populated):
+    event = populated["events"][0]
+    response = assert_query_budget(
+        client, "GET", f"/events/{event['id']}/page", max_queries=6, expected_status=200, headers=user_headers,
+    )
+    page = response.json()
+    assert len(page["markets"]) == MARKETS_PER_EVENT
+    assert len(page["trends"]) == MARKETS_PER_EVENT
+    assert len(page["my_open_bets"]) == MARKETS_PER_EVENT
+
+
+def test_bad_cursor(client, user_headers, populated):
+    response = client.get("/tournaments?cursor=not-a-cursor", headers=user_headers)
+    assert response.status_code == 400
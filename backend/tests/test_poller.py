@@ -0,0 +1,72 @@
+"""Match poller: match updates reach linked events, which only move forward."""
+
+import pytest
+
+from app.database import SessionLocal
+from app.models.football_data import Match
+from app.services.match_poller import _apply_updates
+
+
+@pytest.fixture
+def match_event(client, admin_headers, synced):
+    """An upcoming event linked to a synced match, and that match's row."""
+    with SessionLocal() as db:
+        match = db.query(Match).order_by(Match.kickoff_at.desc()).first()
+        row = {
+            "id": match.id,
+            "competition_id": match.competition_id,
+            "home_team_id": match.home_team_id,
+            "away_team_id": match.away_team_id,
+            "kickoff_at": match.kickoff_at,
+            "matchday": match.matchday,
+            "stage": match.stage,
+            "status": match.status,
+        }
+    response = client.post(
+        "/admin/events",
+        json={"tournament_id": synced["tournament"]["id"], "match_id": row["id"], "title": "Polled match"},
+        headers=admin_headers,
+    )
+    assert response.status_code == 201, response.text
+    return response.json(), row
+
+
+def poll(client, row: dict, status: str) -> tuple[int, int]:
+    return client.portal.call(_apply_updates, [{**row, "status": status}])
+
+
+def event_status(client, headers, event_id: str) -> str:
+    return client.get(f"/events/{event_id}", headers=headers).json()["status"]
+
+
+def test_status_moves_forward(client, user_headers, match_event):
+    event, row = match_event
+
+    assert poll(client, row, "IN_PLAY") == (1, 1)
+    assert event_status(client, user_headers, event["id"]) == "live"
+    poll(client, row, "FINISHED")
+    assert event_status(client, user_headers, event["id"]) == "completed"
+    # Not rolled back by a stale or corrected feed
+    poll(client, row, "IN_PLAY")
+    assert event_status(client, user_headers, event["id"]) == "completed"
+
+
+def test_terminal_statuses_do_not_replace_each_other(client, admin_headers, user_headers, match_event):
+    event, row = match_event
+    client.patch(f"/admin/events/{event['id']}", json={"status": "cancelled"}, headers=admin_headers)
+
+    _, events_changed = poll(client, row, "FINISHED")
+    assert events_changed == 0
+    assert event_status(client, user_headers, event["id"]) == "cancelled"
+
+    client.patch(f"/admin/events/{event['id']}", json={"status": "completed"}, headers=admin_headers)
+    poll(client, row, "CANCELLED")
+    assert event_status(client, user_headers, event["id"]) == "completed"
+
+
+def test_repeated_poll_changes_nothing(client, user_headers, match_event):
+    event, row = match_event
+
+    poll(client, row, "TIMED")
+    assert client.get(f"/events/{event['id']}", headers=user_headers).json()["starts_at"] is not None
+    assert poll(client, row, "TIMED") == (0, 0)
@@ -0,0 +1,35 @@
+"""app.testing query budgets, and when per-request query stats are on."""
+
+import pytest
+
+from app.config import Settings
+from app.database import SessionLocal
+from app.models.user import User
+from app.services.betting import settle_market
+from app.testing import QueryBudgetExceeded, query_budget
+
+
+def test_settlement_within_budget(client, user_headers, other_user_headers, market):
+    winner, loser = market["selections"][0], market["selections"][1]
+    client.post("/bets", json={"selection_id": winner["id"], "stake": 50}, headers=user_headers)
+    client.post("/bets", json={"selection_id": loser["id"], "stake": 50}, headers=other_user_headers)
+
+    with SessionLocal() as db, query_budget(max_queries=12):
+        result = settle_market(db, market["id"], winner["id"])
+    assert result == {"winners_paid": 1, "losers_marked": 1, "total_credited": 105}
+
+
+def test_budget_catches_n_plus_one(client):
+    with SessionLocal() as db:
+        ids = [user_id for (user_id,) in db.query(User.id).limit(5)]
+        with pytest.raises(QueryBudgetExceeded, match="N\\+1"):
+            with query_budget(max_queries=100, max_repeats=5):
+                for user_id in ids:
+                    db.query(User.balance).filter(User.id == user_id).scalar()
+
+
+@pytest.mark.parametrize("environment, enabled", [("development", True), ("production", False)])
+def test_query_stats_default_follows_environment(monkeypatch, environment, enabled):
+    monkeypatch.delenv("QUERY_STATS_ENABLED", raising=False)
+    assert Settings(_env_file=None, ENVIRONMENT=environment).QUERY_STATS_ENABLED is enabled
+    assert Settings(_env_file=None, ENVIRONMENT=environment, QUERY_STATS_ENABLED=True).QUERY_STATS_ENABLED
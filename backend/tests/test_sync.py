@@ -0,0 +1,117 @@
+"""Football-data.org syncs against the replayed API."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+
+from app.database import SessionLocal, engine
+from app.db_types import TZDateTime
+from app.models.football_data import Competition, Match, Player
+from app.routers.admin import sync_due
+from app.services.bulk_upsert import bulk_upsert
+
+from tests.conftest import COMPETITION_ID, TEAM_ID, wait_for_job
+
+
+def test_sync_competitions(client, admin_headers, synced):
+    assert synced["competitions"]["created"] > 0
+
+    again = client.post("/admin/sync/competitions", headers=admin_headers).json()
+    assert again["created"] == again["updated"] == 0
+    assert again["unchanged"] == synced["competitions"]["created"]
+    ids = [c["id"] for c in client.get("/admin/competitions", headers=admin_headers).json()]
+    assert COMPETITION_ID in ids
+
+
+def test_sync_cooldown_refreshes_never_synced_rows(client):
+    # competitions.synced_at is NOT NULL in the current schema, but older
+    # databases may hold NULLs; a throwaway table stands in for them
+    probe = Table(
+        "sync_cooldown_probe", MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String(50)),
+        Column("synced_at", TZDateTime(), nullable=True),
+    )
+    now = datetime.now(timezone.utc)
+    probe.create(engine)
+    try:
+        with SessionLocal() as db:
+            db.execute(probe.insert(), [
+                {"id": 1, "name": "never", "synced_at": None},
+                {"id": 2, "name": "recent", "synced_at": now - timedelta(minutes=1)},
+                {"id": 3, "name": "old", "synced_at": now - timedelta(days=1)},
+            ])
+            rows = [{"id": i, "name": "synced", "synced_at": now} for i in (1, 2, 3)]
+            result = bulk_upsert(db, probe, rows, where=sync_due(probe.c.synced_at, now))
+            names = dict(db.execute(select(probe.c.id, probe.c.name)).all())
+    finally:
+        probe.drop(engine)
+
+    assert (result.updated, result.skipped) == (2, 1)
+    assert names == {1: "synced", 2: "recent", 3: "synced"}
+
+
+def test_sync_competitions_refreshes_cached_tournament(client, admin_headers, user_headers, synced):
+    tournament_id = synced["tournament"]["id"]
+    with SessionLocal() as db:
+        competition = db.get(Competition, COMPETITION_ID)
+        name = competition.name
+        competition.name, competition.content_hash = "Renamed upstream", None
+        competition.synced_at = datetime.now(timezone.utc) - timedelta(days=1)
+        db.commit()
+    cached = client.get(f"/tournaments/{tournament_id}", headers=user_headers).json()
+    assert cached["competition"]["name"] == "Renamed upstream"
+
+    client.post("/admin/sync/competitions", headers=admin_headers)
+    tournament = client.get(f"/tournaments/{tournament_id}", headers=user_headers).json()
+    assert tournament["competition"]["name"] == name
+
+
+def test_sync_teams(client, admin_headers, synced):
+    assert synced["teams"]["created"] == 20
+
+    teams = client.get(f"/admin/competitions/{COMPETITION_ID}/teams", headers=admin_headers).json()
+    assert TEAM_ID in [t["id"] for t in teams]
+
+
+def test_sync_fixtures(client, admin_headers, synced):
+    assert synced["fixtures"]["created"] == 380
+    tournament_id = synced["tournament"]["id"]
+
+    again = client.post(f"/admin/tournaments/{tournament_id}/sync-fixtures", headers=admin_headers)
+    assert again.status_code == 200, again.text
+    assert again.json()["unchanged"] == 380
+    with SessionLocal() as db:
+        kickoff = db.query(Match.kickoff_at).filter(Match.competition_id == COMPETITION_ID).first()[0]
+    assert isinstance(kickoff, datetime) and kickoff.tzinfo is not None
+
+
+def test_sync_squad(client, admin_headers, synced):
+    first = client.post(f"/admin/teams/{TEAM_ID}/sync-squad", headers=admin_headers)
+    assert first.status_code == 200, first.text
+    squad_size = first.json()["created"] + first.json()["unchanged"]
+    assert squad_size > 0
+
+    again = client.post(f"/admin/teams/{TEAM_ID}/sync-squad", headers=admin_headers).json()
+    assert again == {"created": 0, "updated": 0, "unchanged": squad_size, "skipped": 0}
+    with SessionLocal() as db:
+        born = db.query(Player.date_of_birth).filter(Player.team_id == TEAM_ID).first()[0]
+    assert isinstance(born, date)
+
+
+def test_sync_squad_unknown_team(client, admin_headers, synced):
+    response = client.post("/admin/teams/999999/sync-squad", headers=admin_headers)
+    assert response.status_code == 404
+
+
+def test_sync_all_squads(client, admin_headers, synced):
+    tournament_id = synced["tournament"]["id"]
+    response = client.post(f"/admin/tournaments/{tournament_id}/sync-all-squads", headers=admin_headers)
+    assert response.status_code == 202, response.text
+
+    job = wait_for_job(client, admin_headers, response.json()["id"])
+    assert job["status"] == "completed"
+    assert job["errors"] == {}
+    assert job["teams_done"] == job["teams_total"] == synced["teams"]["created"]
+    players = client.get(f"/admin/teams/{TEAM_ID}/players", headers=admin_headers).json()
+    assert players
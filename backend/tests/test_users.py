@@ -0,0 +1,55 @@
+"""Admin user totals count every account, not one page of the list."""
+
+from app.testing import assert_query_budget
+
+
+def test_user_totals(client, admin_headers, user_headers):
+    users, cursor = [], None
+    while True:
+        page = client.get(
+            "/admin/users", params={"limit": 2, "cursor": cursor}, headers=admin_headers
+        ).json()
+        users += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    response = assert_query_budget(
+        client, "GET", "/admin/users/totals", max_queries=2, expected_status=200, headers=admin_headers,
+    )
+    assert response.json() == {
+        "total_users": len(users),
+        "active_users": sum(u["is_active"] for u in users),
+        "total_balance": sum(u["balance"] for u in users),
+    }
+    assert client.get("/admin/users/totals", headers=user_headers).status_code == 403
+
+
+def test_import_retries_rows_of_a_failed_batch(client, admin_headers, monkeypatch):
+    from sqlalchemy.exc import IntegrityError
+
+    from app.services import user_import
+
+    insert_batch = user_import._insert_batch
+    calls = []
+
+    async def conflict_once(db, values):
+        calls.append(values)
+        if len(calls) == 1:
+            raise IntegrityError("INSERT INTO users", {}, Exception("unique violation"))
+        await insert_batch(db, values)
+
+    monkeypatch.setattr(user_import, "BATCH_SIZE", 2)
+    monkeypatch.setattr(user_import, "_insert_batch", conflict_once)
+    body = (
+        "username,email,password\n"
+        "imp_a,imp_a@example.com,secret123\n"
+        "imp_b,imp_b@example.com,secret123\n"
+        "imp_a,imp_a@example.com,secret123\n"  # the failed row, sent again
+        "imp_c,imp_c@example.com,secret123\n"
+    )
+    response = client.post(
+        "/admin/users/import", content=body, headers={**admin_headers, "content-type": "text/csv"}
+    )
+    assert response.status_code == 200, response.text
+    assert [r["status"] for r in response.json()["rows"]] == ["failed", "failed", "created", "created"]
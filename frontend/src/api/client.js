@@ -9,18 +9,31 @@ const client = axios.create({
     },
 });
 
+// Read-your-writes pin: after a write the API returns X-Read-Primary-Until;
+// echo it back so the next reads skip the (possibly lagging) read replica
+let readPrimaryUntil = null;
+
 // Request interceptor — attach JWT token
 client.interceptors.request.use((config) => {
     const token = localStorage.getItem('token');
     if (token) {
         config.headers.Authorization = `Bearer ${token}`;
     }
+    if (readPrimaryUntil && Date.now() / 1000 < Number(readPrimaryUntil)) {
+        config.headers['X-Read-Primary-Until'] = readPrimaryUntil;
+    }
     return config;
 });
 
-// Response interceptor — auto logout on 401
+// Response interceptor — remember the read pin, auto logout on 401
 client.interceptors.response.use(
-    (response) => response,
+    (response) => {
+        const pin = response.headers['x-read-primary-until'];
+        if (pin) {
+            readPrimaryUntil = pin;
+        }
+        return response;
+    },
     (error) => {
         if (error.response?.status === 401) {
             localStorage.removeItem('token');
@@ -3,9 +3,12 @@ import { CheckCircle, XCircle, TrendingUp } from 'lucide-react';
 import { useMarketTrends } from '../hooks/useApi';
 import BetSlip from './BetSlip';
 
-export default function MarketCard({ market }) {
+// `trends` is passed in when the page already has them (event page);
+// otherwise the card fetches its own
+export default function MarketCard({ market, trends }) {
     const [selectedSelection, setSelectedSelection] = useState(null);
-    const { data: trendsData } = useMarketTrends(market.id);
+    const { data: fetchedTrends } = useMarketTrends(market.id, !trends);
+    const trendsData = trends ?? fetchedTrends;
 
     const statusConfig = {
         coming_soon: { badge: 'badge-coming-soon', label: 'Coming Soon', canBet: false },
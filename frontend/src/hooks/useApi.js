@@ -1,11 +1,23 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useQuery, useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import client from '../api/client';
 
+// Every item of a cursor-paged list endpoint: follows next_cursor to the end
+async function fetchAllPages(url, params = {}) {
+    const items = [];
+    let cursor;
+    do {
+        const { data } = await client.get(url, { params: { ...params, limit: 200, cursor } });
+        items.push(...data.items);
+        cursor = data.next_cursor || undefined;
+    } while (cursor);
+    return items;
+}
+
 // ─── Tournaments ─────────────────────────
 export function useTournaments() {
     return useQuery({
         queryKey: ['tournaments'],
-        queryFn: () => client.get('/tournaments').then(r => r.data),
+        queryFn: () => fetchAllPages('/tournaments'),
     });
 }
 
@@ -19,10 +31,11 @@ export function useTournament(id) {
 
 // ─── Events ─────────────────────────
 export function useTournamentEvents(tournamentId, status = null) {
-    const params = status ? `?status=${status}` : '';
     return useQuery({
         queryKey: ['events', tournamentId, status],
-        queryFn: () => client.get(`/tournaments/${tournamentId}/events${params}`).then(r => r.data),
+        queryFn: () => fetchAllPages(`/tournaments/${tournamentId}/events`, {
+            status: status || undefined,
+        }),
         enabled: !!tournamentId,
     });
 }
@@ -35,11 +48,21 @@ export function useEvent(id) {
     });
 }
 
+// Event page: event, markets, trends and my open bets in one request
+export function useEventPage(id) {
+    return useQuery({
+        queryKey: ['event', id, 'page'],
+        queryFn: () => client.get(`/events/${id}/page`).then(r => r.data),
+        enabled: !!id,
+        refetchInterval: 30000, // Refresh trends every 30 seconds
+    });
+}
+
 // ─── Markets ─────────────────────────
 export function useEventMarkets(eventId) {
     return useQuery({
         queryKey: ['markets', 'event', eventId],
-        queryFn: () => client.get(`/events/${eventId}/markets`).then(r => r.data),
+        queryFn: () => fetchAllPages(`/events/${eventId}/markets`),
         enabled: !!eventId,
     });
 }
@@ -47,7 +70,7 @@ export function useEventMarkets(eventId) {
 export function useTournamentMarkets(tournamentId) {
     return useQuery({
         queryKey: ['markets', 'tournament', tournamentId],
-        queryFn: () => client.get(`/tournaments/${tournamentId}/markets`).then(r => r.data),
+        queryFn: () => fetchAllPages(`/tournaments/${tournamentId}/markets`),
         enabled: !!tournamentId,
     });
 }
@@ -55,7 +78,7 @@ export function useTournamentMarkets(tournamentId) {
 export function useAllTournamentMarkets(tournamentId) {
     return useQuery({
         queryKey: ['markets', 'admin', 'all', tournamentId],
-        queryFn: () => client.get(`/admin/tournaments/${tournamentId}/all-markets`).then(r => r.data),
+        queryFn: () => fetchAllPages(`/admin/tournaments/${tournamentId}/all-markets`),
         enabled: !!tournamentId,
     });
 }
@@ -68,21 +91,24 @@ export function useMarket(id) {
     });
 }
 
-export function useMarketTrends(marketId) {
+export function useMarketTrends(marketId, enabled = true) {
     return useQuery({
         queryKey: ['market', marketId, 'trends'],
         queryFn: () => client.get(`/markets/${marketId}/trends`).then(r => r.data),
-        enabled: !!marketId,
+        enabled: !!marketId && enabled,
         refetchInterval: 30000, // Refresh every 30 seconds
     });
 }
 
 // ─── Bets ─────────────────────────
 export function useMyBets(status) {
-    const params = status ? `?status=${status}` : '';
-    return useQuery({
+    return useInfiniteQuery({
         queryKey: ['bets', 'me', status],
-        queryFn: () => client.get(`/bets/me${params}`).then(r => r.data),
+        queryFn: ({ pageParam }) => client.get('/bets/me', {
+            params: { status: status || undefined, cursor: pageParam || undefined },
+        }).then(r => r.data),
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor,
     });
 }
 
@@ -92,6 +118,7 @@ export function usePlaceBet() {
         mutationFn: (betData) => client.post('/bets', betData).then(r => r.data),
         onSuccess: () => {
             qc.invalidateQueries({ queryKey: ['bets'] });
+            qc.invalidateQueries({ queryKey: ['event'] });
             qc.invalidateQueries({ queryKey: ['leaderboard'] });
         },
     });
@@ -240,10 +267,21 @@ export function useSeasonInfo(tournamentId) {
 }
 
 // ─── Admin: Users ─────────────────────────
-export function useUsers() {
+export function useUserTotals() {
     return useQuery({
-        queryKey: ['admin', 'users'],
-        queryFn: () => client.get('/admin/users').then(r => r.data),
+        queryKey: ['admin', 'users', 'totals'],
+        queryFn: () => client.get('/admin/users/totals').then(r => r.data),
+    });
+}
+
+export function useUserSearch(search = '') {
+    return useInfiniteQuery({
+        queryKey: ['admin', 'users', 'search', search],
+        queryFn: ({ pageParam }) => client.get('/admin/users', {
+            params: { q: search || undefined, cursor: pageParam || undefined },
+        }).then(r => r.data),
+        initialPageParam: null,
+        getNextPageParam: (lastPage) => lastPage.next_cursor,
     });
 }
 
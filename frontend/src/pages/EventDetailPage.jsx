@@ -1,15 +1,18 @@
 import { useParams } from 'react-router-dom';
-import { useEvent, useEventMarkets } from '../hooks/useApi';
+import { useEventPage } from '../hooks/useApi';
 import MarketCard from '../components/MarketCard';
-import { Calendar, MapPin } from 'lucide-react';
+import { Calendar, MapPin, Ticket, Coins } from 'lucide-react';
 import { formatDateTime } from '../utils/formatDate';
 
 export default function EventDetailPage() {
     const { id } = useParams();
-    const { data: event, isLoading: loadingE } = useEvent(id);
-    const { data: markets, isLoading: loadingM } = useEventMarkets(id);
+    // One request for the event, its markets, their trends and my open bets
+    const { data: page, isLoading } = useEventPage(id);
+    const event = page?.event;
+    const markets = page?.markets;
+    const trendsByMarket = Object.fromEntries((page?.trends ?? []).map((t) => [t.market_id, t]));
 
-    if (loadingE) {
+    if (isLoading) {
         return (
             <div className="space-y-4 animate-pulse">
                 <div className="h-8 bg-dark-700 rounded w-1/2" />
@@ -47,21 +50,35 @@ export default function EventDetailPage() {
                 )}
             </div>
 
-            {/* Markets */}
-            {loadingM ? (
-                <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
-                    {Array.from({ length: 3 }).map((_, i) => (
-                        <div key={i} className="glass-card p-6 animate-pulse">
-                            <div className="h-5 bg-dark-700 rounded w-3/4 mb-4" />
-                            <div className="grid grid-cols-3 gap-2">
-                                <div className="h-12 bg-dark-700 rounded-xl" />
-                                <div className="h-12 bg-dark-700 rounded-xl" />
-                                <div className="h-12 bg-dark-700 rounded-xl" />
+            {/* My open bets on this event */}
+            {page.my_open_bets.length > 0 && (
+                <div className="glass-card p-5 space-y-3">
+                    <h2 className="text-sm font-semibold text-white flex items-center gap-2">
+                        <Ticket className="w-4 h-4 text-accent-400" />
+                        Your open bets
+                    </h2>
+                    {page.my_open_bets.map((bet) => (
+                        <div key={bet.id} className="flex items-center justify-between gap-3 text-sm">
+                            <div className="min-w-0">
+                                <p className="text-white truncate">{bet.selection_label}</p>
+                                <p className="text-dark-400 text-xs truncate">{bet.market_question}</p>
+                            </div>
+                            <div className="text-right shrink-0">
+                                <div className="flex items-center gap-1 justify-end">
+                                    <Coins className="w-3.5 h-3.5 text-gold-400" />
+                                    <span className="font-semibold text-white">{bet.stake}</span>
+                                </div>
+                                <div className="text-xs text-dark-400">
+                                    @ {parseFloat(bet.odds).toFixed(2)} → {bet.potential_payout}
+                                </div>
                             </div>
                         </div>
                     ))}
                 </div>
-            ) : markets?.length === 0 ? (
+            )}
+
+            {/* Markets */}
+            {markets.length === 0 ? (
                 <div className="glass-card p-12 text-center">
                     <p className="text-dark-400 text-lg">No markets for this event yet</p>
                     <p className="text-dark-500 text-sm mt-1">Check back when the admin opens betting.</p>
@@ -69,7 +86,7 @@ export default function EventDetailPage() {
             ) : (
                 <div className="grid grid-cols-1 lg:grid-cols-2 gap-4">
                     {markets.map((m) => (
-                        <MarketCard key={m.id} market={m} />
+                        <MarketCard key={m.id} market={m} trends={trendsByMarket[m.id]} />
                     ))}
                 </div>
             )}
@@ -1,6 +1,6 @@
 import { useState } from 'react';
 import { useMyBets } from '../hooks/useApi';
-import { Ticket, Coins, CheckCircle, XCircle, Clock, Ban } from 'lucide-react';
+import { Ticket, Coins, CheckCircle, XCircle, Clock, Ban, Loader2 } from 'lucide-react';
 import { formatDateTime } from '../utils/formatDate';
 
 const TABS = [
@@ -13,7 +13,8 @@ const TABS = [
 
 export default function MyBetsPage() {
     const [activeTab, setActiveTab] = useState('');
-    const { data: bets, isLoading } = useMyBets(activeTab || undefined);
+    const { data, isLoading, fetchNextPage, hasNextPage, isFetchingNextPage } = useMyBets(activeTab || undefined);
+    const bets = data?.pages.flatMap((p) => p.items);
 
     const statusIcon = {
         open: <Clock className="w-4 h-4 text-blue-400" />,
@@ -114,6 +115,16 @@ export default function MyBetsPage() {
                             </div>
                         </div>
                     ))}
+                    {hasNextPage && (
+                        <button
+                            onClick={() => fetchNextPage()}
+                            disabled={isFetchingNextPage}
+                            className="btn-secondary w-full flex items-center justify-center gap-2 text-sm"
+                        >
+                            {isFetchingNextPage && <Loader2 className="w-4 h-4 animate-spin" />}
+                            Load more
+                        </button>
+                    )}
                 </div>
             )}
         </div>
@@ -1,14 +1,14 @@
-import { useUsers } from '../../hooks/useApi';
+import { useUserTotals } from '../../hooks/useApi';
 import { useAuth } from '../../hooks/useAuth';
 import { LayoutDashboard, Users, Coins, TrendingUp } from 'lucide-react';
 
 export default function AdminDashboardPage() {
     const { user } = useAuth();
-    const { data: users, isLoading } = useUsers();
+    const { data: totals, isLoading } = useUserTotals();
 
-    const totalUsers = users?.length || 0;
-    const totalCoins = users?.reduce((sum, u) => sum + (u.balance || 0), 0) || 0;
-    const activeUsers = users?.filter(u => u.is_active)?.length || 0;
+    const totalUsers = totals?.total_users || 0;
+    const totalCoins = totals?.total_balance || 0;
+    const activeUsers = totals?.active_users || 0;
 
     return (
         <div className="space-y-6 animate-fade-in">
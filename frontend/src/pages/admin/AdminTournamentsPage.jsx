@@ -43,7 +43,7 @@ export default function AdminTournamentsPage() {
     const handleSyncComps = async () => {
         try {
             const data = await syncComps.mutateAsync();
-            toast.success(`Synced! Created: ${data.created}, Updated: ${data.updated}`);
+            toast.success(`Synced! Created: ${data.created}, Updated: ${data.updated}, Unchanged: ${data.unchanged}`);
         } catch (err) {
             toast.error(err.response?.data?.detail || 'Sync failed');
         }
@@ -136,7 +136,7 @@ function TournamentRow({ tournament, onRefetch }) {
         try {
             const fn = type === 'teams' ? syncTeams : syncFixtures;
             const data = await fn.mutateAsync();
-            toast.success(`${type}: Created ${data.created}, Updated ${data.updated}`);
+            toast.success(`${type}: Created ${data.created}, Updated ${data.updated}, Unchanged ${data.unchanged}`);
         } catch (err) {
             toast.error(err.response?.data?.detail || `${type} sync failed`);
         }
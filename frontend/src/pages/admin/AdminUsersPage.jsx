@@ -1,11 +1,13 @@
 import { useState } from 'react';
-import { useUsers } from '../../hooks/useApi';
+import { useUserSearch } from '../../hooks/useApi';
 import client from '../../api/client';
-import { Users, Coins, Shield, Loader2, UserCheck, UserX, UserPlus, Eye, EyeOff } from 'lucide-react';
+import { Users, Coins, Shield, Loader2, UserCheck, UserX, UserPlus, Eye, EyeOff, Search } from 'lucide-react';
 import toast from 'react-hot-toast';
 
 export default function AdminUsersPage() {
-    const { data: users, isLoading, refetch } = useUsers();
+    const [search, setSearch] = useState('');
+    const { data, isLoading, refetch, fetchNextPage, hasNextPage, isFetchingNextPage } = useUserSearch(search.trim());
+    const users = data?.pages.flatMap((p) => p.items);
     const [showCreate, setShowCreate] = useState(false);
 
     return (
@@ -29,6 +31,16 @@ export default function AdminUsersPage() {
                 />
             )}
 
+            <div className="relative">
+                <Search className="absolute left-3 top-1/2 -translate-y-1/2 w-4 h-4 text-dark-400" />
+                <input
+                    value={search}
+                    onChange={(e) => setSearch(e.target.value)}
+                    placeholder="Search by username or email"
+                    className="w-full pl-10 pr-4 py-2.5 rounded-xl bg-dark-700/60 border border-dark-500/40 text-white focus:outline-none focus:border-accent-500/50 transition-colors"
+                />
+            </div>
+
             {isLoading ? (
                 <div className="space-y-3">
                     {Array.from({ length: 5 }).map((_, i) => (
@@ -43,6 +55,16 @@ export default function AdminUsersPage() {
                     {users?.map((u) => (
                         <UserRow key={u.id} userItem={u} onRefetch={refetch} />
                     ))}
+                    {hasNextPage && (
+                        <button
+                            onClick={() => fetchNextPage()}
+                            disabled={isFetchingNextPage}
+                            className="btn-secondary w-full flex items-center justify-center gap-2 text-sm"
+                        >
+                            {isFetchingNextPage && <Loader2 className="w-4 h-4 animate-spin" />}
+                            Load more
+                        </button>
+                    )}
                 </div>
             )}
         </div>